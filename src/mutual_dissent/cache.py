@@ -0,0 +1,239 @@
+"""Response cache for repeated completion requests.
+
+Caches serialized ``ModelResponse`` dicts keyed by a SHA-256 digest of the
+canonicalized request, so ``ProviderRouter.complete()`` can short-circuit
+the network call when an identical request was already served.
+
+Caching is opt-in (``[cache] backend`` in config.toml).  Requests are sent
+without a pinned temperature, so provider output is not deterministic —
+a cache hit replays an earlier answer rather than reproducing one.  That is
+useful during development and for repeated evaluation runs, but it is not
+appropriate for every experiment.
+
+Backends implement the ``CacheBackend`` protocol:
+
+- ``MemoryCache`` — in-process LRU, lives for the router's lifetime.
+- ``FileCache`` — one JSON file per key under ``~/.mutual-dissent/cache/``,
+  persists across sessions and evicts least recently used files.
+
+Typical usage::
+
+    from mutual_dissent.cache import MemoryCache, request_key
+
+    cache = MemoryCache(max_entries=256)
+    key = request_key("claude-sonnet-4-6", "anthropic", None, "Hello")
+    await cache.set(key, response.to_dict())
+    hit = await cache.get(key)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Protocol
+
+from mutual_dissent.config import CACHE_DIR, Config
+
+DEFAULT_MAX_ENTRIES = 256
+
+
+class CacheBackend(Protocol):
+    """Storage interface for cached responses.
+
+    Values are JSON-compatible dicts as produced by
+    ``ModelResponse.to_dict()``.
+    """
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached value for *key*, or ``None`` on a miss."""
+        ...
+
+    async def set(self, key: str, value: dict[str, Any]) -> None:
+        """Store *value* under *key*."""
+        ...
+
+
+class MemoryCache:
+    """In-process LRU cache.
+
+    Values are deep-copied on the way in and out, so a caller mutating a
+    response (e.g. adding scores to ``analysis``) cannot alter the cached
+    entry or any later hit.
+
+    Args:
+        max_entries: Maximum number of cached responses.  The least
+            recently used entry is evicted when the limit is exceeded.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached value for *key*, marking it recently used.
+
+        Args:
+            key: Request digest from ``request_key()``.
+
+        Returns:
+            The cached response dict, or ``None`` on a miss.
+        """
+        value = self._entries.get(key)
+        if value is None:
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    async def set(self, key: str, value: dict[str, Any]) -> None:
+        """Store *value* under *key*, evicting the oldest entry if full.
+
+        Args:
+            key: Request digest from ``request_key()``.
+            value: Serialized response dict.
+        """
+        self._entries[key] = copy.deepcopy(value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class FileCache:
+    """On-disk LRU cache storing one JSON file per key.
+
+    File I/O runs in a worker thread so the event loop is not blocked.
+    A hit refreshes the file's modification time; once more than
+    *max_entries* files exist, the least recently used are deleted.
+
+    Args:
+        directory: Directory for cache files.  Created on first write.
+        max_entries: Maximum number of cached responses kept on disk.
+    """
+
+    def __init__(
+        self,
+        directory: Path = CACHE_DIR,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self._directory = directory
+        self._max_entries = max_entries
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Read the cached value for *key* from disk.
+
+        Unreadable or corrupt entries are treated as misses.
+
+        Args:
+            key: Request digest from ``request_key()``.
+
+        Returns:
+            The cached response dict, or ``None`` on a miss.
+        """
+        return await asyncio.to_thread(self._read, self._directory / f"{key}.json")
+
+    async def set(self, key: str, value: dict[str, Any]) -> None:
+        """Write *value* to disk under *key*.
+
+        Args:
+            key: Request digest from ``request_key()``.
+            value: Serialized response dict.
+        """
+        await asyncio.to_thread(self._write, key, value)
+
+    @staticmethod
+    def _read(path: Path) -> dict[str, Any] | None:
+        """Load one entry and mark it recently used (runs in a thread)."""
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)
+        except (OSError, json.JSONDecodeError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _write(self, key: str, value: dict[str, Any]) -> None:
+        """Write one entry, then evict beyond *max_entries* (runs in a thread)."""
+        self._directory.mkdir(parents=True, exist_ok=True)
+        path = self._directory / f"{key}.json"
+        path.write_text(json.dumps(value, ensure_ascii=False), encoding="utf-8")
+
+        entries: list[tuple[float, Path]] = []
+        for entry in self._directory.glob("*.json"):
+            try:
+                entries.append((entry.stat().st_mtime, entry))
+            except OSError:
+                continue
+        excess = len(entries) - self._max_entries
+        if excess <= 0:
+            return
+        entries.sort()
+        for _, stale in entries[:excess]:
+            if stale != path:
+                stale.unlink(missing_ok=True)
+
+
+def request_key(
+    model_id: str,
+    route: str,
+    messages: list[dict[str, Any]] | None,
+    prompt: str | None,
+    params: dict[str, Any] | None = None,
+) -> str:
+    """Compute the cache key for a completion request.
+
+    The key covers what the provider actually receives, not the alias
+    the caller used, so remapping an alias or changing generation
+    settings never replays another model's answer.
+
+    Args:
+        model_id: Resolved provider-specific model ID.
+        route: Provider the request is sent through (``"openrouter"``
+            or a direct vendor value).
+        messages: Chat messages, or ``None``.
+        prompt: Single user message string, or ``None``.
+        params: Generation parameters sent with the request, such as
+            ``max_tokens``.
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON encoding of the request.
+    """
+    canonical = json.dumps(
+        {
+            "model": model_id,
+            "route": route,
+            "messages": messages,
+            "prompt": prompt,
+            "params": params or {},
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def make_cache(config: Config) -> CacheBackend | None:
+    """Build the cache backend selected in config.
+
+    Args:
+        config: Application configuration.
+
+    Returns:
+        A ``CacheBackend`` instance, or ``None`` when caching is off.
+
+    Raises:
+        ValueError: If ``config.cache_backend`` is not a known backend.
+    """
+    backend = config.cache_backend
+    if backend == "off":
+        return None
+    if backend == "memory":
+        return MemoryCache(max_entries=config.cache_max_entries)
+    if backend == "file":
+        return FileCache(max_entries=config.cache_max_entries)
+    raise ValueError(f"Unknown cache backend '{backend}'. Expected 'off', 'memory', or 'file'.")
@@ -8,32 +8,30 @@ Typical usage::
     mutual-dissent ask "What is MCP security?"
     mutual-dissent ask "Compare REST vs GraphQL" --verbose --rounds 2
     mutual-dissent replay abcd1234 --synthesizer gpt --rounds 1
+
+Heavy dependencies (the orchestrator and provider stack, ``httpx``,
+``asyncio``, Rich markdown rendering) are imported inside the commands
+that use them, so ``--help``, ``--version``, and the lightweight
+subcommands start without loading them.
 """
 
 from __future__ import annotations
 
-import asyncio
 import json
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 from rich.console import Console
 
 from mutual_dissent import __version__
-from mutual_dissent.config import CONFIG_PATH, Config, load_config
-from mutual_dissent.display import (
-    format_markdown,
-    render_config_show,
-    render_config_test,
-    render_debate,
-    render_transcript_list,
-)
-from mutual_dissent.models import DebateTranscript, ModelResponse
-from mutual_dissent.orchestrator import run_debate, run_replay
-from mutual_dissent.providers.router import ProviderRouter
-from mutual_dissent.transcript import list_transcripts, load_transcript, save_transcript
-from mutual_dissent.types import RoutingDecision
+from mutual_dissent.config import CONFIG_PATH, load_config
+
+if TYPE_CHECKING:
+    from mutual_dissent.config import Config
+    from mutual_dissent.models import DebateTranscript, ModelResponse
+    from mutual_dissent.types import RoutingDecision
 
 console = Console(stderr=True)
 
@@ -64,10 +62,12 @@ def _check_for_update(package_name: str) -> None:
         package_name: PyPI package name (e.g. "mutual-dissent").
     """
     import threading
-    from importlib.metadata import version
-    from urllib.request import urlopen
 
     def _check() -> None:
+        # Imported here so the cost lands on the background thread.
+        from importlib.metadata import version
+        from urllib.request import urlopen
+
         try:
             current = version(package_name)
             url = f"https://pypi.org/pypi/{package_name}/json"
@@ -128,6 +128,8 @@ def _emit_output(
         output_file: Path to write output to, or None for stdout.
         verbose: If True, include all round responses in output.
     """
+    from mutual_dissent.display import format_markdown, render_debate
+
     # Terminal without --file: render Rich panels directly and return.
     if output == "terminal" and output_file is None:
         render_debate(transcript, verbose=verbose)
@@ -254,6 +256,11 @@ def ask(
         ground_truth: Inline reference answer for scoring.
         ground_truth_file: Path to file containing reference answer.
     """
+    import asyncio
+
+    from mutual_dissent.orchestrator import run_debate
+    from mutual_dissent.transcript import save_transcript
+
     config = load_config()
 
     # Validate that at least one provider key is configured.
@@ -311,6 +318,9 @@ def list_cmd(limit: int) -> None:
     Args:
         limit: Maximum number of transcripts to list.
     """
+    from mutual_dissent.display import render_transcript_list
+    from mutual_dissent.transcript import list_transcripts
+
     transcripts = list_transcripts(limit=limit)
     render_transcript_list(transcripts)
 
@@ -349,6 +359,8 @@ def show(transcript_id: str, verbose: bool, output: str, output_file: str | None
         output: Output format choice.
         output_file: Path to write output to.
     """
+    from mutual_dissent.transcript import load_transcript
+
     if len(transcript_id) < 4:
         console.print("[red bold]Error:[/red bold] Transcript ID must be at least 4 characters.")
         sys.exit(1)
@@ -449,6 +461,11 @@ def replay(
         ground_truth: Inline reference answer for scoring.
         ground_truth_file: Path to file containing reference answer.
     """
+    import asyncio
+
+    from mutual_dissent.orchestrator import run_replay
+    from mutual_dissent.transcript import load_transcript, save_transcript
+
     # Validate transcript ID length (cheap check first).
     if len(transcript_id) < 4:
         console.print("[red bold]Error:[/red bold] Transcript ID must be at least 4 characters.")
@@ -544,10 +561,14 @@ def path() -> None:
 )
 def config_show(check_models: bool) -> None:
     """Display effective configuration."""
+    from mutual_dissent.display import render_config_show
+
     cfg = load_config()
 
     context_lengths: dict[str, int] | None = None
     if check_models:
+        import asyncio
+
         from mutual_dissent.pricing import PricingCache
 
         cache = PricingCache(alias_map=cfg._model_aliases_v2)
@@ -584,6 +605,8 @@ async def _run_config_test(
     Returns:
         List of result dicts with ``alias``, ``decision``, and ``response``.
     """
+    from mutual_dissent.providers.router import ProviderRouter
+
     async with ProviderRouter(cfg) as router:
         decisions = {alias: router.route(alias) for alias in aliases}
 
@@ -606,6 +629,10 @@ def test() -> None:
     synthesizer.  Reports routing decisions, provider used, latency,
     and errors.
     """
+    import asyncio
+
+    from mutual_dissent.display import render_config_test
+
     cfg = load_config()
 
     # Validate that at least one provider key is configured.
@@ -29,6 +29,7 @@ from typing import Any
 APP_DIR = Path.home() / ".mutual-dissent"
 CONFIG_PATH = APP_DIR / "config.toml"
 TRANSCRIPT_DIR = APP_DIR / "transcripts"
+CACHE_DIR = APP_DIR / "cache"
 
 # Default model aliases → OpenRouter model IDs.
 # Verified against OpenRouter offerings as of 2026-03-06.
@@ -63,6 +64,19 @@ DEFAULT_SYNTHESIZER = "claude"
 DEFAULT_ROUNDS = 1
 MAX_ROUNDS = 3
 
+# Response cache backends: "off" (default), "memory", or "file".
+DEFAULT_CACHE_BACKEND = "off"
+DEFAULT_CACHE_MAX_ENTRIES = 256
+
+# Maximum number of provider requests in flight at once across all vendors.
+DEFAULT_MAX_CONCURRENCY = 10
+
+# Message Batches routing: same-provider groups of at least this many
+# requests in one complete_parallel() call are sent as a single batch.
+# 0 disables batching (batches trade minutes of latency for cost).
+DEFAULT_BATCH_THRESHOLD = 0
+DEFAULT_BATCH_MAX_WAIT = 3600.0  # seconds
+
 # Env var name → provider key in the providers dict.
 _ENV_VAR_MAP: dict[str, str] = {
     "OPENROUTER_API_KEY": "openrouter",
@@ -94,6 +108,15 @@ class Config:
         default_panel: Default list of model aliases for the debate panel.
         default_synthesizer: Default model alias for synthesis.
         default_rounds: Default number of reflection rounds.
+        cache_backend: Response cache backend — "off", "memory", or "file".
+        cache_max_entries: Maximum entries held by the memory or file cache.
+        max_concurrency: Maximum provider requests in flight at once.
+        rate_limits: Per-provider requests-per-minute caps, keyed by
+            provider name (e.g. {"anthropic": 50, "openrouter": 200}).
+            Providers without an entry are not rate limited.
+        batch_threshold: Minimum same-provider group size in one parallel
+            fan-out to route through a batch API. 0 disables batching.
+        batch_max_wait: Maximum seconds to wait for a batch to finish.
     """
 
     api_key: str = ""
@@ -107,6 +130,12 @@ class Config:
     default_panel: list[str] = field(default_factory=lambda: list(DEFAULT_PANEL))
     default_synthesizer: str = DEFAULT_SYNTHESIZER
     default_rounds: int = DEFAULT_ROUNDS
+    cache_backend: str = DEFAULT_CACHE_BACKEND
+    cache_max_entries: int = DEFAULT_CACHE_MAX_ENTRIES
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    rate_limits: dict[str, int] = field(default_factory=dict)
+    batch_threshold: int = DEFAULT_BATCH_THRESHOLD
+    batch_max_wait: float = DEFAULT_BATCH_MAX_WAIT
 
     def resolve_model(self, alias_or_id: str, *, direct: bool = False) -> str:
         """Resolve a model alias to a model ID.
@@ -262,6 +291,57 @@ def _apply_toml(config: Config, data: dict[str, Any]) -> None:
         if "rounds" in defaults:
             config.default_rounds = min(int(defaults["rounds"]), MAX_ROUNDS)
 
+    # --- Cache ---
+    if "cache" in data:
+        _apply_cache(config, data["cache"])
+
+    # --- Limits ---
+    if "limits" in data:
+        _apply_limits(config, data["limits"])
+
+    # --- Batch ---
+    if "batch" in data:
+        _apply_batch(config, data["batch"])
+
+
+def _apply_cache(config: Config, cache: dict[str, Any]) -> None:
+    """Apply the ``[cache]`` TOML table to a Config instance.
+
+    Args:
+        config: Config instance to populate.
+        cache: Parsed ``[cache]`` table.
+    """
+    if "backend" in cache:
+        config.cache_backend = str(cache["backend"])
+    if "max_entries" in cache:
+        config.cache_max_entries = int(cache["max_entries"])
+
+
+def _apply_limits(config: Config, limits: dict[str, Any]) -> None:
+    """Apply the ``[limits]`` TOML table to a Config instance.
+
+    Args:
+        config: Config instance to populate.
+        limits: Parsed ``[limits]`` table.
+    """
+    if "max_concurrency" in limits:
+        config.max_concurrency = max(int(limits["max_concurrency"]), 1)
+    if "requests_per_minute" in limits:
+        config.rate_limits = {name: int(rpm) for name, rpm in limits["requests_per_minute"].items()}
+
+
+def _apply_batch(config: Config, batch: dict[str, Any]) -> None:
+    """Apply the ``[batch]`` TOML table to a Config instance.
+
+    Args:
+        config: Config instance to populate.
+        batch: Parsed ``[batch]`` table.
+    """
+    if "threshold" in batch:
+        config.batch_threshold = max(int(batch["threshold"]), 0)
+    if "max_wait" in batch:
+        config.batch_max_wait = float(batch["max_wait"])
+
 
 def _apply_env_overrides(config: Config) -> None:
     """Apply environment variable overrides to provider keys.
@@ -378,6 +458,27 @@ def write_config(
     defaults_table.add("rounds", config.default_rounds)
     doc.add("defaults", defaults_table)
 
+    # --- Cache ---
+    cache_table = tomlkit.table()
+    cache_table.add("backend", config.cache_backend)
+    cache_table.add("max_entries", config.cache_max_entries)
+    doc.add("cache", cache_table)
+
+    # --- Limits ---
+    limits_table = tomlkit.table()
+    limits_table.add("max_concurrency", config.max_concurrency)
+    rpm_table = tomlkit.table()
+    for provider_name, rpm in sorted(config.rate_limits.items()):
+        rpm_table.add(provider_name, rpm)
+    limits_table.add("requests_per_minute", rpm_table)
+    doc.add("limits", limits_table)
+
+    # --- Batch ---
+    batch_table = tomlkit.table()
+    batch_table.add("threshold", config.batch_threshold)
+    batch_table.add("max_wait", config.batch_max_wait)
+    doc.add("batch", batch_table)
+
     # Write: parent dirs, then file.
     target.parent.mkdir(parents=True, exist_ok=True)
     target.write_text(tomlkit.dumps(doc), encoding="utf-8")
@@ -14,7 +14,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.table import Table
@@ -606,15 +606,9 @@ def render_config_show(
     """
     from mutual_dissent.config import _ENV_VAR_MAP, CONFIG_PATH
 
-    console.print()
-
-    # --- Config file path ---
     path_status = "exists" if CONFIG_PATH.exists() else "not found"
-    console.print(f"[bold]Config file:[/bold] {CONFIG_PATH} [dim]({path_status})[/dim]")
-    console.print()
 
     # --- Provider keys ---
-    console.print("[bold]Provider Keys[/bold]")
     key_table = Table(show_header=True, padding=(0, 1))
     key_table.add_column("Provider", style="bold")
     key_table.add_column("Key")
@@ -627,32 +621,22 @@ def render_config_show(
         source = _provider_source(provider, config.providers)
         key_table.add_row(provider, masked, source)
 
-    console.print(key_table)
-    console.print()
-
     # --- Routing ---
-    console.print("[bold]Routing[/bold]")
     route_table = Table(show_header=False, box=None, padding=(0, 2))
     route_table.add_column("key", style="dim")
     route_table.add_column("value")
     for rkey, rval in config.routing.items():
         route_table.add_row(rkey, rval)
-    console.print(route_table)
-    console.print()
 
     # --- Defaults ---
-    console.print("[bold]Defaults[/bold]")
     defaults_table = Table(show_header=False, box=None, padding=(0, 2))
     defaults_table.add_column("key", style="dim")
     defaults_table.add_column("value")
     defaults_table.add_row("panel", ", ".join(config.default_panel))
     defaults_table.add_row("synthesizer", config.default_synthesizer)
     defaults_table.add_row("rounds", str(config.default_rounds))
-    console.print(defaults_table)
-    console.print()
 
     # --- Model aliases ---
-    console.print("[bold]Model Aliases[/bold]")
     alias_table = Table(show_header=True, padding=(0, 1))
     alias_table.add_column("Alias", style="bold")
     alias_table.add_column("OpenRouter ID", style="dim")
@@ -669,8 +653,26 @@ def render_config_show(
             row.append(f"{ctx:,}" if ctx else "\u2014")
         alias_table.add_row(*row)
 
-    console.print(alias_table)
-    console.print()
+    # Emit all sections in one print so Rich lays the output out once.
+    console.print(
+        Group(
+            "",
+            f"[bold]Config file:[/bold] {CONFIG_PATH} [dim]({path_status})[/dim]",
+            "",
+            "[bold]Provider Keys[/bold]",
+            key_table,
+            "",
+            "[bold]Routing[/bold]",
+            route_table,
+            "",
+            "[bold]Defaults[/bold]",
+            defaults_table,
+            "",
+            "[bold]Model Aliases[/bold]",
+            alias_table,
+            "",
+        )
+    )
 
 
 def render_config_test(
@@ -719,6 +721,4 @@ def render_config_test(
 
         table.add_row(alias_str, vendor_str, route_str, model_id_str, latency_str, status_str)
 
-    console.print()
-    console.print(table)
-    console.print()
+    console.print(Group("", table, ""))
@@ -24,6 +24,24 @@ from datetime import UTC, datetime
 from typing import Any
 
 
+def parse_datetime(value: str | None) -> datetime:
+    """Parse an ISO 8601 timestamp string to a datetime.
+
+    Args:
+        value: ISO 8601 formatted timestamp string, or None.
+
+    Returns:
+        Parsed datetime object. Falls back to current UTC time if parsing
+        fails or the value is empty.
+    """
+    if not value:
+        return datetime.now(UTC)
+    try:
+        return datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        return datetime.now(UTC)
+
+
 @dataclass
 class ExperimentMetadata:
     """Metadata linking a debate to a research experiment.
@@ -83,6 +101,56 @@ class ExperimentMetadata:
 
 
 @dataclass
+class Timings:
+    """Phase breakdown of a response's wall time, in milliseconds.
+
+    Attributes:
+        queue_ms: Time spent waiting for a router concurrency or
+            rate-limit slot.  0 when the provider was called directly.
+        ttfb_ms: Request start to response headers, including any retry
+            waits.  None when the provider does not separate phases.
+        body_ms: Response headers to the fully read body.  None when the
+            provider does not separate phases.
+        total_ms: Queueing plus the provider call.
+    """
+
+    queue_ms: int = 0
+    ttfb_ms: int | None = None
+    body_ms: int | None = None
+    total_ms: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a JSON-compatible dictionary.
+
+        Returns:
+            Dictionary with all phase durations.
+        """
+        return {
+            "queue_ms": self.queue_ms,
+            "ttfb_ms": self.ttfb_ms,
+            "body_ms": self.body_ms,
+            "total_ms": self.total_ms,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Timings:
+        """Deserialize from a JSON-compatible dictionary.
+
+        Args:
+            data: Dictionary matching the ``to_dict()`` format.
+
+        Returns:
+            Timings instance.
+        """
+        return cls(
+            queue_ms=data.get("queue_ms", 0),
+            ttfb_ms=data.get("ttfb_ms"),
+            body_ms=data.get("body_ms"),
+            total_ms=data.get("total_ms", 0),
+        )
+
+
+@dataclass(slots=True)
 class ModelResponse:
     """Single response from one model in one round.
 
@@ -95,7 +163,14 @@ class ModelResponse:
         token_count: Total tokens used, if reported by API.
         input_tokens: Prompt/input tokens, if reported by API.
         output_tokens: Completion/output tokens, if reported by API.
+        cache_creation_input_tokens: Input tokens written to the provider's
+            prompt cache, if reported by API.
+        cache_read_input_tokens: Input tokens served from the provider's
+            prompt cache, if reported by API.
         latency_ms: Response time in milliseconds.
+        timings: Phase breakdown of the response time (queueing, time to
+            first byte, body read).  None when not measured, e.g. for
+            cached responses.
         error: Error message if the call failed, None on success.
         role: Debate role — "initial", "reflection", or "synthesis".
             Empty string when not set.
@@ -113,12 +188,56 @@ class ModelResponse:
     token_count: int | None = None
     input_tokens: int | None = None
     output_tokens: int | None = None
+    cache_creation_input_tokens: int | None = None
+    cache_read_input_tokens: int | None = None
     latency_ms: int | None = None
+    timings: Timings | None = None
     error: str | None = None
     role: str = ""
     routing: dict[str, Any] | None = None
     analysis: dict[str, Any] = field(default_factory=dict)
 
+    @classmethod
+    def error_for(
+        cls,
+        *,
+        model_id: str,
+        model_alias: str,
+        round_number: int,
+        error: str,
+        latency_ms: int | None = None,
+        timings: Timings | None = None,
+        routing: dict[str, Any] | None = None,
+    ) -> ModelResponse:
+        """Build the response returned when a call fails.
+
+        Providers and the router report failures as data rather than
+        raising, so every error path goes through here to keep the
+        shape consistent: empty content, no token counts, and *error* set.
+
+        Args:
+            model_id: Model identifier the request was sent to.
+            model_alias: Human-readable short name.
+            round_number: Debate round the request belonged to.
+            error: Error message describing the failure.
+            latency_ms: Time spent before the failure, if measured.
+            timings: Phase breakdown of *latency_ms*, if measured.
+            routing: Serialized RoutingDecision, if known.
+
+        Returns:
+            A ModelResponse with empty content and *error* set.
+        """
+        return cls(
+            model_id=model_id,
+            model_alias=model_alias,
+            round_number=round_number,
+            content="",
+            latency_ms=latency_ms,
+            timings=timings,
+            error=error,
+            routing=routing,
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """Serialize to a JSON-compatible dictionary.
 
@@ -134,13 +253,50 @@ class ModelResponse:
             "token_count": self.token_count,
             "input_tokens": self.input_tokens,
             "output_tokens": self.output_tokens,
+            "cache_creation_input_tokens": self.cache_creation_input_tokens,
+            "cache_read_input_tokens": self.cache_read_input_tokens,
             "latency_ms": self.latency_ms,
+            "timings": self.timings.to_dict() if self.timings else None,
             "error": self.error,
             "role": self.role,
             "routing": self.routing,
             "analysis": self.analysis,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ModelResponse:
+        """Deserialize from a JSON-compatible dictionary.
+
+        Handles missing optional fields gracefully for old transcripts
+        that predate newer additions.  An absent or unparsable timestamp
+        falls back to the current time.
+
+        Args:
+            data: Dictionary matching the ``to_dict()`` format.
+
+        Returns:
+            ModelResponse instance.
+        """
+        timings = data.get("timings")
+        return cls(
+            model_id=data["model_id"],
+            model_alias=data["model_alias"],
+            round_number=data["round_number"],
+            content=data["content"],
+            timestamp=parse_datetime(data.get("timestamp")),
+            token_count=data.get("token_count"),
+            input_tokens=data.get("input_tokens"),
+            output_tokens=data.get("output_tokens"),
+            cache_creation_input_tokens=data.get("cache_creation_input_tokens"),
+            cache_read_input_tokens=data.get("cache_read_input_tokens"),
+            latency_ms=data.get("latency_ms"),
+            timings=Timings.from_dict(timings) if timings else None,
+            error=data.get("error"),
+            role=data.get("role", ""),
+            routing=data.get("routing"),
+            analysis=data.get("analysis", {}),
+        )
+
 
 @dataclass
 class DebateRound:
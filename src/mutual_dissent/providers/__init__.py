@@ -4,13 +4,23 @@ Re-exports the public interface so callers can write::
 
     from mutual_dissent.providers import Provider, OpenRouterProvider
     from mutual_dissent.providers import AnthropicProvider, ProviderRouter
+
+The exports are resolved lazily (PEP 562), so importing this package, or
+a submodule such as ``mutual_dissent.providers.base``, does not pull in
+``httpx`` and the concrete providers until one of them is accessed.
 """
 
-from mutual_dissent.providers.anthropic import AnthropicProvider
-from mutual_dissent.providers.base import Provider
-from mutual_dissent.providers.openrouter import OpenRouterProvider
-from mutual_dissent.providers.router import ProviderRouter
-from mutual_dissent.types import RoutingDecision, Vendor
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from mutual_dissent.providers.anthropic import AnthropicProvider
+    from mutual_dissent.providers.base import Provider
+    from mutual_dissent.providers.openrouter import OpenRouterProvider
+    from mutual_dissent.providers.router import ProviderRouter
+    from mutual_dissent.types import RoutingDecision, Vendor
 
 __all__ = [
     "AnthropicProvider",
@@ -20,3 +30,37 @@ __all__ = [
     "RoutingDecision",
     "Vendor",
 ]
+
+# Exported name → module that defines it.
+_EXPORTS: dict[str, str] = {
+    "AnthropicProvider": "mutual_dissent.providers.anthropic",
+    "Provider": "mutual_dissent.providers.base",
+    "OpenRouterProvider": "mutual_dissent.providers.openrouter",
+    "ProviderRouter": "mutual_dissent.providers.router",
+    "RoutingDecision": "mutual_dissent.types",
+    "Vendor": "mutual_dissent.types",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported name on first access and cache it.
+
+    Args:
+        name: Attribute being looked up on the package.
+
+    Returns:
+        The exported object.
+
+    Raises:
+        AttributeError: If *name* is not a package export.
+    """
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -10,6 +10,15 @@ Key differences from OpenRouter:
 - ``max_tokens`` is required in every request payload.
 - System messages must be hoisted to a top-level ``system`` field.
 - Response content is an array of typed blocks, not a plain string.
+- Rate-limit (429) and overload (503/529) responses are retried with
+  exponential backoff, honoring ``retry-after`` when present.
+- ``complete_batch()`` submits many requests through the Message Batches
+  API (half-price, provider-side scheduling) for throughput-bound jobs.
+- Stable prompt prefixes are marked with ``cache_control`` so repeated
+  debate context is served from Anthropic's prompt cache.
+- ``complete()`` streams the response over server-sent events and
+  assembles text blocks as deltas arrive, instead of buffering the whole
+  body before parsing.
 
 Typical usage::
 
@@ -27,30 +36,73 @@ Typical usage::
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import time
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import httpx
+import orjson
 
-from mutual_dissent.models import ModelResponse
+from mutual_dissent.models import ModelResponse, Timings
 from mutual_dissent.providers.base import Provider
+from mutual_dissent.providers.ratelimit import AsyncRateLimiter
 
 ANTHROPIC_API_URL = "https://api.anthropic.com/v1/messages"
+ANTHROPIC_BATCHES_URL = "https://api.anthropic.com/v1/messages/batches"
 ANTHROPIC_VERSION = "2023-06-01"
 DEFAULT_MAX_TOKENS = 4096
 DEFAULT_TIMEOUT = 120.0  # seconds — generous for slow responses
 
+# Retry policy for rate-limited / overloaded responses.
+RETRY_STATUS_CODES = frozenset({429, 503, 529})
+DEFAULT_MAX_RETRIES = 3
+RETRY_BASE_DELAY = 1.0  # seconds — doubled on each attempt
+RETRY_MAX_DELAY = 30.0  # seconds — cap for both backoff and retry-after
+
+# Message Batches polling.  Batches usually finish within minutes but may
+# take up to 24h; callers bound the wait with ``batch_max_wait``.
+BATCH_POLL_INITIAL = 2.0  # seconds — doubled on each poll
+BATCH_POLL_MAX = 60.0  # seconds
+DEFAULT_BATCH_MAX_WAIT = 3600.0  # seconds
+
+# Rough chars-per-token ratio used to decide when a system prompt is long
+# enough (~1024 tokens, Anthropic's minimum cacheable prefix) to cache on
+# its own, even in the initial round.
+_CHARS_PER_TOKEN = 4
+CACHE_MIN_SYSTEM_TOKENS = 1024
+
+# Connection pool limits.  Parallel panel requests share a single HTTP/2
+# connection where the server supports it, so keepalive slots matter more
+# than the total cap.
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0,
+)
+
 
 class AnthropicProvider(Provider):
     """Async provider for the Anthropic Messages API.
 
-    Uses ``httpx.AsyncClient`` for connection pooling and async I/O.
-    Designed to be used as an async context manager.
+    Uses ``httpx.AsyncClient`` with HTTP/2 enabled so concurrent requests
+    are multiplexed over one connection.  Designed to be used as an async
+    context manager.
 
     Args:
         api_key: Anthropic API key.
         max_tokens: Maximum tokens per response.  Defaults to 4096.
         timeout: Request timeout in seconds.  Defaults to 120s.
+        max_retries: Retries for 429/503/529 responses.  Defaults to 3.
+        transport: Optional transport to send requests through, e.g. one
+            shared by several providers.  When given, it owns connection
+            pooling and HTTP/2 negotiation.  Closing the provider closes
+            the transport, so a shared one should ignore ``aclose()``.
+        rate_limiter: Optional requests-per-minute budget to take a slot
+            from before each retry.  The first attempt is the caller's to
+            throttle (``ProviderRouter`` does); retries are sent here, so
+            without this they would not count against the budget.
 
     Example::
 
@@ -67,23 +119,40 @@ class AnthropicProvider(Provider):
         *,
         max_tokens: int = DEFAULT_MAX_TOKENS,
         timeout: float = DEFAULT_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        transport: httpx.AsyncBaseTransport | None = None,
+        rate_limiter: AsyncRateLimiter | None = None,
     ) -> None:
         if not api_key:
             raise ValueError("Anthropic API key is required. Set ANTHROPIC_API_KEY env var.")
         self._api_key = api_key
         self._max_tokens = max_tokens
         self._timeout = timeout
+        self._max_retries = max_retries
+        self._transport = transport
+        self._rate_limiter = rate_limiter
+        # Built once; every client opened by this provider reuses them.
+        self._timeout_config = httpx.Timeout(timeout)
+        self._headers = {
+            "x-api-key": api_key,
+            "anthropic-version": ANTHROPIC_VERSION,
+            "content-type": "application/json",
+        }
+        # Fields shared by every request body; per-request fields are merged in.
+        self._payload_base: dict[str, Any] = {"model": None, "max_tokens": max_tokens}
         self._client: httpx.AsyncClient | None = None
+        self._http_version_logged = False
+        self._logger = logging.getLogger(__name__)
 
     async def __aenter__(self) -> AnthropicProvider:
         """Open the underlying HTTP connection pool."""
+        self._http_version_logged = False
         self._client = httpx.AsyncClient(
-            timeout=httpx.Timeout(self._timeout),
-            headers={
-                "x-api-key": self._api_key,
-                "anthropic-version": ANTHROPIC_VERSION,
-                "content-type": "application/json",
-            },
+            http2=True,
+            timeout=self._timeout_config,
+            limits=DEFAULT_LIMITS,
+            transport=self._transport,
+            headers=self._headers,
         )
         return self
 
@@ -93,6 +162,11 @@ class AnthropicProvider(Provider):
             await self._client.aclose()
             self._client = None
 
+    @property
+    def generation_params(self) -> dict[str, Any]:
+        """Generation settings sent with every request (``max_tokens``)."""
+        return {"max_tokens": self._max_tokens}
+
     async def complete(
         self,
         model_id: str,
@@ -109,7 +183,15 @@ class AnthropicProvider(Provider):
 
         System-role messages in the ``messages`` list are automatically
         extracted and hoisted to the top-level ``system`` field, as
-        required by the Anthropic API.
+        required by the Anthropic API.  Stable prefixes (the system prompt
+        and the latest prior user turn) are marked for prompt caching; see
+        ``_apply_cache_control()``.  Marking applies only to ``messages``
+        requests: a ``prompt`` request — the shape the orchestrator uses
+        for every debate round — is one fresh user turn with no reusable
+        prefix, so it is sent unmarked.
+
+        The response is streamed and reassembled into the same message
+        shape a non-streaming request returns; see ``_MessageStream``.
 
         Args:
             model_id: Anthropic model identifier (e.g. "claude-sonnet-4-6").
@@ -131,69 +213,620 @@ class AnthropicProvider(Provider):
 
         resolved = self._resolve_messages(messages, prompt)
         alias = model_alias or model_id
-        start = time.monotonic()
-
-        system_text, chat_messages = _extract_system(resolved)
 
-        payload: dict[str, Any] = {
-            "model": model_id,
-            "max_tokens": self._max_tokens,
-            "messages": chat_messages,
-        }
-        if system_text is not None:
-            payload["system"] = system_text
+        payload = self._build_payload(
+            model_id, resolved, round_number, prompt_only=messages is None
+        )
+        payload["stream"] = True
 
+        start = time.monotonic()
         try:
-            resp = await self._client.post(ANTHROPIC_API_URL, json=payload)
+            resp, message, headers_at = await self._stream_message(self._client, payload, alias)
         except httpx.TimeoutException:
             elapsed_ms = int((time.monotonic() - start) * 1000)
-            return ModelResponse(
+            return ModelResponse.error_for(
                 model_id=model_id,
                 model_alias=alias,
                 round_number=round_number,
-                content="",
                 latency_ms=elapsed_ms,
+                timings=Timings(total_ms=elapsed_ms),
                 error=f"Request timed out after {self._timeout}s",
             )
         except httpx.HTTPError as exc:
             elapsed_ms = int((time.monotonic() - start) * 1000)
-            return ModelResponse(
+            return ModelResponse.error_for(
                 model_id=model_id,
                 model_alias=alias,
                 round_number=round_number,
-                content="",
                 latency_ms=elapsed_ms,
+                timings=Timings(total_ms=elapsed_ms),
                 error=f"Transport error: {type(exc).__name__}: {exc}",
             )
+        except _StreamError as exc:
+            elapsed_ms = int((time.monotonic() - start) * 1000)
+            return ModelResponse.error_for(
+                model_id=model_id,
+                model_alias=alias,
+                round_number=round_number,
+                latency_ms=elapsed_ms,
+                timings=Timings(total_ms=elapsed_ms),
+                error=f"Stream error: {exc}",
+            )
 
-        elapsed_ms = int((time.monotonic() - start) * 1000)
+        end = time.monotonic()
+        elapsed_ms = int((end - start) * 1000)
+        timings = Timings(
+            ttfb_ms=int((headers_at - start) * 1000),
+            body_ms=int((end - headers_at) * 1000),
+            total_ms=elapsed_ms,
+        )
 
-        if resp.status_code != 200:
-            error_detail = _extract_error(resp)
-            return ModelResponse(
+        if not self._http_version_logged:
+            self._logger.debug("Anthropic API negotiated %s", resp.http_version)
+            self._http_version_logged = True
+
+        if message is None:
+            error_detail = _extract_error(resp.content)
+            return ModelResponse.error_for(
                 model_id=model_id,
                 model_alias=alias,
                 round_number=round_number,
-                content="",
                 latency_ms=elapsed_ms,
+                timings=timings,
                 error=f"HTTP {resp.status_code}: {error_detail}",
             )
 
-        data = resp.json()
-        content = _extract_content(data)
-        token_count = _extract_token_count(data)
-        input_tokens, output_tokens = _extract_token_split(data)
-
-        return ModelResponse(
+        response = _response_from_message(
+            message,
             model_id=model_id,
             model_alias=alias,
             round_number=round_number,
-            content=content,
             latency_ms=elapsed_ms,
-            token_count=token_count,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
         )
+        response.timings = timings
+        return response
+
+    def _build_payload(
+        self,
+        model_id: str,
+        messages: list[dict[str, Any]],
+        round_number: int,
+        *,
+        prompt_only: bool = False,
+    ) -> dict[str, Any]:
+        """Build a Messages API request body.
+
+        Args:
+            model_id: Anthropic model identifier.
+            messages: Resolved chat messages, possibly including system messages.
+            round_number: Debate round, used for prompt-cache marking.
+            prompt_only: True when *messages* is the single user turn built
+                from a ``prompt``.  Such a request has no system message to
+                hoist and no prior turn to cache, so both passes are skipped.
+                This is a shortcut, not a behaviour change: run on a single
+                user turn, ``_extract_system()`` and ``_apply_cache_control()``
+                return it unchanged — content stays a plain string and no
+                ``cache_control`` is added — so the payload is identical.
+
+        Returns:
+            Request payload with system messages hoisted and cache
+            breakpoints applied.
+        """
+        if prompt_only:
+            return {**self._payload_base, "model": model_id, "messages": messages}
+
+        system_text, chat_messages = _extract_system(messages)
+        system_blocks, chat_messages = _apply_cache_control(
+            system_text, chat_messages, round_number
+        )
+
+        payload: dict[str, Any] = {
+            **self._payload_base,
+            "model": model_id,
+            "messages": chat_messages,
+        }
+        if system_blocks is not None:
+            payload["system"] = system_blocks
+        return payload
+
+    async def _post_with_retry(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        payload: dict[str, Any],
+        alias: str,
+        *,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """POST to the Anthropic API, retrying rate-limit/overload responses.
+
+        Args:
+            client: Open HTTP client.
+            url: Endpoint URL.
+            payload: Request body.
+            alias: Model alias (or batch label) for log messages.
+            stream: Return as soon as headers arrive, leaving the body
+                unread.  The caller must close the returned response.
+
+        Returns:
+            The final response — successful, non-retryable, or the last
+            retryable response once retries are exhausted.
+
+        Raises:
+            httpx.HTTPError: Transport failures are not retried.
+        """
+        body = orjson.dumps(payload)
+
+        async def send() -> httpx.Response:
+            if stream:
+                request = client.build_request("POST", url, content=body)
+                return await client.send(request, stream=True)
+            return await client.post(url, content=body)
+
+        return await self._with_retry(send, alias, stream=stream)
+
+    async def _get_with_retry(
+        self, client: httpx.AsyncClient, url: str, alias: str
+    ) -> httpx.Response:
+        """GET from the Anthropic API, retrying rate-limit/overload responses.
+
+        Args:
+            client: Open HTTP client.
+            url: Endpoint URL.
+            alias: Label for log messages.
+
+        Returns:
+            The final response, as for ``_post_with_retry()``.
+
+        Raises:
+            httpx.HTTPError: Transport failures are not retried.
+        """
+        return await self._with_retry(lambda: client.get(url), alias)
+
+    async def _with_retry(
+        self,
+        send: Callable[[], Awaitable[httpx.Response]],
+        alias: str,
+        *,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """Call *send* until it returns a non-retryable response.
+
+        Retries ``RETRY_STATUS_CODES`` up to ``max_retries`` times, waiting
+        per ``_retry_delay()`` between attempts.  Each retry takes a slot
+        from the provider's rate limiter, if one was given.
+
+        Args:
+            send: Issues one request attempt.
+            alias: Model alias (or batch label) for log messages.
+            stream: Responses are streamed; a retried one is closed
+                before the next attempt.
+
+        Returns:
+            The final response — successful, non-retryable, or the last
+            retryable response once retries are exhausted.
+        """
+        attempt = 0
+        while True:
+            resp = await send()
+            if resp.status_code not in RETRY_STATUS_CODES or attempt >= self._max_retries:
+                return resp
+            if stream:
+                await resp.aclose()
+            delay = _retry_delay(resp, attempt)
+            self._logger.warning(
+                "Anthropic returned HTTP %d for '%s'; retrying in %.1fs (attempt %d/%d)",
+                resp.status_code,
+                alias,
+                delay,
+                attempt + 1,
+                self._max_retries,
+            )
+            await asyncio.sleep(delay)
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire()
+            attempt += 1
+
+    async def _stream_message(
+        self,
+        client: httpx.AsyncClient,
+        payload: dict[str, Any],
+        alias: str,
+    ) -> tuple[httpx.Response, dict[str, Any] | None, float]:
+        """Send a streaming Messages API request and assemble the reply.
+
+        Args:
+            client: Open HTTP client.
+            payload: Request body with ``"stream": True``.
+            alias: Model alias for log messages.
+
+        Returns:
+            Tuple of (response, message, headers_at).  *message* is the
+            assembled message dict for a 200 response, or ``None``
+            otherwise — in which case the (non-streamed) error body has
+            been read into ``response.content``.  *headers_at* is the
+            ``time.monotonic()`` reading when the final response's
+            headers arrived.
+
+        Raises:
+            _StreamError: If the stream carries an ``error`` event or an
+                event that cannot be decoded.
+            httpx.HTTPError: On transport failures, including mid-stream.
+        """
+        resp = await self._post_with_retry(client, ANTHROPIC_API_URL, payload, alias, stream=True)
+        headers_at = time.monotonic()
+        try:
+            if resp.status_code != 200:
+                await resp.aread()
+                return resp, None, headers_at
+            stream = _MessageStream()
+            async for line in resp.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                try:
+                    stream.feed(orjson.loads(line[5:]))
+                except (KeyError, TypeError, ValueError) as exc:
+                    raise _StreamError(f"Malformed event: {type(exc).__name__}: {exc}") from exc
+            return resp, stream.message(), headers_at
+        finally:
+            await resp.aclose()
+
+    async def complete_batch(
+        self,
+        requests: list[dict[str, Any]],
+        *,
+        batch_max_wait: float = DEFAULT_BATCH_MAX_WAIT,
+    ) -> list[ModelResponse]:
+        """Send many requests through the Message Batches API.
+
+        Creates one batch, polls it with exponential backoff until
+        processing ends, then downloads the JSONL results and maps each
+        ``custom_id`` back to its input position.  Unlike
+        ``complete_parallel()`` this trades latency for cost: batches are
+        billed at a discount but may take minutes to finish.
+
+        Failures never raise — every request gets a ``ModelResponse``,
+        with ``error`` set if the batch could not be created, did not
+        finish within *batch_max_wait*, or the individual request errored
+        or expired.
+
+        Args:
+            requests: List of keyword argument dicts for ``complete()``.
+                Each dict must contain ``model_id`` and either ``prompt``
+                or ``messages``.
+            batch_max_wait: Maximum seconds to wait for the batch to end.
+
+        Returns:
+            List of ``ModelResponse`` objects in the same order as
+            *requests*.  ``latency_ms`` is the wall time of the whole batch.
+
+        Raises:
+            ValueError: If a request has both or neither of
+                ``messages``/``prompt``.
+            RuntimeError: If the client is used outside a context manager.
+        """
+        if not self._client:
+            raise RuntimeError("Client not initialized. Use 'async with' context manager.")
+        if not requests:
+            return []
+
+        # Per-request metadata, indexed by custom_id.
+        meta: list[tuple[str, str, int]] = []
+        batch_requests: list[dict[str, Any]] = []
+        for i, req in enumerate(requests):
+            model_id = req["model_id"]
+            resolved = self._resolve_messages(req.get("messages"), req.get("prompt"))
+            round_number = req.get("round_number", 0)
+            meta.append((model_id, req.get("model_alias") or model_id, round_number))
+            batch_requests.append(
+                {
+                    "custom_id": str(i),
+                    "params": self._build_payload(
+                        model_id,
+                        resolved,
+                        round_number,
+                        prompt_only=req.get("messages") is None,
+                    ),
+                }
+            )
+
+        start = time.monotonic()
+        errors: dict[int, str] = {}
+        messages_by_index: dict[int, dict[str, Any]] = {}
+        try:
+            results = await self._run_batch(self._client, batch_requests, start, batch_max_wait)
+        except _BatchError as exc:
+            errors = dict.fromkeys(range(len(requests)), str(exc))
+        except httpx.HTTPError as exc:
+            detail = f"Transport error: {type(exc).__name__}: {exc}"
+            errors = dict.fromkeys(range(len(requests)), detail)
+        except (KeyError, ValueError) as exc:
+            detail = f"Malformed batch response: {type(exc).__name__}: {exc}"
+            errors = dict.fromkeys(range(len(requests)), detail)
+        else:
+            for entry in results:
+                try:
+                    index = int(entry["custom_id"])
+                except (KeyError, TypeError, ValueError):
+                    continue
+                result = entry.get("result") or {}
+                if result.get("type") == "succeeded":
+                    messages_by_index[index] = result.get("message") or {}
+                else:
+                    errors[index] = _batch_result_error(result)
+
+        elapsed_ms = int((time.monotonic() - start) * 1000)
+        responses: list[ModelResponse] = []
+        for i, (model_id, alias, round_number) in enumerate(meta):
+            if i in messages_by_index:
+                responses.append(
+                    _response_from_message(
+                        messages_by_index[i],
+                        model_id=model_id,
+                        model_alias=alias,
+                        round_number=round_number,
+                        latency_ms=elapsed_ms,
+                    )
+                )
+                continue
+            responses.append(
+                ModelResponse.error_for(
+                    model_id=model_id,
+                    model_alias=alias,
+                    round_number=round_number,
+                    latency_ms=elapsed_ms,
+                    error=errors.get(i, "Batch result missing for request"),
+                )
+            )
+        return responses
+
+    async def _run_batch(
+        self,
+        client: httpx.AsyncClient,
+        batch_requests: list[dict[str, Any]],
+        start: float,
+        batch_max_wait: float,
+    ) -> list[dict[str, Any]]:
+        """Create a message batch, wait for it to end, and fetch results.
+
+        A batch abandoned while polling — it does not end in time, a poll
+        fails, or the task is cancelled — is cancelled on Anthropic's side
+        (best effort) before the error propagates.
+
+        Args:
+            client: Open HTTP client.
+            batch_requests: ``{"custom_id", "params"}`` entries.
+            start: ``time.monotonic()`` reading when the batch began.
+            batch_max_wait: Maximum seconds to wait for the batch to end.
+
+        Returns:
+            Parsed JSONL result entries.
+
+        Raises:
+            _BatchError: If the API rejects a request or the batch does
+                not end in time.
+            httpx.HTTPError: On transport failures.
+        """
+        resp = await self._post_with_retry(
+            client, ANTHROPIC_BATCHES_URL, {"requests": batch_requests}, "message batch"
+        )
+        if resp.status_code != 200:
+            raise _BatchError(f"HTTP {resp.status_code}: {_extract_error(resp.content)}")
+        batch = orjson.loads(resp.content)
+        batch_url = f"{ANTHROPIC_BATCHES_URL}/{batch['id']}"
+
+        poll_delay = BATCH_POLL_INITIAL
+        try:
+            while batch.get("processing_status") != "ended":
+                if time.monotonic() - start + poll_delay > batch_max_wait:
+                    raise _BatchError(
+                        f"Batch {batch['id']} did not finish within {batch_max_wait:.0f}s"
+                    )
+                await asyncio.sleep(poll_delay)
+                poll_delay = min(poll_delay * 2, BATCH_POLL_MAX)
+                resp = await self._get_with_retry(client, batch_url, "message batch")
+                if resp.status_code != 200:
+                    raise _BatchError(f"HTTP {resp.status_code}: {_extract_error(resp.content)}")
+                batch = orjson.loads(resp.content)
+        except (_BatchError, asyncio.CancelledError):
+            # Nobody will collect the results, so stop it being processed
+            # (and billed) on Anthropic's side.
+            await self._cancel_batch(client, batch_url)
+            raise
+
+        results_url = batch.get("results_url")
+        if not results_url:
+            raise _BatchError(f"Batch {batch['id']} ended without a results URL")
+        resp = await self._get_with_retry(client, results_url, "message batch")
+        if resp.status_code != 200:
+            raise _BatchError(f"HTTP {resp.status_code}: {_extract_error(resp.content)}")
+        return [orjson.loads(line) for line in resp.content.splitlines() if line.strip()]
+
+    async def _cancel_batch(self, client: httpx.AsyncClient, batch_url: str) -> None:
+        """Ask Anthropic to cancel an abandoned batch, ignoring failures.
+
+        Args:
+            client: Open HTTP client.
+            batch_url: URL of the batch to cancel.
+        """
+        try:
+            resp = await client.post(f"{batch_url}/cancel")
+        except httpx.HTTPError as exc:
+            self._logger.warning("Could not cancel message batch %s: %s", batch_url, exc)
+            return
+        if resp.status_code != 200:
+            self._logger.warning(
+                "Could not cancel message batch %s: HTTP %d", batch_url, resp.status_code
+            )
+
+
+class _BatchError(Exception):
+    """Raised internally when a message batch cannot be completed."""
+
+
+class _StreamError(Exception):
+    """Raised internally when a response stream reports an error event."""
+
+
+def _known_usage(usage: dict[str, Any] | None) -> dict[str, Any]:
+    """Drop null counters from a stream event's ``usage`` object.
+
+    Args:
+        usage: ``usage`` from a ``message_start`` or ``message_delta``
+            event, or ``None``.
+
+    Returns:
+        Copy of *usage* without ``None`` values.
+    """
+    return {key: value for key, value in (usage or {}).items() if value is not None}
+
+
+class _MessageStream:
+    """Accumulates Messages API stream events into a message dict.
+
+    The assembled dict has the same shape as a non-streaming response
+    body, so it can be handed to ``_response_from_message()`` unchanged.
+    Text deltas are collected per content block and joined once, in
+    ``message()``.  A stream that ends without ``message_stop`` was cut
+    short, so ``message()`` refuses to return its partial content.
+    """
+
+    def __init__(self) -> None:
+        self._message: dict[str, Any] = {"content": [], "usage": {}}
+        self._text: dict[int, list[str]] = {}
+        self._stopped = False
+
+    def feed(self, event: dict[str, Any]) -> None:
+        """Apply one decoded ``data:`` payload from the stream.
+
+        Args:
+            event: Parsed SSE event data.
+
+        Raises:
+            _StreamError: For an ``error`` event.
+        """
+        kind = event.get("type")
+        if kind == "content_block_delta":
+            delta = event.get("delta", {})
+            if delta.get("type") == "text_delta":
+                self._text.setdefault(event["index"], []).append(delta["text"])
+        elif kind == "content_block_start":
+            index = event["index"]
+            block = dict(event["content_block"])
+            blocks = self._message["content"]
+            blocks.extend({} for _ in range(index + 1 - len(blocks)))
+            blocks[index] = block
+            if block.get("type") == "text":
+                self._text[index] = [block.get("text", "")]
+        elif kind == "message_start":
+            start = event["message"]
+            self._message.update(start, content=[], usage=_known_usage(start.get("usage")))
+        elif kind == "message_delta":
+            self._message.update(event.get("delta", {}))
+            # Deltas may repeat start-time counters as null; keep the real values.
+            self._message["usage"].update(_known_usage(event.get("usage")))
+        elif kind == "message_stop":
+            self._stopped = True
+        elif kind == "error":
+            error = event.get("error")
+            if isinstance(error, dict):
+                raise _StreamError(str(error.get("message", error)))
+            raise _StreamError(str(error))
+
+    def message(self) -> dict[str, Any]:
+        """Return the assembled message, joining buffered text deltas.
+
+        Returns:
+            Message dict with ``content`` blocks and merged ``usage``.
+
+        Raises:
+            _StreamError: If no ``message_stop`` event was received.
+        """
+        if not self._stopped:
+            raise _StreamError("stream ended before message_stop")
+        blocks = self._message["content"]
+        for index, parts in self._text.items():
+            if index < len(blocks):
+                blocks[index]["text"] = "".join(parts)
+        return self._message
+
+
+def _batch_result_error(result: dict[str, Any]) -> str:
+    """Describe a non-successful message batch result.
+
+    Args:
+        result: The ``result`` object of one JSONL entry.
+
+    Returns:
+        Human-readable error description.
+    """
+    result_type = result.get("type", "unknown")
+    error = result.get("error")
+    if isinstance(error, dict):
+        inner = error.get("error", error)
+        message = inner.get("message") if isinstance(inner, dict) else None
+        if message:
+            return f"Batch request {result_type}: {message}"
+    return f"Batch request {result_type}"
+
+
+def _response_from_message(
+    data: dict[str, Any],
+    *,
+    model_id: str,
+    model_alias: str,
+    round_number: int,
+    latency_ms: int,
+) -> ModelResponse:
+    """Build a ``ModelResponse`` from a Messages API response body.
+
+    Args:
+        data: Parsed message object.
+        model_id: Anthropic model identifier.
+        model_alias: Human-readable name.
+        round_number: Debate round.
+        latency_ms: Measured latency in milliseconds.
+
+    Returns:
+        ModelResponse with content and token stats.
+    """
+    input_tokens, output_tokens = _extract_token_split(data)
+    cache_creation, cache_read = _extract_cache_tokens(data)
+    return ModelResponse(
+        model_id=model_id,
+        model_alias=model_alias,
+        round_number=round_number,
+        content=_extract_content(data),
+        latency_ms=latency_ms,
+        token_count=_extract_token_count(data),
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        cache_creation_input_tokens=cache_creation,
+        cache_read_input_tokens=cache_read,
+    )
+
+
+def _retry_delay(resp: httpx.Response, attempt: int) -> float:
+    """Compute how long to wait before retrying a request.
+
+    Uses the ``retry-after`` header (in seconds) when the server sends
+    one, otherwise exponential backoff from ``RETRY_BASE_DELAY``.  Both
+    are capped at ``RETRY_MAX_DELAY``.
+
+    Args:
+        resp: The retryable response.
+        attempt: Zero-based retry attempt number.
+
+    Returns:
+        Delay in seconds.
+    """
+    retry_after = resp.headers.get("retry-after")
+    if retry_after is not None:
+        try:
+            return min(max(float(retry_after), 0.0), RETRY_MAX_DELAY)
+        except ValueError:
+            pass  # HTTP-date form — fall back to backoff.
+    return min(RETRY_BASE_DELAY * 2.0**attempt, RETRY_MAX_DELAY)
 
 
 def _extract_system(
@@ -212,17 +845,72 @@ def _extract_system(
         concatenated with double newlines if multiple exist.  Returns
         ``None`` for system_text if no system messages are present.
     """
-    system_parts: list[str] = []
-    chat_messages: list[dict[str, Any]] = []
+    if not any(msg.get("role") == "system" for msg in messages):
+        return None, messages
 
-    for msg in messages:
-        if msg.get("role") == "system":
-            system_parts.append(msg["content"])
-        else:
-            chat_messages.append(msg)
+    system_parts = [msg["content"] for msg in messages if msg.get("role") == "system"]
+    chat_messages = [msg for msg in messages if msg.get("role") != "system"]
+    return "\n\n".join(system_parts), chat_messages
+
+
+def _apply_cache_control(
+    system_text: str | None,
+    messages: list[dict[str, Any]],
+    round_number: int,
+) -> tuple[str | list[dict[str, Any]] | None, list[dict[str, Any]]]:
+    """Mark stable prompt prefixes with ephemeral ``cache_control``.
+
+    Debate rounds re-send the same system prompt and prior-round
+    transcript, so those prefixes are cacheable:
 
-    system_text = "\n\n".join(system_parts) if system_parts else None
-    return system_text, chat_messages
+    - The system prompt is wrapped in a cached text block on reflection
+      and synthesis rounds (``round_number != 0``), or whenever it is long
+      enough to meet Anthropic's minimum cacheable length.
+    - The last content block of the most recent *prior* user message is
+      marked, leaving only the newest user turn uncached.
+
+    Input messages are never mutated; marked messages are shallow copies
+    with their content converted to block form.
+
+    Only callers passing explicit ``messages`` benefit.  The orchestrator
+    sends each debate round as a single ``prompt`` turn, which has no
+    system prompt and no prior user turn, so nothing is marked for it —
+    a breakpoint there would pay the cache-write premium on a prefix that
+    is never re-sent.
+
+    Args:
+        system_text: Hoisted system prompt, or ``None``.
+        messages: Chat messages with system messages already removed.
+        round_number: Debate round (0=initial, 1+=reflection, -1=synthesis).
+
+    Returns:
+        Tuple of (system, messages) ready for the request payload.
+        ``system`` is a plain string, a list of content blocks, or
+        ``None`` when there is no system prompt.
+    """
+    system: str | list[dict[str, Any]] | None = system_text
+    if system_text is not None and (
+        round_number != 0 or len(system_text) >= CACHE_MIN_SYSTEM_TOKENS * _CHARS_PER_TOKEN
+    ):
+        system = [{"type": "text", "text": system_text, "cache_control": {"type": "ephemeral"}}]
+
+    user_indices = [i for i, msg in enumerate(messages) if msg.get("role") == "user"]
+    if len(user_indices) < 2:
+        return system, messages
+
+    target = user_indices[-2]
+    content = messages[target].get("content")
+    if isinstance(content, str):
+        blocks: list[dict[str, Any]] = [{"type": "text", "text": content}]
+    elif isinstance(content, list) and content:
+        blocks = [dict(block) for block in content]
+    else:
+        return system, messages
+    blocks[-1]["cache_control"] = {"type": "ephemeral"}
+
+    marked = list(messages)
+    marked[target] = {**messages[target], "content": blocks}
+    return system, marked
 
 
 def _extract_content(data: dict[str, Any]) -> str:
@@ -240,11 +928,15 @@ def _extract_content(data: dict[str, Any]) -> str:
     """
     try:
         content_blocks: list[dict[str, Any]] = data["content"]
+        # Fast path: plain replies are a single text block.
+        if len(content_blocks) == 1 and content_blocks[0].get("type") == "text":
+            text: str = content_blocks[0]["text"]
+            return text
         texts = [block["text"] for block in content_blocks if block.get("type") == "text"]
         if texts:
             return "".join(texts)
         return "[No text content in response]"
-    except (KeyError, TypeError):
+    except (KeyError, TypeError, AttributeError):
         return f"[Failed to parse response: {data}]"
 
 
@@ -281,7 +973,28 @@ def _extract_token_split(data: dict[str, Any]) -> tuple[int | None, int | None]:
     return inp, out
 
 
-def _extract_error(resp: httpx.Response) -> str:
+def _extract_cache_tokens(data: dict[str, Any]) -> tuple[int | None, int | None]:
+    """Extract prompt-cache token counts from an API response.
+
+    Args:
+        data: Parsed JSON response body.
+
+    Returns:
+        Tuple of (cache_creation_input_tokens, cache_read_input_tokens).
+        Either or both may be None if the API did not report them.
+    """
+    usage = data.get("usage")
+    if not usage:
+        return None, None
+    created = usage.get("cache_creation_input_tokens")
+    read = usage.get("cache_read_input_tokens")
+    return (
+        int(created) if created is not None else None,
+        int(read) if read is not None else None,
+    )
+
+
+def _extract_error(body: bytes) -> str:
     """Extract error message from an Anthropic error response.
 
     Handles the Anthropic format::
@@ -289,16 +1002,16 @@ def _extract_error(resp: httpx.Response) -> str:
         {"type": "error", "error": {"type": "...", "message": "..."}}
 
     Args:
-        resp: The httpx response object.
+        body: Raw response body.
 
     Returns:
         Human-readable error description.
     """
     try:
-        body = resp.json()
-        error = body.get("error", {})
+        data = orjson.loads(body)
+        error = data.get("error", {})
         if isinstance(error, dict):
-            return str(error.get("message", str(body)))
+            return str(error.get("message", str(data)))
         return str(error)
     except Exception:
-        return str(resp.text[:500])
+        return body[:500].decode("utf-8", errors="replace")
@@ -58,6 +58,19 @@ class Provider(ABC):
         """
         ...
 
+    @property
+    def generation_params(self) -> dict[str, Any]:
+        """Generation settings this provider adds to every request.
+
+        Used as part of the response cache key so that changing, e.g.,
+        ``max_tokens`` does not replay answers generated under the old
+        setting.  The default is empty.
+
+        Returns:
+            Mapping of parameter name to value.
+        """
+        return {}
+
     async def complete_parallel(
         self,
         requests: list[dict[str, Any]],
@@ -75,8 +88,9 @@ class Provider(ABC):
         Returns:
             List of ``ModelResponse`` objects in the same order as *requests*.
         """
-        tasks = [self.complete(**req) for req in requests]
-        return list(await asyncio.gather(*tasks))
+        if not requests:
+            return []
+        return await asyncio.gather(*(self.complete(**req) for req in requests))
 
     @staticmethod
     def _resolve_messages(
@@ -20,6 +20,7 @@ Typical usage::
 
 from __future__ import annotations
 
+import logging
 import time
 from typing import Any
 
@@ -33,6 +34,15 @@ DEFAULT_TIMEOUT = 120.0  # seconds — generous for slow models
 APP_SITE_URL = "https://richardspicer.io"
 APP_NAME = "Mutual Dissent"
 
+# Connection pool limits.  Parallel panel requests share a single HTTP/2
+# connection where the server supports it, so keepalive slots matter more
+# than the total cap.
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0,
+)
+
 
 class OpenRouterError(Exception):
     """Raised when the OpenRouter API returns an error.
@@ -51,12 +61,17 @@ class OpenRouterError(Exception):
 class OpenRouterProvider(Provider):
     """Async provider for the OpenRouter chat completions API.
 
-    Uses ``httpx.AsyncClient`` for connection pooling and async I/O.
-    Designed to be used as an async context manager.
+    Uses ``httpx.AsyncClient`` with HTTP/2 enabled so concurrent requests
+    are multiplexed over one connection.  Designed to be used as an async
+    context manager.
 
     Args:
         api_key: OpenRouter API key.
         timeout: Request timeout in seconds.  Defaults to 120s.
+        transport: Optional transport to send requests through, e.g. one
+            shared by several providers.  When given, it owns connection
+            pooling and HTTP/2 negotiation.  Closing the provider closes
+            the transport, so a shared one should ignore ``aclose()``.
 
     Example::
 
@@ -67,7 +82,13 @@ class OpenRouterProvider(Provider):
             print(resp.content)
     """
 
-    def __init__(self, api_key: str, timeout: float = DEFAULT_TIMEOUT) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        timeout: float = DEFAULT_TIMEOUT,
+        *,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
         if not api_key:
             raise ValueError(
                 "OpenRouter API key is required. Set OPENROUTER_API_KEY env var "
@@ -75,18 +96,28 @@ class OpenRouterProvider(Provider):
             )
         self._api_key = api_key
         self._timeout = timeout
+        self._transport = transport
+        # Built once; every client opened by this provider reuses them.
+        self._timeout_config = httpx.Timeout(timeout)
+        self._headers = {
+            "Authorization": f"Bearer {api_key}",
+            "HTTP-Referer": APP_SITE_URL,
+            "X-Title": APP_NAME,
+            "Content-Type": "application/json",
+        }
         self._client: httpx.AsyncClient | None = None
+        self._http_version_logged = False
+        self._logger = logging.getLogger(__name__)
 
     async def __aenter__(self) -> OpenRouterProvider:
         """Open the underlying HTTP connection pool."""
+        self._http_version_logged = False
         self._client = httpx.AsyncClient(
-            timeout=httpx.Timeout(self._timeout),
-            headers={
-                "Authorization": f"Bearer {self._api_key}",
-                "HTTP-Referer": APP_SITE_URL,
-                "X-Title": APP_NAME,
-                "Content-Type": "application/json",
-            },
+            http2=True,
+            timeout=self._timeout_config,
+            limits=DEFAULT_LIMITS,
+            transport=self._transport,
+            headers=self._headers,
         )
         return self
 
@@ -141,34 +172,35 @@ class OpenRouterProvider(Provider):
             resp = await self._client.post(OPENROUTER_API_URL, json=payload)
         except httpx.TimeoutException:
             elapsed_ms = int((time.monotonic() - start) * 1000)
-            return ModelResponse(
+            return ModelResponse.error_for(
                 model_id=model_id,
                 model_alias=alias,
                 round_number=round_number,
-                content="",
                 latency_ms=elapsed_ms,
                 error=f"Request timed out after {self._timeout}s",
             )
         except httpx.HTTPError as exc:
             elapsed_ms = int((time.monotonic() - start) * 1000)
-            return ModelResponse(
+            return ModelResponse.error_for(
                 model_id=model_id,
                 model_alias=alias,
                 round_number=round_number,
-                content="",
                 latency_ms=elapsed_ms,
                 error=f"Transport error: {type(exc).__name__}: {exc}",
             )
 
         elapsed_ms = int((time.monotonic() - start) * 1000)
 
+        if not self._http_version_logged:
+            self._logger.debug("OpenRouter API negotiated %s", resp.http_version)
+            self._http_version_logged = True
+
         if resp.status_code != 200:
             error_detail = _extract_error(resp)
-            return ModelResponse(
+            return ModelResponse.error_for(
                 model_id=model_id,
                 model_alias=alias,
                 round_number=round_number,
-                content="",
                 latency_ms=elapsed_ms,
                 error=f"HTTP {resp.status_code}: {error_detail}",
             )
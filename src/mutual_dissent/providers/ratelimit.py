@@ -0,0 +1,69 @@
+"""Async rate limiting for provider requests.
+
+Implements a leaky-bucket limiter used by ``ProviderRouter`` to keep each
+vendor under its requests-per-minute budget.  Bursts up to ``max_rate``
+requests go through immediately; beyond that, callers wait until the
+bucket drains enough to admit them.
+
+Typical usage::
+
+    from mutual_dissent.providers.ratelimit import AsyncRateLimiter
+
+    limiter = AsyncRateLimiter(50)  # 50 requests per minute
+    async with limiter:
+        await provider.complete(...)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+
+class AsyncRateLimiter:
+    """Leaky-bucket rate limiter usable as an async context manager.
+
+    Args:
+        max_rate: Maximum number of acquisitions per *time_period*.
+        time_period: Window length in seconds.  Defaults to 60s, so
+            *max_rate* reads as requests per minute.
+
+    Raises:
+        ValueError: If *max_rate* or *time_period* is not positive.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60.0) -> None:
+        if max_rate <= 0 or time_period <= 0:
+            raise ValueError("max_rate and time_period must be positive.")
+        self._max_rate = max_rate
+        self._rate_per_sec = max_rate / time_period
+        self._level = 0.0
+        self._last_check = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _leak(self) -> None:
+        """Drain the bucket according to time elapsed since the last check."""
+        now = time.monotonic()
+        elapsed = now - self._last_check
+        self._level = max(self._level - elapsed * self._rate_per_sec, 0.0)
+        self._last_check = now
+
+    async def acquire(self) -> None:
+        """Wait until the bucket has capacity, then take one slot.
+
+        Waiters are admitted in arrival order.
+        """
+        async with self._lock:
+            while True:
+                self._leak()
+                if self._level + 1 <= self._max_rate:
+                    self._level += 1
+                    return
+                await asyncio.sleep((self._level + 1 - self._max_rate) / self._rate_per_sec)
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
@@ -29,14 +29,24 @@ Typical usage::
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 import logging
+import time
+import urllib.request
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
 from typing import Any
 
+import httpx
+
+from mutual_dissent.cache import CacheBackend, make_cache, request_key
 from mutual_dissent.config import Config
-from mutual_dissent.models import ModelResponse
+from mutual_dissent.models import ModelResponse, Timings
 from mutual_dissent.providers.anthropic import AnthropicProvider
 from mutual_dissent.providers.base import Provider
 from mutual_dissent.providers.openrouter import OpenRouterProvider
+from mutual_dissent.providers.ratelimit import AsyncRateLimiter
 from mutual_dissent.types import RoutingDecision, Vendor
 
 # Registry of vendors with direct provider implementations.
@@ -46,6 +56,15 @@ _DIRECT_PROVIDERS: dict[str, type[Provider]] = {
 }
 
 
+# Pool limits for the transport shared by every provider the router opens.
+# Sized for all vendors together rather than per provider.
+SHARED_LIMITS = httpx.Limits(
+    max_connections=200,
+    max_keepalive_connections=50,
+    keepalive_expiry=90.0,
+)
+
+
 # OpenRouter model ID prefix → Vendor enum member.
 _PREFIX_TO_VENDOR: dict[str, Vendor] = {
     "anthropic": Vendor.ANTHROPIC,
@@ -56,40 +75,72 @@ _PREFIX_TO_VENDOR: dict[str, Vendor] = {
 }
 
 
-def _resolve_vendor(alias_or_id: str, config: Config) -> Vendor:
-    """Determine the vendor for a given alias or model ID.
+def _vendor_from_id(model_id: str) -> Vendor | None:
+    """Map a slash-qualified model ID to its vendor.
 
-    Resolution order:
+    Args:
+        model_id: Model ID such as ``"anthropic/claude-sonnet-4-6"``.
 
-    1. If alias exists in config's v2 aliases, extract vendor from the
-       OpenRouter ID prefix.
-    2. If ``alias_or_id`` contains ``/``, extract prefix as vendor.
-    3. Fall back to ``Vendor.OPENROUTER`` (unknown vendor, route through
-       OpenRouter).
+    Returns:
+        The vendor for the ID's prefix (``Vendor.OPENROUTER`` for unknown
+        prefixes), or ``None`` if *model_id* has no ``/``.
+    """
+    prefix, sep, _ = model_id.partition("/")
+    if not sep:
+        return None
+    return _PREFIX_TO_VENDOR.get(prefix, Vendor.OPENROUTER)
+
+
+def _alias_vendors(config: Config) -> dict[str, Vendor]:
+    """Precompute the vendor of every v2 alias with a qualified OpenRouter ID.
 
     Args:
-        alias_or_id: Model alias (e.g. ``"claude"``) or full model ID
-            (e.g. ``"anthropic/claude-sonnet-4-6"``).
         config: Application configuration with alias mappings.
 
     Returns:
-        The resolved ``Vendor`` enum member.
+        Mapping of alias to vendor.  Aliases whose OpenRouter ID has no
+        ``/`` are omitted and resolve like any other bare string.
     """
-    # 1. Check v2 aliases.
-    if alias_or_id in config._model_aliases_v2:
-        ids = config._model_aliases_v2[alias_or_id]
-        openrouter_id = ids.get("openrouter", "")
-        if "/" in openrouter_id:
-            prefix = openrouter_id.split("/")[0]
-            return _PREFIX_TO_VENDOR.get(prefix, Vendor.OPENROUTER)
+    vendors: dict[str, Vendor] = {}
+    for alias, ids in config._model_aliases_v2.items():
+        vendor = _vendor_from_id(ids.get("openrouter", ""))
+        if vendor is not None:
+            vendors[alias] = vendor
+    return vendors
+
+
+def _env_proxies_configured() -> bool:
+    """Report whether HTTP(S)_PROXY / ALL_PROXY is set in the environment.
+
+    httpx only honours these when a client builds its own transport, so
+    the router must not inject its shared transport while they are set.
+
+    Returns:
+        True if any proxy httpx would use from the environment is set.
+    """
+    proxies = urllib.request.getproxies()
+    return any(proxies.get(scheme) for scheme in ("http", "https", "all"))
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """Transport view handed to each provider over the router's pool.
+
+    Providers close their client, and with it their transport, on exit.
+    This wrapper ignores that close so the pool outlives any one
+    provider; the router closes the underlying transport itself.
+
+    Args:
+        transport: The router-owned transport to delegate to.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self._transport = transport
 
-    # 2. Full model ID with slash.
-    if "/" in alias_or_id:
-        prefix = alias_or_id.split("/")[0]
-        return _PREFIX_TO_VENDOR.get(prefix, Vendor.OPENROUTER)
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
 
-    # 3. Unknown — fall back to OpenRouter.
-    return Vendor.OPENROUTER
+    async def aclose(self) -> None:
+        return None
 
 
 class ProviderRouter:
@@ -99,8 +150,25 @@ class ProviderRouter:
     routing configuration, and available API keys.  Manages provider
     lifecycles as an async context manager.
 
+    When a response cache is configured (``config.cache_backend``),
+    successful responses are stored and identical later requests are
+    served from the cache without a network call.  Identical requests
+    that arrive while the first is still in flight share its result.
+
+    Outbound requests are throttled: at most ``config.max_concurrency``
+    are in flight at once, and each provider listed in
+    ``config.rate_limits`` is held to its requests-per-minute budget.
+    Direct providers are handed their limiter too, so the retries they
+    send after a 429/503/529 also count against the budget.
+
+    Routing decisions are memoized per alias.  The router treats *config*
+    as fixed for its lifetime; build a new router after changing keys,
+    aliases, or routing modes.
+
     Args:
         config: Application configuration with provider keys and routing.
+        cache: Optional cache backend.  Defaults to the backend selected
+            in *config* (``None`` when caching is off).
 
     Example::
 
@@ -109,10 +177,22 @@ class ProviderRouter:
             response = await router.complete("claude", prompt="Hello")
     """
 
-    def __init__(self, config: Config) -> None:
+    def __init__(self, config: Config, *, cache: CacheBackend | None = None) -> None:
         self._config = config
+        self._cache: CacheBackend | None = cache if cache is not None else make_cache(config)
         self._providers: dict[str, Provider] = {}
         self._openrouter: OpenRouterProvider | None = None
+        self._transport: httpx.AsyncHTTPTransport | None = None
+        self._semaphore = asyncio.Semaphore(max(config.max_concurrency, 1))
+        self._limiters: dict[str, AsyncRateLimiter] = {
+            name: AsyncRateLimiter(rpm) for name, rpm in config.rate_limits.items() if rpm > 0
+        }
+        self._inflight: dict[str, asyncio.Future[ModelResponse]] = {}
+        # Callers still awaiting each in-flight task; a task nobody awaits
+        # any more is cancelled.
+        self._waiters: dict[asyncio.Future[ModelResponse], int] = {}
+        self._alias_to_vendor = _alias_vendors(config)
+        self._routing_decisions: dict[str, RoutingDecision] = {}
         self._logger = logging.getLogger(__name__)
 
     async def __aenter__(self) -> ProviderRouter:
@@ -124,29 +204,60 @@ class ProviderRouter:
         - Direct providers for each vendor that has both an API key
           and a registered provider class in ``_DIRECT_PROVIDERS``.
 
+        All providers send through one HTTP/2 transport, so connection
+        limits, keepalive slots, and TLS sessions are shared.  When a
+        proxy is configured through the environment, each provider keeps
+        its own transport instead so httpx still routes through it.
+        Providers are opened concurrently; if any fails to open, those
+        already open are closed before the error propagates.
+
         Returns:
             This ``ProviderRouter`` instance.
         """
+        shared: _SharedTransport | None = None
+        if not _env_proxies_configured():
+            self._transport = httpx.AsyncHTTPTransport(http2=True, limits=SHARED_LIMITS)
+            shared = _SharedTransport(self._transport)
+
         or_key = self._config.get_provider_key("openrouter")
         if or_key:
-            self._openrouter = OpenRouterProvider(api_key=or_key)
-            await self._openrouter.__aenter__()
+            self._openrouter = OpenRouterProvider(api_key=or_key, transport=shared)
 
         for vendor, provider_cls in _DIRECT_PROVIDERS.items():
             key = self._config.get_provider_key(vendor)
             if key:
-                provider = provider_cls(api_key=key)  # type: ignore[call-arg]
-                await provider.__aenter__()
-                self._providers[vendor] = provider
+                self._providers[vendor] = provider_cls(  # type: ignore[call-arg]
+                    api_key=key, transport=shared, rate_limiter=self._limiters.get(vendor)
+                )
+
+        opening: list[Provider] = list(self._providers.values())
+        if self._openrouter is not None:
+            opening.append(self._openrouter)
+        try:
+            await asyncio.gather(*(provider.__aenter__() for provider in opening))
+        except BaseException:
+            await self.__aexit__(None, None, None)
+            raise
 
         return self
 
     async def __aexit__(self, *exc: Any) -> None:
         """Close all open provider connections.
 
-        Uses ``asyncio.gather`` with ``return_exceptions=True`` to
-        ensure all providers are closed even if one raises.
+        Coalesced requests still in flight are cancelled and awaited
+        first so none outlives the connections it uses.  Uses
+        ``asyncio.gather`` with ``return_exceptions=True`` to ensure all
+        providers are closed even if one raises.  The shared transport
+        is closed last.
         """
+        leaders = list(self._inflight.values())
+        for leader in leaders:
+            leader.cancel()
+        if leaders:
+            await asyncio.gather(*leaders, return_exceptions=True)
+        self._inflight.clear()
+        self._waiters.clear()
+
         coros: list[Any] = []
         if self._openrouter is not None:
             coros.append(self._openrouter.__aexit__(None, None, None))
@@ -156,6 +267,9 @@ class ProviderRouter:
             await asyncio.gather(*coros, return_exceptions=True)
         self._openrouter = None
         self._providers.clear()
+        if self._transport is not None:
+            await self._transport.aclose()
+            self._transport = None
 
     def route(self, alias_or_id: str) -> RoutingDecision:
         """Determine how a request should be routed.
@@ -164,6 +278,9 @@ class ProviderRouter:
         available API keys, and registered provider classes to decide
         whether a request should go direct or through OpenRouter.
 
+        Decisions are computed once per alias and reused, so fallback
+        warnings are logged only the first time an alias is routed.
+
         Args:
             alias_or_id: Model alias (e.g. ``"claude"``) or full model ID
                 (e.g. ``"anthropic/claude-sonnet-4-6"``).
@@ -172,7 +289,26 @@ class ProviderRouter:
             A ``RoutingDecision`` recording the vendor, mode, and
             whether OpenRouter is used.
         """
-        vendor = _resolve_vendor(alias_or_id, self._config)
+        decision = self._routing_decisions.get(alias_or_id)
+        if decision is None:
+            decision = self._decide_route(alias_or_id)
+            self._routing_decisions[alias_or_id] = decision
+        return decision
+
+    def _decide_route(self, alias_or_id: str) -> RoutingDecision:
+        """Compute the routing decision for *alias_or_id*.
+
+        Args:
+            alias_or_id: Model alias or full model ID.
+
+        Returns:
+            A fresh ``RoutingDecision``.
+        """
+        vendor = (
+            self._alias_to_vendor.get(alias_or_id)
+            or _vendor_from_id(alias_or_id)
+            or Vendor.OPENROUTER
+        )
         mode = self._config.routing.get(
             alias_or_id,
             self._config.routing.get("default_mode", "auto"),
@@ -225,6 +361,15 @@ class ProviderRouter:
         an error field set (rather than raising) if no provider is
         available.
 
+        If a response cache is configured, a hit is returned as a copy
+        with ``latency_ms=0`` and ``routing["cached"] = True``; successful
+        misses are written back to the cache.  A miss that matches a
+        request already in flight waits for that request instead of
+        sending its own, and gets a copy with ``routing["coalesced"] =
+        True``.  Coalescing is tied to the cache because both replay one
+        sampled answer to several callers.  The shared request is
+        cancelled once every caller waiting on it has been cancelled.
+
         Args:
             alias_or_id: Model alias (e.g. ``"claude"``) or full model ID.
             messages: Chat messages in OpenAI-compatible format.
@@ -238,32 +383,217 @@ class ProviderRouter:
             ``ModelResponse`` with the model's reply, or with ``error``
             set if routing/dispatch failed.
         """
-        decision = self.route(alias_or_id)
         alias = model_alias or alias_or_id
 
+        if self._cache is None:
+            return await self._dispatch(
+                alias_or_id,
+                messages=messages,
+                prompt=prompt,
+                model_alias=alias,
+                round_number=round_number,
+            )
+
+        key = self._cache_key(alias_or_id, messages, prompt)
+        if key is None:
+            return await self._dispatch(
+                alias_or_id,
+                messages=messages,
+                prompt=prompt,
+                model_alias=alias,
+                round_number=round_number,
+            )
+        cached = await self._cache.get(key)
+        if cached is not None:
+            hit = ModelResponse.from_dict(cached)
+            return dataclasses.replace(
+                hit,
+                model_alias=alias,
+                round_number=round_number,
+                timestamp=datetime.now(UTC),
+                latency_ms=0,
+                timings=None,
+                routing={**(hit.routing or {}), "cached": True},
+            )
+
+        task = self._inflight.get(key)
+        coalesced = task is not None
+        if task is None:
+            # The call runs as its own task so a cancelled caller does not
+            # cancel it for the others waiting on the same key.
+            task = asyncio.ensure_future(
+                self._dispatch_and_cache(
+                    key,
+                    alias_or_id,
+                    messages=messages,
+                    prompt=prompt,
+                    model_alias=alias,
+                    round_number=round_number,
+                )
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget_inflight(key, done))
+
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            shared = await asyncio.shield(task)
+        finally:
+            self._release_waiter(task)
+
+        if not coalesced:
+            return shared
+        return dataclasses.replace(
+            shared,
+            model_alias=alias,
+            round_number=round_number,
+            routing={**(shared.routing or {}), "coalesced": True},
+            analysis=dict(shared.analysis),
+        )
+
+    def _cache_key(
+        self,
+        alias_or_id: str,
+        messages: list[dict[str, Any]] | None,
+        prompt: str | None,
+    ) -> str | None:
+        """Compute the cache key for a request as it will be sent.
+
+        Keys on the resolved model ID, the provider the request is routed
+        through, and that provider's generation settings, so a remapped
+        alias or a changed ``max_tokens`` never replays a stale answer.
+
+        Args:
+            alias_or_id: Model alias or full model ID.
+            messages: Chat messages, or ``None``.
+            prompt: Single user message string, or ``None``.
+
+        Returns:
+            The key, or ``None`` if the request cannot be routed (it is
+            then dispatched uncached so the usual error is returned).
+        """
+        decision = self.route(alias_or_id)
+        if decision.via_openrouter:
+            provider: Provider | None = self._openrouter
+            route = Vendor.OPENROUTER.value
+        else:
+            provider = self._providers.get(decision.vendor.value)
+            route = decision.vendor.value
+        if provider is None:
+            return None
+        try:
+            model_id = self._config.resolve_model(alias_or_id, direct=not decision.via_openrouter)
+        except ValueError:
+            return None
+        return request_key(model_id, route, messages, prompt, provider.generation_params)
+
+    async def _dispatch_and_cache(
+        self,
+        key: str,
+        alias_or_id: str,
+        *,
+        messages: list[dict[str, Any]] | None,
+        prompt: str | None,
+        model_alias: str,
+        round_number: int,
+    ) -> ModelResponse:
+        """Dispatch a cache miss and store a successful response.
+
+        Args:
+            key: Cache key from ``request_key()``.
+            alias_or_id: Model alias or full model ID.
+            messages: Chat messages, or ``None``.
+            prompt: Single user message string, or ``None``.
+            model_alias: Resolved display alias.
+            round_number: Debate round.
+
+        Returns:
+            The provider's ``ModelResponse``.
+        """
+        response = await self._dispatch(
+            alias_or_id,
+            messages=messages,
+            prompt=prompt,
+            model_alias=model_alias,
+            round_number=round_number,
+        )
+        if response.error is None and self._cache is not None:
+            await self._cache.set(key, response.to_dict())
+        return response
+
+    def _release_waiter(self, task: asyncio.Future[ModelResponse]) -> None:
+        """Record that one caller stopped awaiting *task*.
+
+        Cancels the task once its last caller has gone (e.g. every
+        caller was cancelled), so an unwanted request does not keep
+        running.
+
+        Args:
+            task: The in-flight task the caller was awaiting.
+        """
+        remaining = self._waiters.get(task, 0) - 1
+        if remaining > 0:
+            self._waiters[task] = remaining
+            return
+        self._waiters.pop(task, None)
+        if not task.done():
+            task.cancel()
+
+    def _forget_inflight(self, key: str, done: asyncio.Future[ModelResponse]) -> None:
+        """Drop *key* from the in-flight map once its request finishes.
+
+        Args:
+            key: Cache key of the finished request.
+            done: The finished task; only removed if still registered.
+        """
+        if self._inflight.get(key) is done:
+            del self._inflight[key]
+
+    async def _dispatch(
+        self,
+        alias_or_id: str,
+        *,
+        messages: list[dict[str, Any]] | None,
+        prompt: str | None,
+        model_alias: str,
+        round_number: int,
+    ) -> ModelResponse:
+        """Route a request and send it to the selected provider.
+
+        Args:
+            alias_or_id: Model alias or full model ID.
+            messages: Chat messages in OpenAI-compatible format.
+            prompt: Single user message string.
+            model_alias: Resolved human-readable name.
+            round_number: Debate round.
+
+        Returns:
+            ``ModelResponse`` from the provider, or with ``error`` set if
+            no provider is available.
+        """
+        decision = self.route(alias_or_id)
         routing_dict = decision.to_dict()
 
         if decision.via_openrouter:
             if self._openrouter is None:
-                response = ModelResponse(
+                return ModelResponse.error_for(
                     model_id=alias_or_id,
-                    model_alias=alias,
+                    model_alias=model_alias,
                     round_number=round_number,
-                    content="",
                     error=(
                         f"No provider available for '{alias_or_id}': "
                         "no OpenRouter API key configured and no direct "
                         "provider available"
                     ),
+                    routing=routing_dict,
                 )
-                response.routing = routing_dict
-                return response
             model_id = self._config.resolve_model(alias_or_id)
-            response = await self._openrouter.complete(
+            response = await self._send(
+                self._openrouter,
+                Vendor.OPENROUTER.value,
                 model_id,
                 messages=messages,
                 prompt=prompt,
-                model_alias=alias,
+                model_alias=model_alias,
                 round_number=round_number,
             )
             response.routing = routing_dict
@@ -273,26 +603,86 @@ class ProviderRouter:
         vendor_key = decision.vendor.value
         provider = self._providers.get(vendor_key)
         if provider is None:
-            response = ModelResponse(
+            return ModelResponse.error_for(
                 model_id=alias_or_id,
-                model_alias=alias,
+                model_alias=model_alias,
                 round_number=round_number,
-                content="",
                 error=f"No direct provider available for vendor '{vendor_key}'",
+                routing=routing_dict,
             )
-            response.routing = routing_dict
-            return response
         model_id = self._config.resolve_model(alias_or_id, direct=True)
-        response = await provider.complete(
+        response = await self._send(
+            provider,
+            vendor_key,
             model_id,
             messages=messages,
             prompt=prompt,
-            model_alias=alias,
+            model_alias=model_alias,
             round_number=round_number,
         )
         response.routing = routing_dict
         return response
 
+    async def _send(
+        self,
+        provider: Provider,
+        provider_name: str,
+        model_id: str,
+        *,
+        messages: list[dict[str, Any]] | None,
+        prompt: str | None,
+        model_alias: str,
+        round_number: int,
+    ) -> ModelResponse:
+        """Call *provider* under the throttle and record time spent queued.
+
+        Args:
+            provider: Open provider to call.
+            provider_name: Provider key for rate limiting.
+            model_id: Provider-specific model ID.
+            messages: Chat messages, or ``None``.
+            prompt: Single user message string, or ``None``.
+            model_alias: Resolved human-readable name.
+            round_number: Debate round.
+
+        Returns:
+            The provider's ``ModelResponse`` with ``timings.queue_ms``
+            set and the queue time added to ``timings.total_ms``.
+        """
+        queued_at = time.monotonic()
+        async with self._throttle(provider_name):
+            queue_ms = int((time.monotonic() - queued_at) * 1000)
+            response = await provider.complete(
+                model_id,
+                messages=messages,
+                prompt=prompt,
+                model_alias=model_alias,
+                round_number=round_number,
+            )
+        provider_ms = response.timings.total_ms if response.timings else (response.latency_ms or 0)
+        base = response.timings or Timings()
+        response.timings = dataclasses.replace(
+            base, queue_ms=queue_ms, total_ms=queue_ms + provider_ms
+        )
+        return response
+
+    @asynccontextmanager
+    async def _throttle(self, provider_name: str) -> AsyncIterator[None]:
+        """Hold a concurrency slot and the provider's rate-limit budget.
+
+        Args:
+            provider_name: Provider key the request is sent through
+                (``"openrouter"`` or a direct vendor value).
+
+        Yields:
+            None, once the request may be sent.
+        """
+        async with self._semaphore:
+            limiter = self._limiters.get(provider_name)
+            if limiter is not None:
+                await limiter.acquire()
+            yield
+
     async def complete_parallel(
         self,
         requests: list[dict[str, Any]],
@@ -302,6 +692,15 @@ class ProviderRouter:
         Each request is independently routed, so different requests in
         the same batch can go to different providers.
 
+        When ``config.batch_threshold`` is set, direct-provider groups of
+        at least that many requests are sent through the provider's batch
+        API (currently Anthropic's Message Batches) instead of one HTTP
+        request each.  Batched requests bypass the response cache and the
+        per-request throttle; the remaining requests run as usual.
+
+        Requests run in one ``asyncio.TaskGroup``, so if any of them raises
+        the others are cancelled instead of running on to completion.
+
         Args:
             requests: List of keyword argument dicts for ``complete()``.
                 Each dict should contain at minimum ``alias_or_id`` and
@@ -310,6 +709,126 @@ class ProviderRouter:
         Returns:
             List of ``ModelResponse`` objects in the same order as
             *requests*.
+
+        Raises:
+            RuntimeError: If any request finished without recording a
+                response, which would otherwise misalign the results.
+        """
+        if not requests:
+            return []
+        batch_groups = self._plan_batches(requests)
+        batched = {i for indices in batch_groups.values() for i in indices}
+        results: list[ModelResponse | None] = [None] * len(requests)
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for i, req in enumerate(requests):
+                    if i not in batched:
+                        tg.create_task(self._complete_into(i, req, results))
+                for vendor, indices in batch_groups.items():
+                    tg.create_task(self._complete_batch_into(vendor, indices, requests, results))
+        except BaseExceptionGroup as group:
+            # Siblings are already cancelled; surface the first failure
+            # as-is so callers see the original exception type.
+            raise group.exceptions[0] from None
+
+        responses = [r for r in results if r is not None]
+        if len(responses) != len(results):
+            missing = [i for i, r in enumerate(results) if r is None]
+            raise RuntimeError(f"No response recorded for request(s) at index {missing}")
+        return responses
+
+    async def _complete_into(
+        self,
+        index: int,
+        request: dict[str, Any],
+        results: list[ModelResponse | None],
+    ) -> None:
+        """Complete one request and store the response at *index*.
+
+        Args:
+            index: Position of the request in the batch.
+            request: Keyword arguments for ``complete()``.
+            results: Preallocated result list, written in place.
         """
-        tasks = [self.complete(**req) for req in requests]
-        return list(await asyncio.gather(*tasks))
+        results[index] = await self.complete(**request)
+
+    async def _complete_batch_into(
+        self,
+        vendor_key: str,
+        indices: list[int],
+        requests: list[dict[str, Any]],
+        results: list[ModelResponse | None],
+    ) -> None:
+        """Send a batch group and store each response at its request index.
+
+        Args:
+            vendor_key: Direct vendor key with a batch-capable provider.
+            indices: Positions of the grouped requests in *requests*.
+            requests: All keyword argument dicts for ``complete()``.
+            results: Preallocated result list, written in place.
+        """
+        responses = await self._complete_batch(vendor_key, [requests[i] for i in indices])
+        for index, response in zip(indices, responses, strict=True):
+            results[index] = response
+
+    def _plan_batches(self, requests: list[dict[str, Any]]) -> dict[str, list[int]]:
+        """Group requests eligible for a provider batch API.
+
+        Args:
+            requests: Keyword argument dicts for ``complete()``.
+
+        Returns:
+            Mapping of direct vendor key to request indices, containing
+            only groups that meet ``config.batch_threshold``.  Empty when
+            batching is disabled.
+        """
+        threshold = self._config.batch_threshold
+        if threshold <= 0 or len(requests) < threshold:
+            return {}
+        groups: dict[str, list[int]] = {}
+        for i, req in enumerate(requests):
+            decision = self.route(req["alias_or_id"])
+            if decision.via_openrouter:
+                continue
+            vendor_key = decision.vendor.value
+            if isinstance(self._providers.get(vendor_key), AnthropicProvider):
+                groups.setdefault(vendor_key, []).append(i)
+        return {vendor: indices for vendor, indices in groups.items() if len(indices) >= threshold}
+
+    async def _complete_batch(
+        self,
+        vendor_key: str,
+        requests: list[dict[str, Any]],
+    ) -> list[ModelResponse]:
+        """Send a group of same-vendor requests through its batch API.
+
+        Args:
+            vendor_key: Direct vendor key with a batch-capable provider.
+            requests: Keyword argument dicts for ``complete()``.
+
+        Returns:
+            ``ModelResponse`` objects in the same order as *requests*.
+
+        Raises:
+            TypeError: If the vendor's provider has no batch API.
+        """
+        provider = self._providers[vendor_key]
+        if not isinstance(provider, AnthropicProvider):
+            raise TypeError(f"Provider for vendor '{vendor_key}' has no batch API")
+        batch_requests = [
+            {
+                "model_id": self._config.resolve_model(req["alias_or_id"], direct=True),
+                "messages": req.get("messages"),
+                "prompt": req.get("prompt"),
+                "model_alias": req.get("model_alias") or req["alias_or_id"],
+                "round_number": req.get("round_number", 0),
+            }
+            for req in requests
+        ]
+        responses = await provider.complete_batch(
+            batch_requests, batch_max_wait=self._config.batch_max_wait
+        )
+        for req, response in zip(requests, responses, strict=True):
+            response.routing = self.route(req["alias_or_id"]).to_dict()
+        return responses
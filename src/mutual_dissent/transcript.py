@@ -11,12 +11,17 @@ Example: 2026-02-21_a1b2c3d4.json
 from __future__ import annotations
 
 import json
-from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from mutual_dissent.config import TRANSCRIPT_DIR, ensure_dirs
-from mutual_dissent.models import DebateRound, DebateTranscript, ExperimentMetadata, ModelResponse
+from mutual_dissent.models import (
+    DebateRound,
+    DebateTranscript,
+    ExperimentMetadata,
+    ModelResponse,
+    parse_datetime,
+)
 
 
 def save_transcript(transcript: DebateTranscript) -> Path:
@@ -180,24 +185,6 @@ def _find_transcript_files(transcript_id: str) -> list[Path]:
     return matches
 
 
-def _parse_datetime(value: str | None) -> datetime:
-    """Parse an ISO 8601 timestamp string to a datetime.
-
-    Args:
-        value: ISO 8601 formatted timestamp string, or None.
-
-    Returns:
-        Parsed datetime object. Falls back to current UTC time if parsing
-        fails or the value is empty.
-    """
-    if not value:
-        return datetime.now(UTC)
-    try:
-        return datetime.fromisoformat(value)
-    except (ValueError, TypeError):
-        return datetime.now(UTC)
-
-
 def _parse_response(data: dict[str, Any]) -> ModelResponse:
     """Parse a dictionary into a ModelResponse dataclass.
 
@@ -210,21 +197,7 @@ def _parse_response(data: dict[str, Any]) -> ModelResponse:
     Returns:
         Fully populated ModelResponse instance.
     """
-    return ModelResponse(
-        model_id=data["model_id"],
-        model_alias=data["model_alias"],
-        round_number=data["round_number"],
-        content=data["content"],
-        timestamp=_parse_datetime(data.get("timestamp", "")),
-        token_count=data.get("token_count"),
-        input_tokens=data.get("input_tokens"),
-        output_tokens=data.get("output_tokens"),
-        latency_ms=data.get("latency_ms"),
-        error=data.get("error"),
-        role=data.get("role", ""),
-        routing=data.get("routing"),
-        analysis=data.get("analysis", {}),
-    )
+    return ModelResponse.from_dict(data)
 
 
 def _parse_transcript_file(filepath: Path) -> DebateTranscript:
@@ -272,7 +245,7 @@ def _parse_transcript_file(filepath: Path) -> DebateTranscript:
         max_rounds=data["max_rounds"],
         rounds=rounds,
         synthesis=synthesis,
-        created_at=_parse_datetime(data.get("created_at", "")),
+        created_at=parse_datetime(data.get("created_at", "")),
         metadata=metadata,
     )
     return transcript
@@ -8,6 +8,7 @@ reactivity.
 
 from __future__ import annotations
 
+import dataclasses
 import os
 from typing import Any
 
@@ -316,7 +317,7 @@ def _validate_form_state(
     return errors, warnings
 
 
-def _apply_form_to_config(state: dict[str, Any]) -> Config:
+def _apply_form_to_config(state: dict[str, Any], base: Config | None = None) -> Config:
     """Build a Config instance from the current form state.
 
     Translates the flat form state dictionary back into a fully
@@ -324,10 +325,16 @@ def _apply_form_to_config(state: dict[str, Any]) -> Config:
     included. The flat ``model_aliases`` dict is derived from the
     v2 aliases for backward compatibility.
 
+    Settings the form does not edit (cache, limits, batch) are carried
+    over from *base*, so saving the page does not reset values the user
+    set by hand in config.toml.
+
     Args:
         state: The current form state dict with keys ``panel``,
             ``synthesizer``, ``rounds``, ``providers``,
             ``routing``, and ``aliases``.
+        base: The loaded Config the form was populated from.  Defaults
+            to a fresh ``Config()``.
 
     Returns:
         A new Config instance reflecting the form state.
@@ -345,7 +352,8 @@ def _apply_form_to_config(state: dict[str, Any]) -> Config:
         alias: ids.get("openrouter", "") for alias, ids in v2_aliases.items()
     }
 
-    cfg = Config(
+    cfg = dataclasses.replace(
+        base or Config(),
         api_key=providers.get("openrouter", ""),
         providers=providers,
         routing=dict(state.get("routing", {"default_mode": "auto"})),
@@ -358,7 +366,7 @@ def _apply_form_to_config(state: dict[str, Any]) -> Config:
     return cfg
 
 
-async def _handle_save(state: dict[str, Any]) -> None:
+async def _handle_save(state: dict[str, Any], base: Config) -> None:
     """Validate form state and write configuration to disk.
 
     Runs validation first. If errors are found, shows a negative
@@ -368,6 +376,7 @@ async def _handle_save(state: dict[str, Any]) -> None:
 
     Args:
         state: The current form state dict.
+        base: The loaded Config the form was populated from.
     """
     errors, warnings = _validate_form_state(state)
 
@@ -386,7 +395,7 @@ async def _handle_save(state: dict[str, Any]) -> None:
         if source == "env"
     }
 
-    cfg = _apply_form_to_config(state)
+    cfg = _apply_form_to_config(state, base)
     write_config(cfg, env_providers=env_providers)
     ui.notify("Configuration saved.", type="positive")
 
@@ -394,6 +403,7 @@ async def _handle_save(state: dict[str, Any]) -> None:
 async def _handle_test_providers(
     state: dict[str, Any],
     results_container: ui.column,
+    base: Config,
 ) -> None:
     """Test provider connectivity using the current form state.
 
@@ -406,12 +416,13 @@ async def _handle_test_providers(
     Args:
         state: The current form state dict.
         results_container: NiceGUI column to render test results into.
+        base: The loaded Config the form was populated from.
     """
     from mutual_dissent.cli import _run_config_test
 
     results_container.clear()
 
-    cfg = _apply_form_to_config(state)
+    cfg = _apply_form_to_config(state, base)
 
     # Collect unique aliases: panel + synthesizer.
     panel = list(state.get("panel", []))
@@ -508,12 +519,12 @@ def render() -> None:
             ui.button(
                 "Save",
                 icon="save",
-                on_click=lambda: _handle_save(state),
+                on_click=lambda: _handle_save(state, config),
             ).props("color=emerald")
             ui.button(
                 "Test Providers",
                 icon="science",
-                on_click=lambda: _handle_test_providers(state, test_results),
+                on_click=lambda: _handle_test_providers(state, test_results, config),
             ).props("outline color=emerald")
 
         # Results container placed after buttons — the lambda captures the
@@ -0,0 +1,79 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+import dataclasses
+import re
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+import pytest
+
+from mutual_dissent import display
+from mutual_dissent.config import Config
+
+# CSI escape sequences, present when the console detects a colour terminal.
+_ANSI = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+
+
+@contextmanager
+def _capture_display() -> Iterator[Callable[[], str]]:
+    """Capture ``mutual_dissent.display`` output in the module console itself.
+
+    Uses the console's own capture buffer, so no replacement Console is
+    built.  The width is pinned so tables wrap the same in every terminal.
+    The private ``_width`` is patched rather than the ``width`` property,
+    so an auto-detected width (``_width is None``) is restored as such
+    instead of being frozen at whatever the terminal reported.
+
+    Yields:
+        A callable that ends the capture and returns the output with ANSI
+        escapes stripped.  Later calls return the same text.
+    """
+    console = display.console
+    captured: list[str] = []
+
+    def read() -> str:
+        if not captured:
+            captured.append(_ANSI.sub("", console.end_capture()))
+        return captured[0]
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(console, "_width", 120)
+        console.begin_capture()
+        try:
+            yield read
+        finally:
+            if not captured:
+                console.end_capture()
+
+
+@pytest.fixture
+def captured_console() -> Iterator[Callable[[], str]]:
+    """Capture display output for one test; see ``_capture_display``."""
+    with _capture_display() as read:
+        yield read
+
+
+@pytest.fixture(scope="session")
+def default_config() -> Config:
+    """A default ``Config`` shared across the session.
+
+    Treat it as read-only; tests that need to change fields should work
+    on a copy.
+    """
+    return Config()
+
+
+@pytest.fixture
+def empty_providers_config(default_config: Config) -> Config:
+    """``default_config`` with no provider keys configured."""
+    return dataclasses.replace(default_config, providers={})
+
+
+@pytest.fixture(scope="module")
+def default_rendered_config(default_config: Config) -> str:
+    """``render_config_show(default_config)`` output, rendered once per module."""
+    with _capture_display() as read:
+        display.render_config_show(default_config)
+        return read()
@@ -4,25 +4,39 @@ Covers: construction validation, system message extraction (none, single,
 multiple), mocked complete() with prompt and messages, timeout handling,
 HTTP error handling, malformed response handling, content block extraction
 (single text, multiple text blocks, no text blocks), token count computation,
-and async context manager lifecycle.
+prompt-cache marking and usage extraction, rate-limit retries, Message
+Batches submission, and async context manager lifecycle.
 """
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import sys
+from collections.abc import AsyncIterator
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import httpx
+import orjson
 import pytest
 
 from mutual_dissent.models import ModelResponse
+from mutual_dissent.prompts import format_reflection
+from mutual_dissent.providers import anthropic as anthropic_mod
 from mutual_dissent.providers.anthropic import (
     ANTHROPIC_API_URL,
+    ANTHROPIC_BATCHES_URL,
     ANTHROPIC_VERSION,
+    RETRY_MAX_DELAY,
     AnthropicProvider,
+    _apply_cache_control,
+    _extract_cache_tokens,
     _extract_content,
     _extract_system,
     _extract_token_count,
+    _MessageStream,
+    _StreamError,
 )
 
 # ---------------------------------------------------------------------------
@@ -100,6 +114,36 @@ class TestAsyncContextManager:
             assert headers["x-api-key"] == "sk-ant-test"
             assert headers["anthropic-version"] == ANTHROPIC_VERSION
             assert headers["content-type"] == "application/json"
+            assert "gzip" in headers["accept-encoding"]
+
+    @pytest.mark.asyncio
+    async def test_client_config_reused_across_entries(self) -> None:
+        """Headers and timeout are built once, not per context entry."""
+        provider = AnthropicProvider(api_key="sk-ant-test", timeout=30.0)
+        async with provider:
+            assert provider._client is not None
+            first_timeout = provider._client.timeout
+        async with provider:
+            assert provider._client is not None
+            assert provider._client.timeout == first_timeout == httpx.Timeout(30.0)
+
+    @pytest.mark.asyncio
+    async def test_http_version_logged_once(self, caplog: pytest.LogCaptureFixture) -> None:
+        """The negotiated HTTP version is logged on the first response only."""
+        provider = AnthropicProvider(api_key="sk-ant-test")
+        async with provider:
+            assert provider._client is not None
+            resp = _mock_anthropic_success()
+            resp.http_version = "HTTP/2"
+            provider._client.send = AsyncMock(return_value=resp)
+
+            with caplog.at_level(logging.DEBUG, logger="mutual_dissent.providers.anthropic"):
+                await provider.complete("claude-sonnet-4-6", prompt="Hello")
+                await provider.complete("claude-sonnet-4-6", prompt="Hello")
+
+        negotiated = [r for r in caplog.records if "negotiated" in r.getMessage()]
+        assert len(negotiated) == 1
+        assert "HTTP/2" in negotiated[0].getMessage()
 
 
 # ---------------------------------------------------------------------------
@@ -155,6 +199,117 @@ class TestExtractSystem:
         assert system_text is None
         assert remaining == []
 
+    def test_no_system_returns_input_list(self) -> None:
+        """Without system messages the input list is returned as-is."""
+        messages = [{"role": "user", "content": "Hello"}]
+        _, remaining = _extract_system(messages)
+        assert remaining is messages
+
+
+# ---------------------------------------------------------------------------
+# Prompt caching
+# ---------------------------------------------------------------------------
+
+
+class TestApplyCacheControl:
+    """_apply_cache_control() marks stable prefixes for prompt caching."""
+
+    def test_initial_round_short_system_stays_string(self) -> None:
+        system, _ = _apply_cache_control("Be helpful.", [], 0)
+        assert system == "Be helpful."
+
+    def test_reflection_round_system_cached(self) -> None:
+        system, _ = _apply_cache_control("Be helpful.", [], 1)
+        assert system == [
+            {"type": "text", "text": "Be helpful.", "cache_control": {"type": "ephemeral"}},
+        ]
+
+    def test_synthesis_round_system_cached(self) -> None:
+        system, _ = _apply_cache_control("Be helpful.", [], -1)
+        assert isinstance(system, list)
+
+    def test_long_system_cached_in_initial_round(self) -> None:
+        system, _ = _apply_cache_control("x" * 5000, [], 0)
+        assert isinstance(system, list)
+        assert system[0]["cache_control"] == {"type": "ephemeral"}
+
+    def test_no_system(self) -> None:
+        system, _ = _apply_cache_control(None, [], 2)
+        assert system is None
+
+    def test_single_user_turn_not_marked(self) -> None:
+        messages = [{"role": "user", "content": "Hello"}]
+        _, result = _apply_cache_control(None, messages, 1)
+        assert result == [{"role": "user", "content": "Hello"}]
+
+    def test_prior_user_turn_marked(self) -> None:
+        messages = [
+            {"role": "user", "content": "Round 0 transcript"},
+            {"role": "assistant", "content": "Reply"},
+            {"role": "user", "content": "Newest turn"},
+        ]
+        _, result = _apply_cache_control(None, messages, 1)
+        assert result[0]["content"] == [
+            {
+                "type": "text",
+                "text": "Round 0 transcript",
+                "cache_control": {"type": "ephemeral"},
+            },
+        ]
+        assert result[1] == {"role": "assistant", "content": "Reply"}
+        assert result[2] == {"role": "user", "content": "Newest turn"}
+
+    def test_block_content_marks_last_block(self) -> None:
+        messages = [
+            {
+                "role": "user",
+                "content": [{"type": "text", "text": "a"}, {"type": "text", "text": "b"}],
+            },
+            {"role": "user", "content": "Newest turn"},
+        ]
+        _, result = _apply_cache_control(None, messages, 1)
+        assert "cache_control" not in result[0]["content"][0]
+        assert result[0]["content"][1]["cache_control"] == {"type": "ephemeral"}
+
+    def test_input_not_mutated(self) -> None:
+        messages = [
+            {"role": "user", "content": "First"},
+            {"role": "user", "content": "Second"},
+        ]
+        _apply_cache_control(None, messages, 1)
+        assert messages[0] == {"role": "user", "content": "First"}
+
+    @pytest.mark.parametrize("round_number", [0, 1, -1])
+    def test_prompt_shortcut_matches_full_passes(self, round_number: int) -> None:
+        """The prompt_only early return builds the same payload as both passes."""
+        provider = AnthropicProvider(api_key="sk-ant-test")
+        messages = [{"role": "user", "content": "Hello"}]
+        assert provider._build_payload(
+            "claude-sonnet-4-6", messages, round_number, prompt_only=True
+        ) == provider._build_payload("claude-sonnet-4-6", messages, round_number)
+
+
+class TestExtractCacheTokens:
+    """_extract_cache_tokens() reads prompt-cache usage counters."""
+
+    def test_both_fields_present(self) -> None:
+        data = {
+            "usage": {
+                "input_tokens": 12,
+                "output_tokens": 6,
+                "cache_creation_input_tokens": 100,
+                "cache_read_input_tokens": 2000,
+            },
+        }
+        assert _extract_cache_tokens(data) == (100, 2000)
+
+    def test_missing_usage(self) -> None:
+        assert _extract_cache_tokens({}) == (None, None)
+
+    def test_fields_absent(self) -> None:
+        data = {"usage": {"input_tokens": 12, "output_tokens": 6}}
+        assert _extract_cache_tokens(data) == (None, None)
+
 
 # ---------------------------------------------------------------------------
 # Content block extraction
@@ -199,6 +354,16 @@ class TestExtractContent:
         data = {"content": []}
         assert _extract_content(data) == "[No text content in response]"
 
+    def test_single_empty_text_block(self) -> None:
+        data = {"content": [{"type": "text", "text": ""}]}
+        assert _extract_content(data) == ""
+
+    def test_null_content(self) -> None:
+        assert "Failed to parse" in _extract_content({"content": None})
+
+    def test_non_dict_block(self) -> None:
+        assert "Failed to parse" in _extract_content({"content": ["raw string"]})
+
 
 # ---------------------------------------------------------------------------
 # Token count extraction
@@ -229,22 +394,91 @@ class TestExtractTokenCount:
 # ---------------------------------------------------------------------------
 
 
-def _mock_anthropic_success() -> httpx.Response:
-    """Build a mock httpx.Response for a successful Anthropic completion."""
+def _sse_lines(message: dict[str, Any]) -> list[str]:
+    """Encode a Messages API response as the lines of its SSE stream.
+
+    Text blocks are split across two deltas so tests exercise joining.
+    """
+    events: list[dict[str, Any]] = []
+    usage = dict(message.get("usage", {}))
+    output_tokens = usage.pop("output_tokens", None)
+    start = {k: v for k, v in message.items() if k not in ("content", "stop_reason")}
+    events.append({"type": "message_start", "message": {**start, "content": [], "usage": usage}})
+    for index, block in enumerate(message.get("content", [])):
+        if block.get("type") == "text":
+            text = block["text"]
+            half = len(text) // 2
+            events.append(
+                {
+                    "type": "content_block_start",
+                    "index": index,
+                    "content_block": {"type": "text", "text": ""},
+                }
+            )
+            for part in (text[:half], text[half:]):
+                events.append(
+                    {
+                        "type": "content_block_delta",
+                        "index": index,
+                        "delta": {"type": "text_delta", "text": part},
+                    }
+                )
+        else:
+            events.append({"type": "content_block_start", "index": index, "content_block": block})
+        events.append({"type": "content_block_stop", "index": index})
+    events.append(
+        {
+            "type": "message_delta",
+            "delta": {"stop_reason": message.get("stop_reason")},
+            "usage": {"output_tokens": output_tokens},
+        }
+    )
+    events.append({"type": "message_stop"})
+
+    lines: list[str] = []
+    for event in events:
+        lines += [f"event: {event['type']}", f"data: {orjson.dumps(event).decode()}", ""]
+    return lines
+
+
+def _mock_stream(lines: list[str]) -> httpx.Response:
+    """Build a mock streaming httpx.Response that yields *lines*."""
+
+    async def aiter_lines() -> AsyncIterator[str]:
+        for line in lines:
+            yield line
+
     resp = MagicMock(spec=httpx.Response)
     resp.status_code = 200
-    resp.json.return_value = {
-        "id": "msg_test123",
-        "type": "message",
-        "role": "assistant",
-        "content": [{"type": "text", "text": "Hello back!"}],
-        "model": "claude-sonnet-4-6",
-        "stop_reason": "end_turn",
-        "usage": {"input_tokens": 12, "output_tokens": 6},
-    }
+    resp.aiter_lines = MagicMock(side_effect=aiter_lines)
     return resp
 
 
+def _mock_anthropic_success(**usage: int) -> httpx.Response:
+    """Build a mock streamed httpx.Response for a successful completion.
+
+    Keyword arguments are merged into the ``usage`` block.
+    """
+    return _mock_stream(
+        _sse_lines(
+            {
+                "id": "msg_test123",
+                "type": "message",
+                "role": "assistant",
+                "content": [{"type": "text", "text": "Hello back!"}],
+                "model": "claude-sonnet-4-6",
+                "stop_reason": "end_turn",
+                "usage": {"input_tokens": 12, "output_tokens": 6, **usage},
+            }
+        )
+    )
+
+
+def _sent_payload(mock_send: AsyncMock) -> Any:
+    """Decode the JSON body of the request passed to a mocked ``client.send``."""
+    return orjson.loads(mock_send.call_args.args[0].content)
+
+
 # ---------------------------------------------------------------------------
 # Mocked complete() — prompt path
 # ---------------------------------------------------------------------------
@@ -262,7 +496,7 @@ class TestCompleteWithPrompt:
         provider = AnthropicProvider(api_key="sk-ant-test")
         async with provider:
             assert provider._client is not None
-            provider._client.post = AsyncMock(return_value=_mock_anthropic_success())
+            provider._client.send = AsyncMock(return_value=_mock_anthropic_success())
 
             result = await provider.complete(
                 "claude-sonnet-4-6",
@@ -286,13 +520,12 @@ class TestCompleteWithPrompt:
         provider = AnthropicProvider(api_key="sk-ant-test")
         async with provider:
             assert provider._client is not None
-            mock_post = AsyncMock(return_value=_mock_anthropic_success())
-            provider._client.post = mock_post
+            mock_send = AsyncMock(return_value=_mock_anthropic_success())
+            provider._client.send = mock_send
 
             await provider.complete("claude-sonnet-4-6", prompt="Test prompt")
 
-            call_kwargs = mock_post.call_args
-            payload = call_kwargs.kwargs.get("json") or call_kwargs[1].get("json")
+            payload = _sent_payload(mock_send)
             assert payload["messages"] == [{"role": "user", "content": "Test prompt"}]
 
     @pytest.mark.asyncio
@@ -301,22 +534,60 @@ class TestCompleteWithPrompt:
         provider = AnthropicProvider(api_key="sk-ant-test", max_tokens=2048)
         async with provider:
             assert provider._client is not None
-            mock_post = AsyncMock(return_value=_mock_anthropic_success())
-            provider._client.post = mock_post
+            mock_send = AsyncMock(return_value=_mock_anthropic_success())
+            provider._client.send = mock_send
 
             await provider.complete("claude-sonnet-4-6", prompt="Hello")
 
-            call_kwargs = mock_post.call_args
-            payload = call_kwargs.kwargs.get("json") or call_kwargs[1].get("json")
+            payload = _sent_payload(mock_send)
             assert payload["max_tokens"] == 2048
 
+    @pytest.mark.asyncio
+    async def test_prompt_payload_has_exact_keys(self) -> None:
+        """Prompt requests skip system hoisting and cache marking."""
+        provider = AnthropicProvider(api_key="sk-ant-test")
+        async with provider:
+            assert provider._client is not None
+            mock_send = AsyncMock(return_value=_mock_anthropic_success())
+            provider._client.send = mock_send
+
+            await provider.complete("claude-sonnet-4-6", prompt="Hello", round_number=2)
+
+            payload = _sent_payload(mock_send)
+            assert payload == {
+                "model": "claude-sonnet-4-6",
+                "max_tokens": provider._max_tokens,
+                "messages": [{"role": "user", "content": "Hello"}],
+                "stream": True,
+            }
+            assert provider._payload_base["model"] is None
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_reflection_prompt_unmarked(self) -> None:
+        """Reflection rounds arrive as ``prompt=`` and carry no breakpoints."""
+        prompt = format_reflection("What is 2+2?", "4", [("gpt", "Four")])
+        provider = AnthropicProvider(api_key="sk-ant-test")
+        async with provider:
+            assert provider._client is not None
+            mock_send = AsyncMock(return_value=_mock_anthropic_success())
+            provider._client.send = mock_send
+
+            await provider.complete(
+                "claude-sonnet-4-6", prompt=prompt, model_alias="claude", round_number=1
+            )
+
+            payload = _sent_payload(mock_send)
+            assert "system" not in payload
+            assert payload["messages"] == [{"role": "user", "content": prompt}]
+            assert "cache_control" not in mock_send.call_args.args[0].content.decode()
+
     @pytest.mark.asyncio
     async def test_default_alias_is_model_id(self) -> None:
         """model_alias defaults to the full model_id (no slash splitting)."""
         provider = AnthropicProvider(api_key="sk-ant-test")
         async with provider:
             assert provider._client is not None
-            provider._client.post = AsyncMock(return_value=_mock_anthropic_success())
+            provider._client.send = AsyncMock(return_value=_mock_anthropic_success())
 
             result = await provider.complete(
                 "claude-sonnet-4-6",
@@ -331,14 +602,15 @@ class TestCompleteWithPrompt:
         provider = AnthropicProvider(api_key="sk-ant-test")
         async with provider:
             assert provider._client is not None
-            mock_post = AsyncMock(return_value=_mock_anthropic_success())
-            provider._client.post = mock_post
+            mock_send = AsyncMock(return_value=_mock_anthropic_success())
+            provider._client.send = mock_send
 
             await provider.complete("claude-sonnet-4-6", prompt="Hello")
 
-            call_args = mock_post.call_args
-            url = call_args.args[0] if call_args.args else call_args[0][0]
-            assert url == ANTHROPIC_API_URL
+            request = mock_send.call_args.args[0]
+            assert request.method == "POST"
+            assert str(request.url) == ANTHROPIC_API_URL
+            assert mock_send.call_args.kwargs["stream"] is True
 
 
 # ---------------------------------------------------------------------------
@@ -363,8 +635,8 @@ class TestCompleteWithMessages:
         ]
         async with provider:
             assert provider._client is not None
-            mock_post = AsyncMock(return_value=_mock_anthropic_success())
-            provider._client.post = mock_post
+            mock_send = AsyncMock(return_value=_mock_anthropic_success())
+            provider._client.send = mock_send
 
             await provider.complete(
                 "claude-sonnet-4-6",
@@ -372,8 +644,7 @@ class TestCompleteWithMessages:
                 model_alias="claude",
             )
 
-            call_kwargs = mock_post.call_args
-            payload = call_kwargs.kwargs.get("json") or call_kwargs[1].get("json")
+            payload = _sent_payload(mock_send)
             assert payload["system"] == "Be helpful."
             assert payload["messages"] == [{"role": "user", "content": "Hello"}]
 
@@ -384,19 +655,53 @@ class TestCompleteWithMessages:
         messages = [{"role": "user", "content": "Hello"}]
         async with provider:
             assert provider._client is not None
-            mock_post = AsyncMock(return_value=_mock_anthropic_success())
-            provider._client.post = mock_post
+            mock_send = AsyncMock(return_value=_mock_anthropic_success())
+            provider._client.send = mock_send
 
             await provider.complete(
                 "claude-sonnet-4-6",
                 messages=messages,
             )
 
-            call_kwargs = mock_post.call_args
-            payload = call_kwargs.kwargs.get("json") or call_kwargs[1].get("json")
+            payload = _sent_payload(mock_send)
             assert "system" not in payload
             assert payload["messages"] == [{"role": "user", "content": "Hello"}]
 
+    @pytest.mark.asyncio
+    async def test_reflection_round_system_cached(self) -> None:
+        """Reflection-round system prompts are sent as cached blocks."""
+        provider = AnthropicProvider(api_key="sk-ant-test")
+        messages = [
+            {"role": "system", "content": "Be helpful."},
+            {"role": "user", "content": "Hello"},
+        ]
+        async with provider:
+            assert provider._client is not None
+            mock_send = AsyncMock(return_value=_mock_anthropic_success())
+            provider._client.send = mock_send
+
+            await provider.complete("claude-sonnet-4-6", messages=messages, round_number=1)
+
+            payload = _sent_payload(mock_send)
+            assert payload["system"][0]["cache_control"] == {"type": "ephemeral"}
+
+    @pytest.mark.asyncio
+    async def test_cache_usage_surfaced(self) -> None:
+        """Prompt-cache token counts land on the ModelResponse."""
+        resp = _mock_anthropic_success(
+            cache_creation_input_tokens=50,
+            cache_read_input_tokens=900,
+        )
+        provider = AnthropicProvider(api_key="sk-ant-test")
+        async with provider:
+            assert provider._client is not None
+            provider._client.send = AsyncMock(return_value=resp)
+
+            result = await provider.complete("claude-sonnet-4-6", prompt="Hello")
+
+        assert result.cache_creation_input_tokens == 50
+        assert result.cache_read_input_tokens == 900
+
     @pytest.mark.asyncio
     async def test_both_messages_and_prompt_raises(self) -> None:
         provider = AnthropicProvider(api_key="sk-ant-test")
@@ -433,7 +738,7 @@ class TestErrorHandling:
         provider = AnthropicProvider(api_key="sk-ant-test", timeout=5.0)
         async with provider:
             assert provider._client is not None
-            provider._client.post = AsyncMock(
+            provider._client.send = AsyncMock(
                 side_effect=httpx.TimeoutException("timed out"),
             )
 
@@ -452,18 +757,20 @@ class TestErrorHandling:
     async def test_http_error_returns_error_response(self) -> None:
         error_resp = MagicMock(spec=httpx.Response)
         error_resp.status_code = 400
-        error_resp.json.return_value = {
-            "type": "error",
-            "error": {
-                "type": "invalid_request_error",
-                "message": "max_tokens: 100001 > 64000",
-            },
-        }
+        error_resp.content = orjson.dumps(
+            {
+                "type": "error",
+                "error": {
+                    "type": "invalid_request_error",
+                    "message": "max_tokens: 100001 > 64000",
+                },
+            }
+        )
 
         provider = AnthropicProvider(api_key="sk-ant-test")
         async with provider:
             assert provider._client is not None
-            provider._client.post = AsyncMock(return_value=error_resp)
+            provider._client.send = AsyncMock(return_value=error_resp)
 
             result = await provider.complete(
                 "claude-sonnet-4-6",
@@ -482,7 +789,7 @@ class TestErrorHandling:
         provider = AnthropicProvider(api_key="sk-ant-test")
         async with provider:
             assert provider._client is not None
-            provider._client.post = AsyncMock(
+            provider._client.send = AsyncMock(
                 side_effect=httpx.ConnectError("Connection refused"),
             )
 
@@ -503,7 +810,7 @@ class TestErrorHandling:
         provider = AnthropicProvider(api_key="sk-ant-test")
         async with provider:
             assert provider._client is not None
-            provider._client.post = AsyncMock(
+            provider._client.send = AsyncMock(
                 side_effect=httpx.ReadError("Connection reset"),
             )
 
@@ -520,23 +827,21 @@ class TestErrorHandling:
 
     @pytest.mark.asyncio
     async def test_malformed_response_body(self) -> None:
-        """Response with unexpected structure still returns a ModelResponse."""
-        resp = MagicMock(spec=httpx.Response)
-        resp.status_code = 200
-        resp.json.return_value = {"unexpected": "data"}
+        """A stream with no message events is reported as truncated."""
+        resp = _mock_stream(["event: ping", 'data: {"type": "ping"}', ""])
 
         provider = AnthropicProvider(api_key="sk-ant-test")
         async with provider:
             assert provider._client is not None
-            provider._client.post = AsyncMock(return_value=resp)
+            provider._client.send = AsyncMock(return_value=resp)
 
             result = await provider.complete(
                 "claude-sonnet-4-6",
                 prompt="Hello",
             )
 
-        assert "Failed to parse" in result.content
-        assert result.error is None
+        assert result.content == ""
+        assert result.error == "Stream error: stream ended before message_stop"
         assert result.token_count is None
 
     @pytest.mark.asyncio
@@ -544,13 +849,12 @@ class TestErrorHandling:
         """Non-JSON error response falls back to text body."""
         error_resp = MagicMock(spec=httpx.Response)
         error_resp.status_code = 502
-        error_resp.json.side_effect = ValueError("not json")
-        error_resp.text = "Bad Gateway"
+        error_resp.content = b"Bad Gateway"
 
         provider = AnthropicProvider(api_key="sk-ant-test")
         async with provider:
             assert provider._client is not None
-            provider._client.post = AsyncMock(return_value=error_resp)
+            provider._client.send = AsyncMock(return_value=error_resp)
 
             result = await provider.complete(
                 "claude-sonnet-4-6",
@@ -562,6 +866,562 @@ class TestErrorHandling:
         assert "Bad Gateway" in result.error
 
 
+# ---------------------------------------------------------------------------
+# Streaming
+# ---------------------------------------------------------------------------
+
+
+class TestMessageStream:
+    """_MessageStream assembles stream events into a message dict."""
+
+    def test_roundtrip_matches_message(self) -> None:
+        message = {
+            "id": "msg_1",
+            "content": [
+                {"type": "thinking", "thinking": "..."},
+                {"type": "text", "text": "Hello there"},
+            ],
+            "stop_reason": "end_turn",
+            "usage": {"input_tokens": 5, "output_tokens": 3, "cache_read_input_tokens": 2},
+        }
+        stream = _MessageStream()
+        for line in _sse_lines(message):
+            if line.startswith("data:"):
+                stream.feed(orjson.loads(line[5:]))
+        assembled = stream.message()
+        assert assembled["content"] == message["content"]
+        assert assembled["usage"] == message["usage"]
+        assert assembled["stop_reason"] == "end_turn"
+
+    def test_null_delta_usage_keeps_start_counts(self) -> None:
+        stream = _MessageStream()
+        stream.feed(
+            {
+                "type": "message_start",
+                "message": {"content": [], "usage": {"input_tokens": 12, "output_tokens": 1}},
+            }
+        )
+        stream.feed(
+            {
+                "type": "message_delta",
+                "delta": {"stop_reason": "end_turn"},
+                "usage": {
+                    "input_tokens": None,
+                    "cache_read_input_tokens": None,
+                    "output_tokens": 6,
+                },
+            }
+        )
+        stream.feed({"type": "message_stop"})
+        assert stream.message()["usage"] == {"input_tokens": 12, "output_tokens": 6}
+
+    def test_unknown_events_ignored(self) -> None:
+        stream = _MessageStream()
+        stream.feed({"type": "ping"})
+        stream.feed({"type": "message_stop"})
+        assert stream.message() == {"content": [], "usage": {}}
+
+    def test_truncated_stream_raises(self) -> None:
+        stream = _MessageStream()
+        stream.feed({"type": "message_start", "message": {"content": [], "usage": {}}})
+        stream.feed(
+            {
+                "type": "content_block_start",
+                "index": 0,
+                "content_block": {"type": "text", "text": ""},
+            }
+        )
+        stream.feed(
+            {
+                "type": "content_block_delta",
+                "index": 0,
+                "delta": {"type": "text_delta", "text": "Partial"},
+            }
+        )
+        with pytest.raises(_StreamError, match="before message_stop"):
+            stream.message()
+
+    def test_error_event_raises(self) -> None:
+        stream = _MessageStream()
+        with pytest.raises(_StreamError, match="Overloaded"):
+            stream.feed(
+                {"type": "error", "error": {"type": "overloaded_error", "message": "Overloaded"}}
+            )
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="Slow asyncio overhead on Windows — validated on Ubuntu CI",
+)
+class TestCompleteStreaming:
+    """complete() streams the response and closes it afterwards."""
+
+    @pytest.mark.asyncio
+    async def test_response_closed(self) -> None:
+        resp = _mock_anthropic_success()
+        provider = AnthropicProvider(api_key="sk-ant-test")
+        async with provider:
+            assert provider._client is not None
+            provider._client.send = AsyncMock(return_value=resp)
+
+            result = await provider.complete("claude-sonnet-4-6", prompt="Hello")
+
+        assert result.content == "Hello back!"
+        resp.aclose.assert_awaited_once()  # type: ignore[attr-defined]
+
+    @pytest.mark.asyncio
+    async def test_timings_split_ttfb_and_body(self) -> None:
+        provider = AnthropicProvider(api_key="sk-ant-test")
+        async with provider:
+            assert provider._client is not None
+            provider._client.send = AsyncMock(return_value=_mock_anthropic_success())
+
+            result = await provider.complete("claude-sonnet-4-6", prompt="Hello")
+
+        assert result.timings is not None
+        assert result.timings.queue_ms == 0
+        assert result.timings.ttfb_ms is not None
+        assert result.timings.body_ms is not None
+        assert result.timings.total_ms == result.latency_ms
+
+    @pytest.mark.asyncio
+    async def test_null_delta_usage(self) -> None:
+        """A message_delta repeating input_tokens as null does not break parsing."""
+        lines = _sse_lines(
+            {
+                "content": [{"type": "text", "text": "Hello back!"}],
+                "stop_reason": "end_turn",
+                "usage": {"input_tokens": 12, "output_tokens": 6},
+            }
+        )
+        lines = [
+            line.replace(
+                '"usage":{"output_tokens":6}', '"usage":{"input_tokens":null,"output_tokens":6}'
+            )
+            for line in lines
+        ]
+        provider = AnthropicProvider(api_key="sk-ant-test")
+        async with provider:
+            assert provider._client is not None
+            provider._client.send = AsyncMock(return_value=_mock_stream(lines))
+
+            result = await provider.complete("claude-sonnet-4-6", prompt="Hello")
+
+        assert result.error is None
+        assert result.input_tokens == 12
+        assert result.output_tokens == 6
+        assert result.token_count == 18
+
+    @pytest.mark.asyncio
+    async def test_stream_cut_before_message_stop_is_error(self) -> None:
+        """A stream ending early is an error, not a successful partial reply."""
+        lines = _sse_lines({"content": [{"type": "text", "text": "Hello back!"}], "usage": {}})
+        lines = [line for line in lines if "message_stop" not in line]
+        provider = AnthropicProvider(api_key="sk-ant-test")
+        async with provider:
+            assert provider._client is not None
+            provider._client.send = AsyncMock(return_value=_mock_stream(lines))
+
+            result = await provider.complete("claude-sonnet-4-6", prompt="Hello")
+
+        assert result.error == "Stream error: stream ended before message_stop"
+        assert result.content == ""
+
+    @pytest.mark.asyncio
+    async def test_mid_stream_error_event(self) -> None:
+        error = {"type": "error", "error": {"type": "overloaded_error", "message": "Overloaded"}}
+        resp = _mock_stream(["event: error", f"data: {orjson.dumps(error).decode()}", ""])
+        provider = AnthropicProvider(api_key="sk-ant-test")
+        async with provider:
+            assert provider._client is not None
+            provider._client.send = AsyncMock(return_value=resp)
+
+            result = await provider.complete("claude-sonnet-4-6", prompt="Hello")
+
+        assert result.error == "Stream error: Overloaded"
+        assert result.content == ""
+
+    @pytest.mark.asyncio
+    async def test_undecodable_event(self) -> None:
+        resp = _mock_stream(["event: message_start", "data: {not json", ""])
+        provider = AnthropicProvider(api_key="sk-ant-test")
+        async with provider:
+            assert provider._client is not None
+            provider._client.send = AsyncMock(return_value=resp)
+
+            result = await provider.complete("claude-sonnet-4-6", prompt="Hello")
+
+        assert result.error is not None
+        assert result.error.startswith("Stream error: Malformed event")
+
+    @pytest.mark.asyncio
+    async def test_retryable_response_closed_before_retry(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        async def fake_sleep(delay: float) -> None:
+            return None
+
+        monkeypatch.setattr(anthropic_mod.asyncio, "sleep", fake_sleep)
+        busy = _mock_status(529)
+        provider = AnthropicProvider(api_key="sk-ant-test")
+        async with provider:
+            assert provider._client is not None
+            provider._client.send = AsyncMock(side_effect=[busy, _mock_anthropic_success()])
+
+            result = await provider.complete("claude-sonnet-4-6", prompt="Hello")
+
+        assert result.error is None
+        busy.aclose.assert_awaited_once()  # type: ignore[attr-defined]
+
+
+# ---------------------------------------------------------------------------
+# Rate-limit retries
+# ---------------------------------------------------------------------------
+
+
+def _mock_status(status_code: int, headers: dict[str, str] | None = None) -> httpx.Response:
+    """Build a mock error httpx.Response with the given status and headers."""
+    resp = MagicMock(spec=httpx.Response)
+    resp.status_code = status_code
+    resp.headers = httpx.Headers(headers or {})
+    resp.content = orjson.dumps(
+        {
+            "type": "error",
+            "error": {"type": "rate_limit_error", "message": "Slow down"},
+        }
+    )
+    return resp
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="Slow asyncio overhead on Windows — validated on Ubuntu CI",
+)
+class TestRetry:
+    """AnthropicProvider.complete() retries 429/503/529 with backoff."""
+
+    @pytest.fixture()
+    def sleeps(self, monkeypatch: pytest.MonkeyPatch) -> list[float]:
+        recorded: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            recorded.append(delay)
+
+        monkeypatch.setattr(anthropic_mod.asyncio, "sleep", fake_sleep)
+        return recorded
+
+    @pytest.mark.asyncio
+    async def test_retries_then_succeeds(self, sleeps: list[float]) -> None:
+        provider = AnthropicProvider(api_key="sk-ant-test")
+        async with provider:
+            assert provider._client is not None
+            mock_send = AsyncMock(
+                side_effect=[_mock_status(429), _mock_status(503), _mock_anthropic_success()],
+            )
+            provider._client.send = mock_send
+
+            result = await provider.complete("claude-sonnet-4-6", prompt="Hello")
+
+        assert result.error is None
+        assert result.content == "Hello back!"
+        assert mock_send.call_count == 3
+        assert sleeps == [1.0, 2.0]
+
+    @pytest.mark.asyncio
+    async def test_retries_take_rate_limit_slots(self, sleeps: list[float]) -> None:
+        limiter = MagicMock()
+        limiter.acquire = AsyncMock()
+        provider = AnthropicProvider(api_key="sk-ant-test", rate_limiter=limiter)
+        async with provider:
+            assert provider._client is not None
+            provider._client.send = AsyncMock(
+                side_effect=[_mock_status(429), _mock_status(529), _mock_anthropic_success()],
+            )
+
+            await provider.complete("claude-sonnet-4-6", prompt="Hello")
+
+        # The first attempt is throttled by the caller; each retry takes a slot.
+        assert limiter.acquire.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_honors_retry_after(self, sleeps: list[float]) -> None:
+        provider = AnthropicProvider(api_key="sk-ant-test")
+        async with provider:
+            assert provider._client is not None
+            provider._client.send = AsyncMock(
+                side_effect=[_mock_status(429, {"retry-after": "7"}), _mock_anthropic_success()],
+            )
+
+            await provider.complete("claude-sonnet-4-6", prompt="Hello")
+
+        assert sleeps == [7.0]
+
+    @pytest.mark.asyncio
+    async def test_retry_after_capped(self, sleeps: list[float]) -> None:
+        provider = AnthropicProvider(api_key="sk-ant-test")
+        async with provider:
+            assert provider._client is not None
+            provider._client.send = AsyncMock(
+                side_effect=[_mock_status(429, {"retry-after": "600"}), _mock_anthropic_success()],
+            )
+
+            await provider.complete("claude-sonnet-4-6", prompt="Hello")
+
+        assert sleeps == [RETRY_MAX_DELAY]
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, sleeps: list[float]) -> None:
+        provider = AnthropicProvider(api_key="sk-ant-test", max_retries=2)
+        async with provider:
+            assert provider._client is not None
+            mock_send = AsyncMock(return_value=_mock_status(429))
+            provider._client.send = mock_send
+
+            result = await provider.complete("claude-sonnet-4-6", prompt="Hello")
+
+        assert mock_send.call_count == 3
+        assert len(sleeps) == 2
+        assert result.error is not None
+        assert "429" in result.error
+        assert "Slow down" in result.error
+
+    @pytest.mark.asyncio
+    async def test_other_errors_not_retried(self, sleeps: list[float]) -> None:
+        provider = AnthropicProvider(api_key="sk-ant-test")
+        async with provider:
+            assert provider._client is not None
+            mock_send = AsyncMock(return_value=_mock_status(400))
+            provider._client.send = mock_send
+
+            await provider.complete("claude-sonnet-4-6", prompt="Hello")
+
+        assert mock_send.call_count == 1
+        assert sleeps == []
+
+
+# ---------------------------------------------------------------------------
+# Message Batches
+# ---------------------------------------------------------------------------
+
+
+def _mock_json(status_code: int, body: dict[str, object]) -> httpx.Response:
+    """Build a mock httpx.Response with a JSON body."""
+    resp = MagicMock(spec=httpx.Response)
+    resp.status_code = status_code
+    resp.headers = httpx.Headers({})
+    resp.content = orjson.dumps(body)
+    return resp
+
+
+def _mock_results(lines: list[dict[str, object]]) -> httpx.Response:
+    """Build a mock JSONL results response."""
+    resp = MagicMock(spec=httpx.Response)
+    resp.status_code = 200
+    resp.content = b"\n".join(orjson.dumps(line) for line in lines)
+    return resp
+
+
+def _succeeded(custom_id: str, text: str) -> dict[str, object]:
+    return {
+        "custom_id": custom_id,
+        "result": {
+            "type": "succeeded",
+            "message": {
+                "content": [{"type": "text", "text": text}],
+                "usage": {"input_tokens": 10, "output_tokens": 5},
+            },
+        },
+    }
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="Slow asyncio overhead on Windows — validated on Ubuntu CI",
+)
+class TestCompleteBatch:
+    """AnthropicProvider.complete_batch() uses the Message Batches API."""
+
+    @pytest.fixture(autouse=True)
+    def no_sleep(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        async def fake_sleep(delay: float) -> None:
+            return None
+
+        monkeypatch.setattr(anthropic_mod.asyncio, "sleep", fake_sleep)
+
+    @pytest.mark.asyncio
+    async def test_results_mapped_to_input_order(self) -> None:
+        provider = AnthropicProvider(api_key="sk-ant-test")
+        requests = [
+            {"model_id": "claude-sonnet-4-6", "prompt": "First", "model_alias": "claude"},
+            {"model_id": "claude-sonnet-4-6", "prompt": "Second", "round_number": 1},
+        ]
+        async with provider:
+            assert provider._client is not None
+            in_progress = {"id": "msgbatch_1", "processing_status": "in_progress"}
+            mock_post = AsyncMock(return_value=_mock_json(200, in_progress))
+            mock_get = AsyncMock(
+                side_effect=[
+                    _mock_json(200, in_progress),
+                    _mock_json(
+                        200,
+                        {
+                            "id": "msgbatch_1",
+                            "processing_status": "ended",
+                            "results_url": "https://api.anthropic.com/results/1",
+                        },
+                    ),
+                    # Results arrive out of order.
+                    _mock_results([_succeeded("1", "Two"), _succeeded("0", "One")]),
+                ],
+            )
+            provider._client.post = mock_post
+            provider._client.get = mock_get
+
+            results = await provider.complete_batch(requests)
+
+        assert mock_post.call_args.args[0] == ANTHROPIC_BATCHES_URL
+        sent = orjson.loads(mock_post.call_args.kwargs["content"])["requests"]
+        assert [r["custom_id"] for r in sent] == ["0", "1"]
+        assert sent[1]["params"]["messages"] == [{"role": "user", "content": "Second"}]
+        assert [r.content for r in results] == ["One", "Two"]
+        assert results[0].model_alias == "claude"
+        assert results[1].model_alias == "claude-sonnet-4-6"
+        assert results[1].round_number == 1
+        assert results[0].token_count == 15
+
+    @pytest.mark.asyncio
+    async def test_polls_retry_overload_responses(self) -> None:
+        provider = AnthropicProvider(api_key="sk-ant-test")
+        ended = {"id": "b", "processing_status": "ended", "results_url": "https://r"}
+        async with provider:
+            assert provider._client is not None
+            provider._client.post = AsyncMock(
+                return_value=_mock_json(200, {"id": "b", "processing_status": "in_progress"}),
+            )
+            mock_get = AsyncMock(
+                side_effect=[
+                    _mock_json(529, {"type": "error", "error": {"message": "Overloaded"}}),
+                    _mock_json(200, ended),
+                    _mock_json(429, {"type": "error", "error": {"message": "Slow down"}}),
+                    _mock_results([_succeeded("0", "One")]),
+                ],
+            )
+            provider._client.get = mock_get
+
+            results = await provider.complete_batch(
+                [{"model_id": "claude-sonnet-4-6", "prompt": "Hi"}]
+            )
+
+        assert mock_get.call_count == 4
+        assert results[0].error is None
+        assert results[0].content == "One"
+
+    @pytest.mark.asyncio
+    async def test_errored_result_sets_error(self) -> None:
+        provider = AnthropicProvider(api_key="sk-ant-test")
+        errored = {
+            "custom_id": "0",
+            "result": {
+                "type": "errored",
+                "error": {
+                    "type": "error",
+                    "error": {"type": "invalid_request_error", "message": "Bad input"},
+                },
+            },
+        }
+        async with provider:
+            assert provider._client is not None
+            provider._client.post = AsyncMock(
+                return_value=_mock_json(
+                    200,
+                    {"id": "b", "processing_status": "ended", "results_url": "https://r"},
+                ),
+            )
+            provider._client.get = AsyncMock(return_value=_mock_results([errored]))
+
+            results = await provider.complete_batch(
+                [{"model_id": "claude-sonnet-4-6", "prompt": "Hi"}]
+            )
+
+        assert results[0].error == "Batch request errored: Bad input"
+        assert results[0].content == ""
+
+    @pytest.mark.asyncio
+    async def test_create_failure_errors_all(self) -> None:
+        provider = AnthropicProvider(api_key="sk-ant-test")
+        async with provider:
+            assert provider._client is not None
+            provider._client.post = AsyncMock(
+                return_value=_mock_json(
+                    400, {"type": "error", "error": {"message": "requests: too many"}}
+                ),
+            )
+
+            results = await provider.complete_batch(
+                [
+                    {"model_id": "claude-sonnet-4-6", "prompt": "A"},
+                    {"model_id": "claude-sonnet-4-6", "prompt": "B"},
+                ]
+            )
+
+        assert len(results) == 2
+        assert all(r.error is not None and "400" in r.error for r in results)
+
+    @pytest.mark.asyncio
+    async def test_max_wait_exceeded(self) -> None:
+        provider = AnthropicProvider(api_key="sk-ant-test")
+        async with provider:
+            assert provider._client is not None
+            mock_post = AsyncMock(
+                return_value=_mock_json(200, {"id": "b", "processing_status": "in_progress"}),
+            )
+            provider._client.post = mock_post
+
+            results = await provider.complete_batch(
+                [{"model_id": "claude-sonnet-4-6", "prompt": "A"}],
+                batch_max_wait=1.0,
+            )
+
+        assert results[0].error is not None
+        assert "did not finish" in results[0].error
+        assert mock_post.call_args.args[0] == f"{ANTHROPIC_BATCHES_URL}/b/cancel"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_while_polling_cancels_batch(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        provider = AnthropicProvider(api_key="sk-ant-test")
+        polling = asyncio.Event()
+
+        async def blocking_sleep(delay: float) -> None:
+            polling.set()
+            await asyncio.Event().wait()
+
+        monkeypatch.setattr(anthropic_mod.asyncio, "sleep", blocking_sleep)
+        async with provider:
+            assert provider._client is not None
+            mock_post = AsyncMock(
+                return_value=_mock_json(200, {"id": "b", "processing_status": "in_progress"}),
+            )
+            provider._client.post = mock_post
+
+            task = asyncio.ensure_future(
+                provider.complete_batch([{"model_id": "claude-sonnet-4-6", "prompt": "A"}])
+            )
+            await polling.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert mock_post.call_args.args[0] == f"{ANTHROPIC_BATCHES_URL}/b/cancel"
+
+    @pytest.mark.asyncio
+    async def test_empty_requests(self) -> None:
+        provider = AnthropicProvider(api_key="sk-ant-test")
+        async with provider:
+            assert await provider.complete_batch([]) == []
+
+
 # ---------------------------------------------------------------------------
 # Import from providers package
 # ---------------------------------------------------------------------------
@@ -0,0 +1,389 @@
+"""Tests for the response cache.
+
+Covers: request key canonicalization, MemoryCache LRU behavior, FileCache
+persistence and corrupt-entry handling, backend selection from config,
+ProviderRouter cache hits/misses, and in-flight request coalescing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from mutual_dissent.cache import FileCache, MemoryCache, make_cache, request_key
+from mutual_dissent.config import Config
+from mutual_dissent.models import ModelResponse
+from mutual_dissent.providers.router import ProviderRouter
+
+# ---------------------------------------------------------------------------
+# Request keys
+# ---------------------------------------------------------------------------
+
+
+class TestRequestKey:
+    """request_key() produces stable digests for identical requests."""
+
+    MODEL = "claude-sonnet-4-6"
+
+    def test_identical_requests_match(self) -> None:
+        assert request_key(self.MODEL, "anthropic", None, "Hello") == request_key(
+            self.MODEL, "anthropic", None, "Hello"
+        )
+
+    def test_different_prompt_differs(self) -> None:
+        assert request_key(self.MODEL, "anthropic", None, "Hello") != request_key(
+            self.MODEL, "anthropic", None, "Bye"
+        )
+
+    def test_different_model_differs(self) -> None:
+        assert request_key(self.MODEL, "anthropic", None, "Hello") != request_key(
+            "claude-opus-4-6", "anthropic", None, "Hello"
+        )
+
+    def test_different_route_differs(self) -> None:
+        assert request_key(self.MODEL, "anthropic", None, "Hello") != request_key(
+            self.MODEL, "openrouter", None, "Hello"
+        )
+
+    def test_different_params_differ(self) -> None:
+        assert request_key(
+            self.MODEL, "anthropic", None, "Hello", {"max_tokens": 4096}
+        ) != request_key(self.MODEL, "anthropic", None, "Hello", {"max_tokens": 1024})
+
+    def test_message_key_order_irrelevant(self) -> None:
+        a = [{"role": "user", "content": "Hi"}]
+        b = [{"content": "Hi", "role": "user"}]
+        assert request_key(self.MODEL, "anthropic", a, None) == request_key(
+            self.MODEL, "anthropic", b, None
+        )
+
+    def test_key_is_hex_sha256(self) -> None:
+        key = request_key(self.MODEL, "anthropic", None, "Hello")
+        assert len(key) == 64
+        int(key, 16)
+
+
+# ---------------------------------------------------------------------------
+# Backends
+# ---------------------------------------------------------------------------
+
+
+class TestMemoryCache:
+    """MemoryCache is a bounded LRU."""
+
+    @pytest.mark.asyncio
+    async def test_miss_returns_none(self) -> None:
+        assert await MemoryCache().get("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_set_then_get(self) -> None:
+        cache = MemoryCache()
+        await cache.set("k", {"content": "v"})
+        assert await cache.get("k") == {"content": "v"}
+
+    @pytest.mark.asyncio
+    async def test_values_are_copied(self) -> None:
+        cache = MemoryCache()
+        value: dict[str, object] = {"analysis": {}}
+        await cache.set("k", value)
+        value["analysis"] = {"stale": True}
+        hit = await cache.get("k")
+        assert hit == {"analysis": {}}
+        hit["analysis"]["stale"] = True  # type: ignore[index]
+        assert await cache.get("k") == {"analysis": {}}
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self) -> None:
+        cache = MemoryCache(max_entries=2)
+        await cache.set("a", {"n": 1})
+        await cache.set("b", {"n": 2})
+        await cache.get("a")
+        await cache.set("c", {"n": 3})
+        assert await cache.get("b") is None
+        assert await cache.get("a") == {"n": 1}
+        assert len(cache) == 2
+
+
+class TestFileCache:
+    """FileCache persists entries as JSON files."""
+
+    @pytest.mark.asyncio
+    async def test_roundtrip(self, tmp_path: Path) -> None:
+        cache = FileCache(tmp_path / "cache")
+        await cache.set("k", {"content": "v"})
+        assert await FileCache(tmp_path / "cache").get("k") == {"content": "v"}
+
+    @pytest.mark.asyncio
+    async def test_miss_returns_none(self, tmp_path: Path) -> None:
+        assert await FileCache(tmp_path).get("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_corrupt_entry_is_miss(self, tmp_path: Path) -> None:
+        (tmp_path / "k.json").write_text("{not json", encoding="utf-8")
+        assert await FileCache(tmp_path).get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        cache = FileCache(tmp_path, max_entries=2)
+        await cache.set("a", {"n": 1})
+        await cache.set("b", {"n": 2})
+        # Age both entries, then touch "a" so "b" is the oldest.
+        for name in ("a", "b"):
+            os.utime(tmp_path / f"{name}.json", (1_000, 1_000))
+        assert await cache.get("a") == {"n": 1}
+        await cache.set("c", {"n": 3})
+
+        assert sorted(p.stem for p in tmp_path.glob("*.json")) == ["a", "c"]
+
+
+class TestMakeCache:
+    """make_cache() selects the backend from config."""
+
+    def test_off_by_default(self) -> None:
+        assert make_cache(Config()) is None
+
+    def test_memory(self) -> None:
+        assert isinstance(make_cache(Config(cache_backend="memory")), MemoryCache)
+
+    def test_file(self) -> None:
+        assert isinstance(make_cache(Config(cache_backend="file")), FileCache)
+
+    def test_unknown_raises(self) -> None:
+        with pytest.raises(ValueError, match="Unknown cache backend"):
+            make_cache(Config(cache_backend="redis"))
+
+
+# ---------------------------------------------------------------------------
+# Router integration
+# ---------------------------------------------------------------------------
+
+
+def _mock_response(error: str | None = None) -> ModelResponse:
+    return ModelResponse(
+        model_id="anthropic/claude-sonnet-4-6",
+        model_alias="claude",
+        round_number=0,
+        content="" if error else "mock response",
+        latency_ms=500,
+        error=error,
+    )
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="Slow asyncio overhead on Windows — validated on Ubuntu CI",
+)
+class TestRouterCache:
+    """ProviderRouter.complete() consults the response cache."""
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_provider(self) -> None:
+        config = Config(providers={"openrouter": "sk-or-test"})
+        async with ProviderRouter(config, cache=MemoryCache()) as router:
+            router._openrouter.complete = AsyncMock(return_value=_mock_response())  # type: ignore[union-attr]
+
+            first = await router.complete("claude", prompt="Hello")
+            second = await router.complete("claude", prompt="Hello", round_number=2)
+
+            router._openrouter.complete.assert_called_once()  # type: ignore[union-attr]
+        assert first.latency_ms == 500
+        assert second.content == "mock response"
+        assert second.latency_ms == 0
+        assert second.round_number == 2
+        assert second.routing is not None
+        assert second.routing["cached"] is True
+        assert second.routing["vendor"] == "anthropic"
+
+    @pytest.mark.asyncio
+    async def test_errors_not_cached(self) -> None:
+        config = Config(providers={"openrouter": "sk-or-test"})
+        async with ProviderRouter(config, cache=MemoryCache()) as router:
+            router._openrouter.complete = AsyncMock(  # type: ignore[union-attr]
+                return_value=_mock_response(error="HTTP 500: boom"),
+            )
+
+            await router.complete("claude", prompt="Hello")
+            await router.complete("claude", prompt="Hello")
+
+            assert router._openrouter.complete.call_count == 2  # type: ignore[union-attr]
+
+    @pytest.mark.asyncio
+    async def test_mutating_response_does_not_leak_into_hits(self) -> None:
+        config = Config(providers={"openrouter": "sk-or-test"})
+        async with ProviderRouter(config, cache=MemoryCache()) as router:
+            router._openrouter.complete = AsyncMock(return_value=_mock_response())  # type: ignore[union-attr]
+
+            first = await router.complete("claude", prompt="Q")
+            first.analysis["ground_truth_score"] = {"score": 1}
+            second = await router.complete("claude", prompt="Q")
+            second.analysis["note"] = "hit"
+            third = await router.complete("claude", prompt="Q")
+
+        assert second.analysis is not first.analysis
+        assert second.analysis == {"note": "hit"}
+        assert third.analysis == {}
+
+    @pytest.mark.asyncio
+    async def test_remapped_alias_misses(self) -> None:
+        config = Config(providers={"openrouter": "sk-or-test"})
+        cache = MemoryCache()
+        async with ProviderRouter(config, cache=cache) as router:
+            router._openrouter.complete = AsyncMock(return_value=_mock_response())  # type: ignore[union-attr]
+            await router.complete("claude", prompt="Hello")
+
+        remapped = Config(
+            providers={"openrouter": "sk-or-test"},
+            _model_aliases_v2={"claude": {"openrouter": "anthropic/claude-opus-4-6"}},
+        )
+        async with ProviderRouter(remapped, cache=cache) as router:
+            router._openrouter.complete = AsyncMock(return_value=_mock_response())  # type: ignore[union-attr]
+            response = await router.complete("claude", prompt="Hello")
+
+            router._openrouter.complete.assert_called_once()  # type: ignore[union-attr]
+        assert response.routing is not None
+        assert "cached" not in response.routing
+
+    @pytest.mark.asyncio
+    async def test_no_cache_by_default(self) -> None:
+        config = Config(providers={"openrouter": "sk-or-test"})
+        async with ProviderRouter(config) as router:
+            router._openrouter.complete = AsyncMock(return_value=_mock_response())  # type: ignore[union-attr]
+
+            await router.complete("claude", prompt="Hello")
+            await router.complete("claude", prompt="Hello")
+
+            assert router._openrouter.complete.call_count == 2  # type: ignore[union-attr]
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="Slow asyncio overhead on Windows — validated on Ubuntu CI",
+)
+class TestRouterCoalescing:
+    """Identical concurrent requests share one provider call."""
+
+    @staticmethod
+    def _slow_complete(release: asyncio.Event) -> AsyncMock:
+        async def complete(*args: object, **kwargs: object) -> ModelResponse:
+            await release.wait()
+            return _mock_response()
+
+        return AsyncMock(side_effect=complete)
+
+    @pytest.mark.asyncio
+    async def test_duplicates_share_one_call(self) -> None:
+        config = Config(providers={"openrouter": "sk-or-test"})
+        release = asyncio.Event()
+        async with ProviderRouter(config, cache=MemoryCache()) as router:
+            router._openrouter.complete = self._slow_complete(release)  # type: ignore[union-attr]
+
+            first = asyncio.ensure_future(router.complete("claude", prompt="Hello"))
+            second = asyncio.ensure_future(
+                router.complete("claude", prompt="Hello", model_alias="judge", round_number=-1)
+            )
+            await asyncio.sleep(0)
+            release.set()
+            leader, follower = await asyncio.gather(first, second)
+
+            router._openrouter.complete.assert_called_once()  # type: ignore[union-attr]
+            assert router._inflight == {}
+        assert leader.routing is not None
+        assert "coalesced" not in leader.routing
+        assert follower.content == "mock response"
+        assert follower.model_alias == "judge"
+        assert follower.round_number == -1
+        assert follower.routing is not None
+        assert follower.routing["coalesced"] is True
+
+    @pytest.mark.asyncio
+    async def test_follower_gets_own_analysis(self) -> None:
+        config = Config(providers={"openrouter": "sk-or-test"})
+        release = asyncio.Event()
+        async with ProviderRouter(config, cache=MemoryCache()) as router:
+            router._openrouter.complete = self._slow_complete(release)  # type: ignore[union-attr]
+
+            tasks = [
+                asyncio.ensure_future(router.complete("claude", prompt="Hello")) for _ in range(2)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            leader, follower = await asyncio.gather(*tasks)
+
+        leader.analysis["ground_truth_score"] = {"score": 1}
+        assert follower.analysis == {}
+
+    @pytest.mark.asyncio
+    async def test_different_requests_not_coalesced(self) -> None:
+        config = Config(providers={"openrouter": "sk-or-test"})
+        release = asyncio.Event()
+        async with ProviderRouter(config, cache=MemoryCache()) as router:
+            router._openrouter.complete = self._slow_complete(release)  # type: ignore[union-attr]
+
+            tasks = [
+                asyncio.ensure_future(router.complete("claude", prompt="Hello")),
+                asyncio.ensure_future(router.complete("claude", prompt="Bye")),
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            await asyncio.gather(*tasks)
+
+            assert router._openrouter.complete.call_count == 2  # type: ignore[union-attr]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_follower(self) -> None:
+        config = Config(providers={"openrouter": "sk-or-test"})
+        release = asyncio.Event()
+        async with ProviderRouter(config, cache=MemoryCache()) as router:
+            router._openrouter.complete = self._slow_complete(release)  # type: ignore[union-attr]
+
+            leader = asyncio.ensure_future(router.complete("claude", prompt="Hello"))
+            follower = asyncio.ensure_future(router.complete("claude", prompt="Hello"))
+            await asyncio.sleep(0)
+            leader.cancel()
+            release.set()
+            result = await follower
+
+        assert leader.cancelled()
+        assert result.content == "mock response"
+
+    @pytest.mark.asyncio
+    async def test_all_callers_cancelled_cancels_request(self) -> None:
+        config = Config(providers={"openrouter": "sk-or-test"})
+        release = asyncio.Event()
+        async with ProviderRouter(config, cache=MemoryCache()) as router:
+            router._openrouter.complete = self._slow_complete(release)  # type: ignore[union-attr]
+
+            callers = [
+                asyncio.ensure_future(router.complete("claude", prompt="Hello")) for _ in range(2)
+            ]
+            await asyncio.sleep(0)
+            (leader,) = router._inflight.values()
+            for caller in callers:
+                caller.cancel()
+            await asyncio.gather(*callers, return_exceptions=True)
+            await asyncio.gather(leader, return_exceptions=True)
+
+            assert leader.cancelled()
+            assert router._inflight == {}
+            assert router._waiters == {}
+
+    @pytest.mark.asyncio
+    async def test_exit_cancels_inflight_requests(self) -> None:
+        config = Config(providers={"openrouter": "sk-or-test"})
+        release = asyncio.Event()
+        async with ProviderRouter(config, cache=MemoryCache()) as router:
+            router._openrouter.complete = self._slow_complete(release)  # type: ignore[union-attr]
+
+            caller = asyncio.ensure_future(router.complete("claude", prompt="Hello"))
+            await asyncio.sleep(0)
+            (leader,) = router._inflight.values()
+
+        assert leader.cancelled()
+        assert router._inflight == {}
+        with pytest.raises(asyncio.CancelledError):
+            await caller
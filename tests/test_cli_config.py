@@ -7,36 +7,54 @@ error results, and the _run_config_test async helper.
 
 from __future__ import annotations
 
-from click.testing import CliRunner
+import dataclasses
+from collections.abc import Callable
+from functools import cache
+from unittest.mock import MagicMock
 
+import pytest
+from click.testing import CliRunner, Result
+
+import mutual_dissent.display as display_mod
 from mutual_dissent.cli import main
-from mutual_dissent.display import render_config_test
+from mutual_dissent.config import Config, load_config
+from mutual_dissent.display import render_config_show, render_config_test
 from mutual_dissent.models import ModelResponse
 from mutual_dissent.types import RoutingDecision, Vendor
 
+# invoke() isolates each call itself, so one runner serves every test.
+_RUNNER = CliRunner()
+
 # ---------------------------------------------------------------------------
 # Click command registration
 # ---------------------------------------------------------------------------
 
 
+@cache
+def _invoke(args: tuple[str, ...]) -> Result:
+    """Invoke the CLI once per argument tuple.
+
+    Only for read-only invocations (``--help``, ``config path``) whose
+    result cannot depend on test state.
+    """
+    return _RUNNER.invoke(main, list(args))
+
+
 class TestCommandRegistration:
     """config group and test subcommand are registered correctly."""
 
     def test_config_group_exists(self) -> None:
-        runner = CliRunner()
-        result = runner.invoke(main, ["--help"])
+        result = _invoke(("--help",))
         assert result.exit_code == 0
         assert "config" in result.output
 
     def test_config_shows_test_subcommand(self) -> None:
-        runner = CliRunner()
-        result = runner.invoke(main, ["config", "--help"])
+        result = _invoke(("config", "--help"))
         assert result.exit_code == 0
         assert "test" in result.output
 
     def test_config_test_shows_help(self) -> None:
-        runner = CliRunner()
-        result = runner.invoke(main, ["config", "test", "--help"])
+        result = _invoke(("config", "test", "--help"))
         assert result.exit_code == 0
         assert "Test provider configuration" in result.output
 
@@ -68,232 +86,83 @@ def _make_result(
     return {"alias": alias, "decision": decision, "response": response}
 
 
+# Shared results — render_config_test only reads its input, so tests can
+# reuse these instead of building their own.
+CLAUDE_OK = _make_result("claude", Vendor.ANTHROPIC, False, "claude-sonnet-4-6")
+GPT_OK = _make_result("gpt", Vendor.OPENAI, True, "openai/gpt-5.2")
+GEMINI_OK = _make_result("gemini", Vendor.GOOGLE, True, "google/gemini-2.5-pro")
+GROK_401 = _make_result(
+    "grok", Vendor.XAI, True, "x-ai/grok-4", latency_ms=None, error="401 Unauthorized"
+)
+GROK_TIMEOUT = _make_result(
+    "grok", Vendor.XAI, True, "x-ai/grok-4", latency_ms=None, error="timeout"
+)
+GROK_CONN_ERR = _make_result(
+    "grok", Vendor.XAI, True, "x-ai/grok-4", latency_ms=None, error="connection error"
+)
+
+
+def _assert_all_in(output: str, needles: tuple[str, ...]) -> None:
+    """Assert every needle appears in *output*, reporting all that are missing."""
+    missing = [needle for needle in needles if needle not in output]
+    assert not missing, f"missing from output: {missing}"
+
+
 class TestRenderConfigTestSuccess:
     """render_config_test renders success results correctly."""
 
-    def test_renders_without_error(self, capsys: object) -> None:
+    def test_renders_without_error(self) -> None:
         """Smoke test — render_config_test doesn't raise."""
-        results = [
-            _make_result("claude", Vendor.ANTHROPIC, False, "claude-sonnet-4-6"),
-            _make_result("gpt", Vendor.OPENAI, True, "openai/gpt-5.2"),
-        ]
+        results = [CLAUDE_OK, GPT_OK]
         # Should not raise.
         render_config_test(results)
 
-    def test_success_all_aliases_shown(self) -> None:
-        """All tested aliases appear in the output."""
-        from io import StringIO
-
-        from rich.console import Console
-
-        results = [
-            _make_result("claude", Vendor.ANTHROPIC, False, "claude-sonnet-4-6"),
-            _make_result("gpt", Vendor.OPENAI, True, "openai/gpt-5.2"),
-            _make_result("gemini", Vendor.GOOGLE, True, "google/gemini-2.5-pro"),
-        ]
-
-        buf = StringIO()
-        test_console = Console(file=buf, force_terminal=True)
-
-        # Temporarily replace module console.
-        import mutual_dissent.display as display_mod
-
-        original_console = display_mod.console
-        display_mod.console = test_console
-        try:
-            render_config_test(results)
-        finally:
-            display_mod.console = original_console
-
-        output = buf.getvalue()
-        assert "claude" in output
-        assert "gpt" in output
-        assert "gemini" in output
-
-    def test_latency_formatted_as_seconds(self) -> None:
-        """Latency renders as seconds (e.g. 1.2s)."""
-        from io import StringIO
-
-        from rich.console import Console
-
-        results = [
-            _make_result(
-                "claude",
-                Vendor.ANTHROPIC,
-                False,
-                "claude-sonnet-4-6",
-                latency_ms=1200,
-            ),
-        ]
-
-        buf = StringIO()
-        test_console = Console(file=buf, force_terminal=True)
-
-        import mutual_dissent.display as display_mod
-
-        original_console = display_mod.console
-        display_mod.console = test_console
-        try:
-            render_config_test(results)
-        finally:
-            display_mod.console = original_console
-
-        output = buf.getvalue()
-        assert "1.2s" in output
-
-    def test_direct_route_shown(self) -> None:
-        """Direct-routed models show 'direct' in route column."""
-        from io import StringIO
-
-        from rich.console import Console
-
-        results = [
-            _make_result("claude", Vendor.ANTHROPIC, False, "claude-sonnet-4-6"),
-        ]
-
-        buf = StringIO()
-        test_console = Console(file=buf, force_terminal=True)
-
-        import mutual_dissent.display as display_mod
-
-        original_console = display_mod.console
-        display_mod.console = test_console
-        try:
-            render_config_test(results)
-        finally:
-            display_mod.console = original_console
-
-        output = buf.getvalue()
-        assert "direct" in output
+    def test_render_covers_all_columns(self, captured_console: Callable[[], str]) -> None:
+        """One table shows every alias, both route types, and latency in seconds."""
+        render_config_test([CLAUDE_OK, GPT_OK, GEMINI_OK])
 
-    def test_openrouter_route_shown(self) -> None:
-        """OpenRouter-routed models show 'openrouter' in route column."""
-        from io import StringIO
-
-        from rich.console import Console
-
-        results = [
-            _make_result("gpt", Vendor.OPENAI, True, "openai/gpt-5.2"),
-        ]
-
-        buf = StringIO()
-        test_console = Console(file=buf, force_terminal=True)
-
-        import mutual_dissent.display as display_mod
-
-        original_console = display_mod.console
-        display_mod.console = test_console
-        try:
-            render_config_test(results)
-        finally:
-            display_mod.console = original_console
-
-        output = buf.getvalue()
-        assert "openrouter" in output
+        _assert_all_in(
+            captured_console(),
+            ("claude", "gpt", "gemini", "direct", "openrouter", "1.2s"),
+        )
 
 
 class TestRenderConfigTestError:
     """render_config_test renders error results correctly."""
 
-    def test_error_shows_message(self) -> None:
+    def test_error_shows_message(self, captured_console: Callable[[], str]) -> None:
         """Error responses show the error message in the status column."""
-        from io import StringIO
-
-        from rich.console import Console
-
-        results = [
-            _make_result(
-                "grok",
-                Vendor.XAI,
-                True,
-                "x-ai/grok-4",
-                latency_ms=None,
-                error="401 Unauthorized",
-            ),
-        ]
-
-        buf = StringIO()
-        test_console = Console(file=buf, force_terminal=True)
-
-        import mutual_dissent.display as display_mod
-
-        original_console = display_mod.console
-        display_mod.console = test_console
-        try:
-            render_config_test(results)
-        finally:
-            display_mod.console = original_console
-
-        output = buf.getvalue()
+        results = [GROK_401]
+
+        render_config_test(results)
+
+        output = captured_console()
         assert "401 Unauthorized" in output
 
-    def test_error_shows_dash_for_latency(self) -> None:
+    def test_error_shows_dash_for_latency(self, captured_console: Callable[[], str]) -> None:
         """Error responses show a dash instead of latency."""
-        from io import StringIO
-
-        from rich.console import Console
-
-        results = [
-            _make_result(
-                "grok",
-                Vendor.XAI,
-                True,
-                "x-ai/grok-4",
-                latency_ms=None,
-                error="timeout",
-            ),
-        ]
-
-        buf = StringIO()
-        test_console = Console(file=buf, force_terminal=True)
-
-        import mutual_dissent.display as display_mod
-
-        original_console = display_mod.console
-        display_mod.console = test_console
-        try:
-            render_config_test(results)
-        finally:
-            display_mod.console = original_console
-
-        output = buf.getvalue()
-        assert "\u2014" in output
-
-    def test_mixed_success_and_error(self) -> None:
-        """Table renders correctly with both success and error rows."""
-        from io import StringIO
+        results = [GROK_TIMEOUT]
 
-        from rich.console import Console
+        render_config_test(results)
 
-        results = [
-            _make_result("claude", Vendor.ANTHROPIC, False, "claude-sonnet-4-6"),
-            _make_result(
-                "grok",
-                Vendor.XAI,
-                True,
-                "x-ai/grok-4",
-                latency_ms=None,
-                error="connection error",
-            ),
-        ]
+        output = captured_console()
+        assert "\u2014" in output
 
-        buf = StringIO()
-        test_console = Console(file=buf, force_terminal=True, width=120)
+    def test_mixed_success_and_error(self, captured_console: Callable[[], str]) -> None:
+        """Table renders correctly with both success and error rows."""
+        results = [CLAUDE_OK, GROK_CONN_ERR]
 
-        import mutual_dissent.display as display_mod
+        render_config_test(results)
 
-        original_console = display_mod.console
-        display_mod.console = test_console
-        try:
-            render_config_test(results)
-        finally:
-            display_mod.console = original_console
+        output = captured_console()
+        _assert_all_in(output, ("claude", "grok", "connection error", "1.2s"))
 
-        output = buf.getvalue()
-        assert "claude" in output
-        assert "grok" in output
-        assert "connection error" in output
-        assert "1.2s" in output
+    def test_single_print_call(self, monkeypatch) -> None:
+        """The whole table is emitted with one console.print()."""
+        mock_console = MagicMock()
+        monkeypatch.setattr(display_mod, "console", mock_console)
+        render_config_test([CLAUDE_OK, GPT_OK])
+        mock_console.print.assert_called_once()
 
 
 # ---------------------------------------------------------------------------
@@ -305,14 +174,12 @@ class TestConfigPath:
     """config path subcommand."""
 
     def test_config_path_shows_in_help(self) -> None:
-        runner = CliRunner()
-        result = runner.invoke(main, ["config", "--help"])
+        result = _invoke(("config", "--help"))
         assert result.exit_code == 0
         assert "path" in result.output
 
     def test_config_path_prints_path(self) -> None:
-        runner = CliRunner()
-        result = runner.invoke(main, ["config", "path"])
+        result = _invoke(("config", "path"))
         assert result.exit_code == 0
         assert ".mutual-dissent" in result.output
         assert "config.toml" in result.output
@@ -327,8 +194,7 @@ class TestConfigShow:
     """config show subcommand."""
 
     def test_config_show_in_help(self) -> None:
-        runner = CliRunner()
-        result = runner.invoke(main, ["config", "--help"])
+        result = _invoke(("config", "--help"))
         assert result.exit_code == 0
         assert "show" in result.output
 
@@ -336,8 +202,7 @@ class TestConfigShow:
         """config show runs without error and shows key sections."""
         monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
         monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
-        runner = CliRunner()
-        result = runner.invoke(main, ["config", "show"])
+        result = _RUNNER.invoke(main, ["config", "show"])
         assert result.exit_code == 0
         assert "config.toml" in result.output
 
@@ -345,14 +210,12 @@ class TestConfigShow:
         """Full API key must never appear in config show output."""
         full_key = "sk-or-v1-abcdefghijklmnopqrstuvwxyz1234567890"
         monkeypatch.setenv("OPENROUTER_API_KEY", full_key)
-        runner = CliRunner()
-        result = runner.invoke(main, ["config", "show"])
+        result = _RUNNER.invoke(main, ["config", "show"])
         assert result.exit_code == 0
         assert full_key not in result.output
 
     def test_config_show_check_models_flag_exists(self) -> None:
-        runner = CliRunner()
-        result = runner.invoke(main, ["config", "show", "--help"])
+        result = _invoke(("config", "show", "--help"))
         assert result.exit_code == 0
         assert "check-models" in result.output
 
@@ -365,108 +228,70 @@ class TestConfigShow:
 class TestRenderConfigShow:
     """render_config_show() display function."""
 
-    def _capture(self, config, context_lengths=None):
-        """Helper to capture render_config_show output."""
-        from io import StringIO
-
-        from rich.console import Console
-
-        import mutual_dissent.display as display_mod
-
-        buf = StringIO()
-        test_console = Console(file=buf, force_terminal=True, width=120)
-        original_console = display_mod.console
-        display_mod.console = test_console
-        try:
-            from mutual_dissent.display import render_config_show
+    @pytest.fixture
+    def capture(self, captured_console: Callable[[], str]) -> Callable[..., str]:
+        """Render config show into the captured console and return the output."""
 
+        def _capture(config: Config, context_lengths: dict[str, int] | None = None) -> str:
             render_config_show(config, context_lengths=context_lengths)
-        finally:
-            display_mod.console = original_console
-        return buf.getvalue()
-
-    def test_shows_config_path(self) -> None:
-        from mutual_dissent.config import Config
-
-        config = Config()
-        output = self._capture(config)
-        assert "config.toml" in output
-
-    def test_shows_panel(self) -> None:
-        from mutual_dissent.config import Config
+            return captured_console()
 
-        config = Config()
-        output = self._capture(config)
-        assert "claude" in output
-        assert "gpt" in output
+        return _capture
 
-    def test_shows_synthesizer(self) -> None:
-        from mutual_dissent.config import Config
+    def test_shows_config_path(self, default_rendered_config) -> None:
+        assert "config.toml" in default_rendered_config
 
-        config = Config()
-        output = self._capture(config)
-        assert "claude" in output
+    def test_shows_panel(self, default_rendered_config) -> None:
+        _assert_all_in(default_rendered_config, ("claude", "gpt"))
 
-    def test_shows_rounds(self) -> None:
-        from mutual_dissent.config import Config
+    def test_shows_synthesizer(self, default_rendered_config) -> None:
+        assert "claude" in default_rendered_config
 
-        config = Config()
-        output = self._capture(config)
+    def test_shows_rounds(self, default_rendered_config) -> None:
         # Default rounds is 1
-        assert "1" in output
+        assert "1" in default_rendered_config
 
-    def test_masks_api_key(self) -> None:
+    def test_masks_api_key(self, capture, default_config) -> None:
         """API keys must be masked -- never shown in full."""
-        from mutual_dissent.config import Config
-
-        config = Config()
         full_key = "sk-or-v1-abcdefghijklmnopqrstuvwxyz1234567890"
-        config.providers["openrouter"] = full_key
-        output = self._capture(config)
+        config = dataclasses.replace(default_config, providers={"openrouter": full_key})
+        output = capture(config)
         # Full key must NOT appear.
         assert full_key not in output
         # Masked form should appear.
-        assert "sk-or-" in output
-        assert "7890" in output
+        _assert_all_in(output, ("sk-or-", "7890"))
 
-    def test_shows_not_configured(self) -> None:
+    def test_shows_not_configured(self, capture, empty_providers_config) -> None:
         """Providers without keys show 'not configured'."""
-        from mutual_dissent.config import Config
-
-        config = Config()
-        config.providers = {}
-        output = self._capture(config)
+        output = capture(empty_providers_config)
         assert "not configured" in output.lower()
 
-    def test_shows_provider_source_env(self, monkeypatch) -> None:
+    def test_shows_provider_source_env(self, monkeypatch, capture) -> None:
         """Provider key from env var shows 'env' source."""
-        from mutual_dissent.config import load_config
-
+        monkeypatch.setattr(
+            "mutual_dissent.config._ENV_VAR_MAP", {"OPENROUTER_API_KEY": "openrouter"}
+        )
         monkeypatch.setenv("OPENROUTER_API_KEY", "sk-or-v1-testkey12345678")
         config = load_config()
-        output = self._capture(config)
+        output = capture(config)
         assert "env" in output.lower()
 
-    def test_shows_model_aliases(self) -> None:
+    def test_shows_model_aliases(self, default_rendered_config) -> None:
         """Model aliases section shows alias to model ID mappings."""
-        from mutual_dissent.config import Config
-
-        config = Config()
-        output = self._capture(config)
-        assert "anthropic/claude-sonnet-4-6" in output
+        assert "anthropic/claude-sonnet-4-6" in default_rendered_config
 
-    def test_shows_routing_mode(self) -> None:
-        from mutual_dissent.config import Config
+    def test_shows_routing_mode(self, default_rendered_config) -> None:
+        assert "auto" in default_rendered_config
 
-        config = Config()
-        output = self._capture(config)
-        assert "auto" in output
-
-    def test_shows_context_length(self) -> None:
+    def test_shows_context_length(self, capture, default_config) -> None:
         """Context lengths shown when provided."""
-        from mutual_dissent.config import Config
-
-        config = Config()
         context_lengths = {"claude": 200000}
-        output = self._capture(config, context_lengths=context_lengths)
+        output = capture(default_config, context_lengths=context_lengths)
         assert "200,000" in output or "200000" in output
+
+    def test_single_print_call(self, monkeypatch, default_config) -> None:
+        """All sections are emitted with one console.print()."""
+        mock_console = MagicMock()
+        monkeypatch.setattr(display_mod, "console", mock_console)
+        render_config_show(default_config)
+        mock_console.print.assert_called_once()
@@ -1,7 +1,10 @@
-"""Tests for CLI version check utilities."""
+"""Tests for CLI version check utilities and import cost."""
 
 from __future__ import annotations
 
+import subprocess
+import sys
+
 from mutual_dissent.cli import _parse_version
 
 
@@ -31,3 +34,18 @@ class TestParseVersion:
 
     def test_empty_returns_zero(self) -> None:
         assert _parse_version("") == (0,)
+
+
+class TestColdStart:
+    """Importing the CLI module defers the provider and rendering stack."""
+
+    def test_heavy_modules_not_imported(self) -> None:
+        heavy = ["httpx", "asyncio", "mutual_dissent.orchestrator", "rich.markdown"]
+        code = (
+            "import sys, mutual_dissent.cli; "
+            f"print(','.join(m for m in {heavy!r} if m in sys.modules))"
+        )
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == ""
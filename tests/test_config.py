@@ -79,6 +79,21 @@ LEGACY_API_KEY_ONLY_TOML = """\
 api_key = "sk-or-legacy-only"
 """
 
+CACHE_TOML = """\
+[cache]
+backend = "memory"
+max_entries = 32
+"""
+
+LIMITS_TOML = """\
+[limits]
+max_concurrency = 4
+
+[limits.requests_per_minute]
+anthropic = 50
+openrouter = 200
+"""
+
 BOTH_API_KEYS_TOML = """\
 api_key = "sk-or-legacy"
 
@@ -154,6 +169,25 @@ class TestPhase15SchemaLoading:
         assert config.default_synthesizer == "claude"
         assert config.default_rounds == 2
 
+    def test_cache_defaults_off(self, config_dir: Path) -> None:
+        config = _load_with_config(config_dir, PHASE_1_5_TOML)
+        assert config.cache_backend == "off"
+
+    def test_cache_section_loaded(self, config_dir: Path) -> None:
+        config = _load_with_config(config_dir, CACHE_TOML)
+        assert config.cache_backend == "memory"
+        assert config.cache_max_entries == 32
+
+    def test_limits_default(self, config_dir: Path) -> None:
+        config = _load_with_config(config_dir, PHASE_1_5_TOML)
+        assert config.max_concurrency == 10
+        assert config.rate_limits == {}
+
+    def test_limits_section_loaded(self, config_dir: Path) -> None:
+        config = _load_with_config(config_dir, LIMITS_TOML)
+        assert config.max_concurrency == 4
+        assert config.rate_limits == {"anthropic": 50, "openrouter": 200}
+
     def test_api_key_backward_compat(self, config_dir: Path) -> None:
         """config.api_key still works and returns OpenRouter key."""
         config = _load_with_config(config_dir, PHASE_1_5_TOML)
@@ -437,6 +471,39 @@ class TestWriteConfig:
         assert loaded.default_synthesizer == "gpt"
         assert loaded.default_rounds == 2
 
+    def test_roundtrip_cache(self, tmp_path: Path) -> None:
+        """write_config preserves response cache settings."""
+        config = Config(cache_backend="file", cache_max_entries=64)
+        config_path = tmp_path / "config.toml"
+        write_config(config, path=config_path)
+
+        loaded = self._load_roundtrip(config_path)
+
+        assert loaded.cache_backend == "file"
+        assert loaded.cache_max_entries == 64
+
+    def test_roundtrip_limits(self, tmp_path: Path) -> None:
+        """write_config preserves concurrency and rate-limit settings."""
+        config = Config(max_concurrency=3, rate_limits={"anthropic": 40})
+        config_path = tmp_path / "config.toml"
+        write_config(config, path=config_path)
+
+        loaded = self._load_roundtrip(config_path)
+
+        assert loaded.max_concurrency == 3
+        assert loaded.rate_limits == {"anthropic": 40}
+
+    def test_roundtrip_batch(self, tmp_path: Path) -> None:
+        """write_config preserves batch routing settings."""
+        config = Config(batch_threshold=10, batch_max_wait=600.0)
+        config_path = tmp_path / "config.toml"
+        write_config(config, path=config_path)
+
+        loaded = self._load_roundtrip(config_path)
+
+        assert loaded.batch_threshold == 10
+        assert loaded.batch_max_wait == 600.0
+
     def test_roundtrip_providers(self, tmp_path: Path) -> None:
         """write_config preserves provider keys (not env-sourced ones)."""
         config = Config(
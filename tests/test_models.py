@@ -1,12 +1,12 @@
 """Tests for data models.
 
 Covers: ModelResponse new fields (role, routing, analysis), defaults,
-and to_dict() serialization of all fields.
+to_dict() serialization of all fields, and the error_for() factory.
 """
 
 from __future__ import annotations
 
-from mutual_dissent.models import ModelResponse
+from mutual_dissent.models import ModelResponse, Timings
 
 
 class TestModelResponseDefaults:
@@ -46,6 +46,42 @@ class TestModelResponseDefaults:
         r1.analysis["score"] = 0.9
         assert "score" not in r2.analysis
 
+    def test_uses_slots(self) -> None:
+        """Instances carry no per-instance __dict__."""
+        r = ModelResponse(model_id="test/model", model_alias="test", round_number=0, content="a")
+        assert not hasattr(r, "__dict__")
+
+
+class TestModelResponseErrorFor:
+    """error_for() builds failed responses with a consistent shape."""
+
+    def test_minimal(self) -> None:
+        r = ModelResponse.error_for(
+            model_id="test/model", model_alias="test", round_number=1, error="boom"
+        )
+        assert r.content == ""
+        assert r.error == "boom"
+        assert r.round_number == 1
+        assert r.latency_ms is None
+        assert r.timings is None
+        assert r.routing is None
+        assert r.token_count is None
+
+    def test_optional_fields(self) -> None:
+        timings = Timings(total_ms=40)
+        r = ModelResponse.error_for(
+            model_id="test/model",
+            model_alias="test",
+            round_number=0,
+            error="HTTP 500: boom",
+            latency_ms=40,
+            timings=timings,
+            routing={"vendor": "anthropic"},
+        )
+        assert r.latency_ms == 40
+        assert r.timings is timings
+        assert r.routing == {"vendor": "anthropic"}
+
 
 class TestModelResponseToDict:
     """to_dict() includes all fields including new ones."""
@@ -96,3 +132,46 @@ class TestModelResponseToDict:
         assert d["role"] == ""
         assert d["routing"] is None
         assert d["analysis"] == {}
+        assert d["cache_creation_input_tokens"] is None
+        assert d["cache_read_input_tokens"] is None
+
+
+class TestModelResponseFromDict:
+    """from_dict() reverses to_dict() and tolerates missing fields."""
+
+    def test_roundtrip(self) -> None:
+        r = ModelResponse(
+            model_id="test/model",
+            model_alias="test",
+            round_number=1,
+            content="hello",
+            input_tokens=10,
+            output_tokens=5,
+            cache_read_input_tokens=8,
+            routing={"vendor": "anthropic", "mode": "auto", "via_openrouter": False},
+        )
+        restored = ModelResponse.from_dict(r.to_dict())
+        assert restored == r
+
+    def test_roundtrip_with_timings(self) -> None:
+        r = ModelResponse(
+            model_id="test/model",
+            model_alias="test",
+            round_number=0,
+            content="hello",
+            latency_ms=120,
+            timings=Timings(queue_ms=5, ttfb_ms=80, body_ms=40, total_ms=125),
+        )
+        data = r.to_dict()
+        assert data["timings"] == {"queue_ms": 5, "ttfb_ms": 80, "body_ms": 40, "total_ms": 125}
+        assert ModelResponse.from_dict(data) == r
+
+    def test_minimal_dict(self) -> None:
+        r = ModelResponse.from_dict(
+            {"model_id": "test/model", "model_alias": "test", "round_number": 0, "content": "x"}
+        )
+        assert r.input_tokens is None
+        assert r.cache_read_input_tokens is None
+        assert r.timings is None
+        assert r.role == ""
+        assert r.analysis == {}
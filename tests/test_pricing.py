@@ -9,9 +9,11 @@ compatibility with old transcripts.
 from __future__ import annotations
 
 import sys
+from collections.abc import AsyncIterator
 from unittest.mock import AsyncMock, MagicMock
 
 import httpx
+import orjson
 import pytest
 
 from mutual_dissent.display import _format_cost_summary, format_markdown, render_debate
@@ -668,17 +670,29 @@ class TestAnthropicTokenSplit:
         """complete() sets input_tokens and output_tokens from usage."""
         from mutual_dissent.providers.anthropic import AnthropicProvider
 
+        events = [
+            {"type": "message_start", "message": {"usage": {"input_tokens": 80}}},
+            {
+                "type": "content_block_start",
+                "index": 0,
+                "content_block": {"type": "text", "text": "Reply"},
+            },
+            {"type": "message_delta", "delta": {}, "usage": {"output_tokens": 40}},
+            {"type": "message_stop"},
+        ]
+
+        async def aiter_lines() -> AsyncIterator[str]:
+            for event in events:
+                yield f"data: {orjson.dumps(event).decode()}"
+
         resp = MagicMock(spec=httpx.Response)
         resp.status_code = 200
-        resp.json.return_value = {
-            "content": [{"type": "text", "text": "Reply"}],
-            "usage": {"input_tokens": 80, "output_tokens": 40},
-        }
+        resp.aiter_lines = MagicMock(side_effect=aiter_lines)
 
         provider = AnthropicProvider(api_key="sk-ant-test")
         async with provider:
             assert provider._client is not None
-            provider._client.post = AsyncMock(return_value=resp)
+            provider._client.send = AsyncMock(return_value=resp)
             result = await provider.complete("claude-model", prompt="Hello")
 
         assert result.token_count == 120  # 80 + 40
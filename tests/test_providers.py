@@ -3,11 +3,12 @@
 Covers: ABC validation logic (_resolve_messages), OpenRouterProvider
 construction, mocked complete() with prompt and messages, error handling
 (timeout, HTTP error), complete_parallel ordering, backward compat shim,
-and async context manager lifecycle.
+lazy package exports, and async context manager lifecycle.
 """
 
 from __future__ import annotations
 
+import subprocess
 import sys
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
@@ -419,6 +420,11 @@ class TestCompleteParallel:
         assert "model-b" in results[1].content
         assert "model-c" in results[2].content
 
+    @pytest.mark.asyncio
+    async def test_empty_requests(self) -> None:
+        async with OpenRouterProvider(api_key="sk-or-test") as provider:
+            assert await provider.complete_parallel([]) == []
+
 
 # ---------------------------------------------------------------------------
 # Backward compatibility shim
@@ -444,3 +450,36 @@ class TestBackwardCompatShim:
 
         client = OpenRouterClient(api_key="sk-or-compat")
         assert isinstance(client, OpenRouterProvider)
+
+
+# ---------------------------------------------------------------------------
+# Lazy package exports
+# ---------------------------------------------------------------------------
+
+
+class TestLazyExports:
+    """The providers package resolves its exports on first access."""
+
+    def test_all_exports_resolve(self) -> None:
+        import mutual_dissent.providers as providers
+
+        for name in providers.__all__:
+            assert getattr(providers, name) is not None
+
+    def test_export_is_same_object(self) -> None:
+        from mutual_dissent.providers import OpenRouterProvider as Exported
+
+        assert Exported is OpenRouterProvider
+
+    def test_unknown_attribute_raises(self) -> None:
+        import mutual_dissent.providers as providers
+
+        with pytest.raises(AttributeError, match="no_such_thing"):
+            providers.no_such_thing  # noqa: B018
+
+    def test_base_import_skips_httpx(self) -> None:
+        code = "import sys, mutual_dissent.providers.base; print('httpx' in sys.modules)"
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
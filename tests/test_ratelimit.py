@@ -0,0 +1,67 @@
+"""Tests for the async rate limiter.
+
+Covers: construction validation, burst admission up to max_rate, waiting
+once the bucket is full, and draining over time.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from mutual_dissent.providers import ratelimit
+from mutual_dissent.providers.ratelimit import AsyncRateLimiter
+
+
+class _FakeClock:
+    """Monotonic clock that advances only when sleep() is awaited."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture()
+def clock(monkeypatch: pytest.MonkeyPatch) -> _FakeClock:
+    fake = _FakeClock()
+    monkeypatch.setattr(ratelimit.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(ratelimit.asyncio, "sleep", fake.sleep)
+    return fake
+
+
+class TestAsyncRateLimiter:
+    """AsyncRateLimiter admits max_rate requests per period."""
+
+    def test_non_positive_rate_raises(self) -> None:
+        with pytest.raises(ValueError, match="positive"):
+            AsyncRateLimiter(0)
+
+    @pytest.mark.asyncio
+    async def test_burst_admitted_without_waiting(self, clock: _FakeClock) -> None:
+        limiter = AsyncRateLimiter(3, time_period=60.0)
+        for _ in range(3):
+            async with limiter:
+                pass
+        assert clock.sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_waits_when_full(self, clock: _FakeClock) -> None:
+        limiter = AsyncRateLimiter(2, time_period=60.0)
+        for _ in range(3):
+            await limiter.acquire()
+        # One slot drains every 30s at 2 requests/minute.
+        assert clock.sleeps == [pytest.approx(30.0)]
+
+    @pytest.mark.asyncio
+    async def test_drains_over_time(self, clock: _FakeClock) -> None:
+        limiter = AsyncRateLimiter(1, time_period=10.0)
+        await limiter.acquire()
+        clock.now += 10.0
+        await limiter.acquire()
+        assert clock.sleeps == []
@@ -546,7 +546,7 @@ class TestReplayCommand:
                 metadata={"source_transcript_id": source.transcript_id},
             )
 
-        monkeypatch.setattr("mutual_dissent.cli.run_replay", fake_replay)
+        monkeypatch.setattr("mutual_dissent.orchestrator.run_replay", fake_replay)
 
         runner = CliRunner()
         result = runner.invoke(main, ["replay", "replayjs", "--output", "json", "--no-save"])
@@ -3,11 +3,13 @@
 Covers: vendor resolution (alias, full model ID, unknown), routing decisions
 for all mode x key x provider combinations, provider lifecycle management,
 dispatch correctness, mixed-provider parallel fan-out, no-provider error
-handling, warning logging for direct-mode fallbacks, and package import.
+handling, concurrency and rate-limit throttling, batch-API routing, warning
+logging for direct-mode fallbacks, and package import.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import sys
 from unittest.mock import AsyncMock
@@ -16,7 +18,8 @@ import pytest
 
 from mutual_dissent.config import Config
 from mutual_dissent.models import ModelResponse
-from mutual_dissent.providers.router import ProviderRouter, _resolve_vendor
+from mutual_dissent.providers.anthropic import AnthropicProvider
+from mutual_dissent.providers.router import ProviderRouter
 from mutual_dissent.types import RoutingDecision, Vendor
 
 ROUTER_LOGGER = "mutual_dissent.providers.router"
@@ -65,54 +68,47 @@ def _mock_response(
 
 
 class TestResolveVendor:
-    """_resolve_vendor() determines the vendor for a given alias or ID."""
+    """route() determines the vendor for a given alias or ID."""
+
+    @staticmethod
+    def _vendor(alias_or_id: str) -> Vendor:
+        return ProviderRouter(Config()).route(alias_or_id).vendor
 
     def test_alias_claude(self) -> None:
-        config = Config()
-        assert _resolve_vendor("claude", config) == Vendor.ANTHROPIC
+        assert self._vendor("claude") == Vendor.ANTHROPIC
 
     def test_alias_gpt(self) -> None:
-        config = Config()
-        assert _resolve_vendor("gpt", config) == Vendor.OPENAI
+        assert self._vendor("gpt") == Vendor.OPENAI
 
     def test_alias_gemini(self) -> None:
-        config = Config()
-        assert _resolve_vendor("gemini", config) == Vendor.GOOGLE
+        assert self._vendor("gemini") == Vendor.GOOGLE
 
     def test_alias_grok(self) -> None:
-        config = Config()
-        assert _resolve_vendor("grok", config) == Vendor.XAI
+        assert self._vendor("grok") == Vendor.XAI
 
     def test_full_model_id_anthropic(self) -> None:
-        config = Config()
-        assert _resolve_vendor("anthropic/claude-sonnet-4-6", config) == Vendor.ANTHROPIC
+        assert self._vendor("anthropic/claude-sonnet-4-6") == Vendor.ANTHROPIC
 
     def test_full_model_id_openai(self) -> None:
-        config = Config()
-        assert _resolve_vendor("openai/gpt-5.2", config) == Vendor.OPENAI
+        assert self._vendor("openai/gpt-5.2") == Vendor.OPENAI
 
     def test_full_model_id_google(self) -> None:
-        config = Config()
-        assert _resolve_vendor("google/gemini-2.5-pro", config) == Vendor.GOOGLE
+        assert self._vendor("google/gemini-2.5-pro") == Vendor.GOOGLE
 
     def test_full_model_id_xai(self) -> None:
-        config = Config()
-        assert _resolve_vendor("x-ai/grok-4", config) == Vendor.XAI
+        assert self._vendor("x-ai/grok-4") == Vendor.XAI
 
     def test_unknown_prefix_with_slash(self) -> None:
-        config = Config()
-        assert _resolve_vendor("unknown-vendor/some-model", config) == Vendor.OPENROUTER
+        assert self._vendor("unknown-vendor/some-model") == Vendor.OPENROUTER
 
     def test_unknown_string_no_slash(self) -> None:
-        config = Config()
-        assert _resolve_vendor("totally-unknown", config) == Vendor.OPENROUTER
+        assert self._vendor("totally-unknown") == Vendor.OPENROUTER
 
     def test_alias_takes_priority_over_slash_parse(self) -> None:
         """An alias that happens to contain a slash still resolves via v2."""
-        config = Config()
         # "claude" is a known alias → resolves via v2 to Vendor.ANTHROPIC,
         # not by parsing the string itself.
-        assert _resolve_vendor("claude", config) == Vendor.ANTHROPIC
+        assert self._vendor("claude") == Vendor.ANTHROPIC
 
 
 # ---------------------------------------------------------------------------
@@ -226,6 +222,25 @@ class TestRoutingDecisions:
         assert hasattr(decision, "mode")
         assert hasattr(decision, "via_openrouter")
 
+    def test_decision_memoized(self) -> None:
+        router = ProviderRouter(_make_config(routing={"default_mode": "auto"}))
+        assert router.route("claude") is router.route("claude")
+
+    def test_fallback_warning_logged_once(
+        self,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        router = ProviderRouter(_make_config(routing={"default_mode": "direct"}))
+        with caplog.at_level(logging.WARNING, logger=ROUTER_LOGGER):
+            router.route("claude")
+            router.route("claude")
+        assert caplog.text.count("no API key") == 1
+
+    def test_full_model_id_routes_by_prefix(self) -> None:
+        router = ProviderRouter(_make_config(routing={"default_mode": "auto"}))
+        assert router.route("openai/gpt-5.2").vendor == Vendor.OPENAI
+        assert router.route("mystery-model").vendor == Vendor.OPENROUTER
+
 
 # ---------------------------------------------------------------------------
 # Provider lifecycle
@@ -294,6 +309,79 @@ class TestProviderLifecycle:
             assert router._openrouter is None
             assert len(router._providers) == 0
 
+    @pytest.mark.asyncio
+    async def test_providers_share_transport(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        for var in (
+            "HTTP_PROXY",
+            "HTTPS_PROXY",
+            "ALL_PROXY",
+            "http_proxy",
+            "https_proxy",
+            "all_proxy",
+        ):
+            monkeypatch.delenv(var, raising=False)
+        config = _make_config(
+            openrouter_key="sk-or-test",
+            anthropic_key="sk-ant-test",
+        )
+        async with ProviderRouter(config) as router:
+            assert router._openrouter is not None
+            shared = router._openrouter._transport
+            assert shared is not None
+            assert router._providers["anthropic"]._transport is shared  # type: ignore[attr-defined]
+
+    @pytest.mark.asyncio
+    async def test_env_proxy_keeps_per_client_transport(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """With a proxy in the environment, httpx must build its own transports."""
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+        config = _make_config(
+            openrouter_key="sk-or-test",
+            anthropic_key="sk-ant-test",
+        )
+        async with ProviderRouter(config) as router:
+            assert router._transport is None
+            assert router._openrouter is not None
+            assert router._openrouter._transport is None
+            assert router._openrouter._client is not None
+            assert router._openrouter._client._mounts  # env proxy mounted by httpx
+
+    @pytest.mark.asyncio
+    async def test_failed_open_closes_other_providers(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        async def fail(self: AnthropicProvider) -> AnthropicProvider:
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(AnthropicProvider, "__aenter__", fail)
+        config = _make_config(
+            openrouter_key="sk-or-test",
+            anthropic_key="sk-ant-test",
+        )
+        router = ProviderRouter(config)
+        with pytest.raises(RuntimeError, match="boom"):
+            await router.__aenter__()
+        assert router._openrouter is None
+        assert router._providers == {}
+        assert router._transport is None
+
+    @pytest.mark.asyncio
+    async def test_exit_closes_shared_transport_once(self) -> None:
+        config = _make_config(
+            openrouter_key="sk-or-test",
+            anthropic_key="sk-ant-test",
+        )
+        router = ProviderRouter(config)
+        await router.__aenter__()
+        assert router._transport is not None
+        transport = router._transport
+        close = AsyncMock(wraps=transport.aclose)
+        transport.aclose = close  # type: ignore[method-assign]
+        await router.__aexit__(None, None, None)
+        close.assert_awaited_once()
+        assert router._transport is None
+
 
 # ---------------------------------------------------------------------------
 # Dispatch correctness
@@ -506,6 +594,224 @@ class TestMixedParallel:
             assert results[1].model_alias == "gpt"
             assert call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_empty_requests(self) -> None:
+        async with ProviderRouter(_make_config(openrouter_key="sk-or-test")) as router:
+            assert await router.complete_parallel([]) == []
+
+    @pytest.mark.asyncio
+    async def test_unfilled_slot_raises(self) -> None:
+        """A request that records no response fails loudly, not misaligned."""
+        async with ProviderRouter(_make_config(openrouter_key="sk-or-test")) as router:
+
+            async def fill_first_only(
+                index: int, request: dict[str, object], results: list[ModelResponse | None]
+            ) -> None:
+                if index == 0:
+                    results[index] = _mock_response("openai/gpt-5.2", "gpt")
+
+            router._complete_into = fill_first_only  # type: ignore[method-assign]
+
+            with pytest.raises(RuntimeError, match=r"index \[1\]"):
+                await router.complete_parallel(
+                    [
+                        {"alias_or_id": "gpt", "prompt": "First"},
+                        {"alias_or_id": "gpt", "prompt": "Second"},
+                    ]
+                )
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_siblings(self) -> None:
+        config = _make_config(openrouter_key="sk-or-test")
+        async with ProviderRouter(config) as router:
+            cancelled = asyncio.Event()
+
+            async def mock_complete(model_id: str, **kwargs: object) -> ModelResponse:
+                if "claude" in model_id:
+                    raise RuntimeError("boom")
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+                return _mock_response(model_id, "gpt")
+
+            router._openrouter.complete = mock_complete  # type: ignore[union-attr, assignment]
+
+            with pytest.raises(RuntimeError, match="boom"):
+                await router.complete_parallel(
+                    [
+                        {"alias_or_id": "gpt", "prompt": "Slow"},
+                        {"alias_or_id": "claude", "prompt": "Fails"},
+                    ]
+                )
+
+            assert cancelled.is_set()
+
+
+# ---------------------------------------------------------------------------
+# Concurrency and rate limits
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="Slow asyncio overhead on Windows — validated on Ubuntu CI",
+)
+class TestThrottling:
+    """complete() holds a concurrency slot and the provider's rate limit."""
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_bounds_in_flight(self) -> None:
+        config = _make_config(openrouter_key="sk-or-test")
+        config.max_concurrency = 2
+        in_flight = 0
+        peak = 0
+
+        async def mock_complete(model_id: str, **kwargs: object) -> ModelResponse:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _mock_response(model_id)
+
+        async with ProviderRouter(config) as router:
+            router._openrouter.complete = mock_complete  # type: ignore[union-attr, assignment]
+            results = await router.complete_parallel(
+                [{"alias_or_id": "claude", "prompt": f"Q{i}"} for i in range(6)]
+            )
+
+        assert len(results) == 6
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_queue_time_recorded(self) -> None:
+        config = _make_config(openrouter_key="sk-or-test")
+        config.max_concurrency = 1
+
+        async def mock_complete(model_id: str, **kwargs: object) -> ModelResponse:
+            await asyncio.sleep(0.05)
+            response = _mock_response(model_id)
+            response.latency_ms = 50
+            return response
+
+        async with ProviderRouter(config) as router:
+            router._openrouter.complete = mock_complete  # type: ignore[union-attr, assignment]
+            first, second = await router.complete_parallel(
+                [{"alias_or_id": "claude", "prompt": f"Q{i}"} for i in range(2)]
+            )
+
+        assert first.timings is not None
+        assert second.timings is not None
+        assert first.timings.queue_ms < second.timings.queue_ms
+        assert second.timings.queue_ms >= 40
+        assert second.timings.total_ms == second.timings.queue_ms + 50
+
+    def test_limiters_built_from_config(self) -> None:
+        config = _make_config()
+        config.rate_limits = {"anthropic": 50, "openrouter": 0}
+        router = ProviderRouter(config)
+        assert set(router._limiters) == {"anthropic"}
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_acquired_for_provider(self) -> None:
+        config = _make_config(openrouter_key="sk-or-test")
+        config.rate_limits = {"openrouter": 100}
+        async with ProviderRouter(config) as router:
+            router._openrouter.complete = AsyncMock(return_value=_mock_response())  # type: ignore[union-attr]
+            limiter = router._limiters["openrouter"]
+            limiter.acquire = AsyncMock()  # type: ignore[method-assign]
+
+            await router.complete("claude", prompt="Hello")
+
+            limiter.acquire.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_direct_provider_gets_limiter_for_retries(self) -> None:
+        config = _make_config(anthropic_key="sk-ant-test")
+        config.rate_limits = {"anthropic": 50}
+        async with ProviderRouter(config) as router:
+            provider = router._providers["anthropic"]
+            assert isinstance(provider, AnthropicProvider)
+            assert provider._rate_limiter is router._limiters["anthropic"]
+
+
+# ---------------------------------------------------------------------------
+# Batch routing
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="Slow asyncio overhead on Windows — validated on Ubuntu CI",
+)
+class TestBatchRouting:
+    """complete_parallel() sends large direct groups through the batch API."""
+
+    @pytest.mark.asyncio
+    async def test_large_direct_group_batched(self) -> None:
+        config = _make_config(openrouter_key="sk-or-test", anthropic_key="sk-ant-test")
+        config.batch_threshold = 2
+        async with ProviderRouter(config) as router:
+            anthropic = router._providers["anthropic"]
+            anthropic.complete_batch = AsyncMock(  # type: ignore[attr-defined]
+                return_value=[
+                    _mock_response("claude-sonnet-4-6", "claude"),
+                    _mock_response("claude-sonnet-4-6", "claude"),
+                ],
+            )
+            anthropic.complete = AsyncMock()  # type: ignore[method-assign]
+            router._openrouter.complete = AsyncMock(  # type: ignore[union-attr]
+                return_value=_mock_response("openai/gpt-5.2", "gpt"),
+            )
+
+            results = await router.complete_parallel(
+                [
+                    {"alias_or_id": "claude", "prompt": "A"},
+                    {"alias_or_id": "gpt", "prompt": "B"},
+                    {"alias_or_id": "claude", "prompt": "C", "round_number": 1},
+                ]
+            )
+
+            anthropic.complete.assert_not_called()
+            batch_requests = anthropic.complete_batch.call_args.args[0]  # type: ignore[attr-defined]
+        assert [r["prompt"] for r in batch_requests] == ["A", "C"]
+        assert batch_requests[0]["model_id"] == "claude-sonnet-4-6"
+        assert batch_requests[1]["round_number"] == 1
+        assert [r.model_alias for r in results] == ["claude", "gpt", "claude"]
+        assert results[0].routing == {
+            "vendor": "anthropic",
+            "mode": "auto",
+            "via_openrouter": False,
+        }
+
+    @pytest.mark.asyncio
+    async def test_small_group_not_batched(self) -> None:
+        config = _make_config(anthropic_key="sk-ant-test")
+        config.batch_threshold = 3
+        async with ProviderRouter(config) as router:
+            anthropic = router._providers["anthropic"]
+            anthropic.complete_batch = AsyncMock()  # type: ignore[attr-defined]
+            anthropic.complete = AsyncMock(  # type: ignore[method-assign]
+                return_value=_mock_response("claude-sonnet-4-6", "claude"),
+            )
+
+            await router.complete_parallel(
+                [
+                    {"alias_or_id": "claude", "prompt": "A"},
+                    {"alias_or_id": "claude", "prompt": "B"},
+                ]
+            )
+
+            anthropic.complete_batch.assert_not_called()
+            assert anthropic.complete.call_count == 2
+
+    def test_batching_disabled_by_default(self) -> None:
+        config = _make_config(anthropic_key="sk-ant-test")
+        router = ProviderRouter(config)
+        assert router._plan_batches([{"alias_or_id": "claude", "prompt": "A"}] * 20) == {}
+
 
 # ---------------------------------------------------------------------------
 # Warning logging
@@ -177,3 +177,51 @@ class TestApplyFormToConfig:
         assert result.default_synthesizer == "gpt"
         assert result.default_rounds == 2
         assert result.providers["openrouter"] == "sk-or-test"
+
+    def test_save_preserves_unedited_settings(self, tmp_path) -> None:
+        """Saving the form keeps cache, limits, and batch settings from the file."""
+        from mutual_dissent.config import load_config, write_config
+        from mutual_dissent.web.pages.config import (
+            _apply_form_to_config,
+            _build_form_state,
+        )
+
+        config_path = tmp_path / "config.toml"
+        config_path.write_text(
+            """\
+[providers]
+openrouter_api_key = "sk-or-test"
+
+[cache]
+backend = "file"
+max_entries = 32
+
+[limits]
+max_concurrency = 4
+
+[limits.requests_per_minute]
+anthropic = 50
+
+[batch]
+threshold = 8
+max_wait = 120.0
+""",
+            encoding="utf-8",
+        )
+        with (
+            patch.dict(os.environ, {}, clear=True),
+            patch("mutual_dissent.config.CONFIG_PATH", config_path),
+        ):
+            loaded = load_config()
+            state = _build_form_state(loaded)
+            state["rounds"] = 3
+            write_config(_apply_form_to_config(state, loaded), config_path)
+            reloaded = load_config()
+
+        assert reloaded.default_rounds == 3
+        assert reloaded.cache_backend == "file"
+        assert reloaded.cache_max_entries == 32
+        assert reloaded.max_concurrency == 4
+        assert reloaded.rate_limits == {"anthropic": 50}
+        assert reloaded.batch_threshold == 8
+        assert reloaded.batch_max_wait == 120.0